@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-from datetime import datetime
-from typing import Any
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, AsyncIterator
 
 from pydantic import BaseModel, Field
 
-from thought_wrapper.tms import HashEmbedder, ReflectionEngine, ThoughtFilters, ThoughtGraph, ThoughtStore
+from thought_wrapper.tms import (
+    HashEmbedder,
+    ParseStoreResult,
+    ReflectionEngine,
+    ThoughtFilters,
+    ThoughtGraph,
+    ThoughtStore,
+)
 from thought_wrapper.tms.pipeline import parse_and_store
 
 try:
-    from fastapi import FastAPI, HTTPException
+    from fastapi import Depends, FastAPI, HTTPException, Request
 except Exception as exc:  # pragma: no cover - optional runtime dependency
     raise RuntimeError(
         "FastAPI is not installed. Install `fastapi` and `uvicorn` to run memory_service.py"
@@ -21,13 +33,52 @@ except Exception as exc:  # pragma: no cover - optional runtime dependency
 
 DB_PATH = os.getenv("THOUGHT_DB_PATH", "results/tms_service.sqlite")
 EMBED_DIM = int(os.getenv("THOUGHT_EMBED_DIM", "384"))
+VECTOR_BACKEND = os.getenv("THOUGHT_VECTOR_BACKEND", "auto")
+READ_POOL_SIZE = int(os.getenv("THOUGHT_READ_POOL_SIZE", str(os.cpu_count() or 1)))
+
+
+@dataclass
+class ServiceRuntime:
+    store: ThoughtStore
+    graph: ThoughtGraph
+    embedder: HashEmbedder
+    reflection_engine: ReflectionEngine
+
+
+def _build_runtime() -> ServiceRuntime:
+    store = ThoughtStore(
+        db_path=DB_PATH,
+        embedding_dim=EMBED_DIM,
+        vector_backend=VECTOR_BACKEND,
+        read_pool_size=READ_POOL_SIZE,
+    )
+    graph = ThoughtGraph(store)
+    embedder = HashEmbedder(dimension=EMBED_DIM)
+    reflection_engine = ReflectionEngine(store, graph=graph, embedder=embedder, embedding_dim=EMBED_DIM)
+    return ServiceRuntime(store=store, graph=graph, embedder=embedder, reflection_engine=reflection_engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Built per worker at startup rather than at import, so importing/forking stays cheap.
+    runtime = await asyncio.to_thread(_build_runtime)
+    app.state.runtime = runtime
+    try:
+        yield
+    finally:
+        runtime.store.close()
+
+
+def get_runtime(request: Request) -> ServiceRuntime:
+    return request.app.state.runtime
+
+
+@lru_cache(maxsize=1)
+def _utc_iso_for_second(epoch_second: int) -> str:
+    return datetime.fromtimestamp(epoch_second, timezone.utc).isoformat().replace("+00:00", "Z")
 
-store = ThoughtStore(db_path=DB_PATH, embedding_dim=EMBED_DIM, vector_backend="auto")
-graph = ThoughtGraph(store)
-embedder = HashEmbedder(dimension=EMBED_DIM)
-reflection_engine = ReflectionEngine(store, graph=graph, embedder=embedder, embedding_dim=EMBED_DIM)
 
-app = FastAPI(title="Thought Memory Service", version="1.0.0")
+app = FastAPI(title="Thought Memory Service", version="1.0.0", lifespan=lifespan)
 
 
 class StoreRequest(BaseModel):
@@ -53,26 +104,36 @@ class ReflectRequest(BaseModel):
     top_k: int = Field(default=8, ge=1, le=50)
 
 
+def _parse_store_and_link(runtime: ServiceRuntime, req: StoreRequest) -> ParseStoreResult:
+    parsed = parse_and_store(
+        req.raw_output,
+        runtime.store,
+        session_id=req.session_id,
+        category=req.category,
+        confidence=req.confidence,
+        tags=req.tags,
+        embedder=runtime.embedder,
+        embedding_dim=EMBED_DIM,
+    )
+    runtime.graph.add_thoughts(parsed.thoughts, store_if_missing=False, semantic_neighbors=0, temporal_link=True)
+    return parsed
+
+
 @app.get("/health")
-def health() -> dict[str, Any]:
-    return {"status": "ok", "timestamp_utc": datetime.utcnow().isoformat() + "Z"}
+async def health() -> dict[str, Any]:
+    cache = HashEmbedder.cache_info()
+    return {
+        "status": "ok",
+        "timestamp_utc": _utc_iso_for_second(int(time.time())),
+        "embed_cache": {"hits": cache.hits, "misses": cache.misses, "size": cache.currsize},
+    }
 
 
 @app.post("/store")
-def store_endpoint(req: StoreRequest) -> dict[str, Any]:
+async def store_endpoint(req: StoreRequest, runtime: ServiceRuntime = Depends(get_runtime)) -> dict[str, Any]:
     try:
-        parsed = parse_and_store(
-            req.raw_output,
-            store,
-            session_id=req.session_id,
-            category=req.category,
-            confidence=req.confidence,
-            tags=req.tags,
-            embedder=embedder,
-            embedding_dim=EMBED_DIM,
-        )
-        for thought in parsed.thoughts:
-            graph.add_thought(thought, store_if_missing=False, semantic_neighbors=0, temporal_link=True)
+        # Parse, persist and graph-link in one worker-thread hop.
+        parsed = await asyncio.to_thread(_parse_store_and_link, runtime, req)
         return {
             "cleaned_output": parsed.cleaned_output,
             "stored_count": len(parsed.thoughts),
@@ -83,15 +144,15 @@ def store_endpoint(req: StoreRequest) -> dict[str, Any]:
 
 
 @app.post("/retrieve")
-def retrieve_endpoint(req: RetrieveRequest) -> dict[str, Any]:
+async def retrieve_endpoint(req: RetrieveRequest, runtime: ServiceRuntime = Depends(get_runtime)) -> dict[str, Any]:
     try:
-        query_vec = embedder.embed(req.query)
+        query_vec = runtime.embedder.embed_array(req.query)
         filters = ThoughtFilters(
             session_id=req.session_id,
             category=req.category,
             min_confidence=req.min_confidence,
         )
-        hits = store.semantic_search(query_vec, filters=filters, limit=req.limit, alpha=0.95)
+        hits = await runtime.store.asemantic_search(query_vec, filters=filters, limit=req.limit, alpha=0.95)
         return {
             "count": len(hits),
             "items": [
@@ -111,9 +172,9 @@ def retrieve_endpoint(req: RetrieveRequest) -> dict[str, Any]:
 
 
 @app.post("/reflect")
-def reflect_endpoint(req: ReflectRequest) -> dict[str, Any]:
+async def reflect_endpoint(req: ReflectRequest, runtime: ServiceRuntime = Depends(get_runtime)) -> dict[str, Any]:
     try:
-        result = reflection_engine.reflect(
+        result = await runtime.reflection_engine.areflect(
             query=req.query,
             current_session_id=req.current_session_id,
             mode=req.mode,
@@ -129,9 +190,15 @@ def reflect_endpoint(req: ReflectRequest) -> dict[str, Any]:
 
 
 @app.get("/graph/paths")
-def graph_paths(source_id: str, target_id: str, max_depth: int = 4, limit: int = 10) -> dict[str, Any]:
+async def graph_paths(
+    source_id: str,
+    target_id: str,
+    max_depth: int = 4,
+    limit: int = 10,
+    runtime: ServiceRuntime = Depends(get_runtime),
+) -> dict[str, Any]:
     try:
-        paths = graph.find_paths(source_id, target_id, max_depth=max_depth, limit=limit)
+        paths = await runtime.graph.afind_paths(source_id, target_id, max_depth=max_depth, limit=limit)
         return {"count": len(paths), "paths": paths}
     except Exception as exc:
         raise HTTPException(status_code=400, detail=str(exc))
@@ -5,12 +5,18 @@ from __future__ import annotations
 import argparse
 import json
 import platform
-import statistics
 import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
@@ -20,8 +26,8 @@ from thought_wrapper.sdk import ThoughtLLM, ThoughtLLMConfig
 from thought_wrapper.tms import HashEmbedder, ReflectionEngine, Thought, ThoughtGraph, ThoughtStore
 
 
-def _stats(values: list[float]) -> dict[str, float]:
-    if not values:
+def _stats(values: np.ndarray | list[float]) -> dict[str, float]:
+    if len(values) == 0:
         return {
             "count": 0,
             "avg_ms": 0.0,
@@ -31,16 +37,22 @@ def _stats(values: list[float]) -> dict[str, float]:
             "max_ms": 0.0,
             "std_ms": 0.0,
         }
-    ordered = sorted(values)
-    n = len(ordered)
+    arr = np.asarray(values, dtype=np.float64)
+    n = arr.size
+    p50_idx = int(0.5 * (n - 1))
+    p95_idx = int(0.95 * (n - 1))
+    # One selection yields min, p50, p95 and max; no full sort needed.
+    selected = np.partition(arr, (0, p50_idx, p95_idx, n - 1))
+    mean = arr.mean()
+    dev = arr - mean
     return {
         "count": n,
-        "avg_ms": sum(ordered) / n,
-        "median_ms": ordered[int(0.5 * (n - 1))],
-        "p95_ms": ordered[int(0.95 * (n - 1))],
-        "min_ms": ordered[0],
-        "max_ms": ordered[-1],
-        "std_ms": statistics.pstdev(ordered) if n > 1 else 0.0,
+        "avg_ms": float(mean),
+        "median_ms": float(selected[p50_idx]),
+        "p95_ms": float(selected[p95_idx]),
+        "min_ms": float(selected[0]),
+        "max_ms": float(selected[-1]),
+        "std_ms": float(np.sqrt(dev @ dev / n)) if n > 1 else 0.0,
     }
 
 
@@ -104,9 +116,9 @@ def run_benchmark(runs: int, reflection_frequency: int, seed_count: int) -> dict
         # Seed parent session with anchor memories used by recall probes.
         store.create_session("phase4_parent")
         store.create_session("phase4_child", parent_session_id="phase4_parent")
-        for i in range(seed_count):
-            text = f"root-anchor-{i}: critical prior memory {i}"
-            graph.add_thought(
+        seed_texts = [f"root-anchor-{i}: critical prior memory {i}" for i in range(seed_count)]
+        graph.add_thoughts(
+            [
                 Thought(
                     session_id="phase4_parent",
                     category="fact",
@@ -114,14 +126,16 @@ def run_benchmark(runs: int, reflection_frequency: int, seed_count: int) -> dict
                     tags=["seed", "phase4"],
                     raw_text=text,
                     cleaned_text=text,
-                    embedding_vector=embedder.embed(text),
+                    embedding_vector=vector,
                     embedding_dim=embed_dim,
-                ),
-                semantic_neighbors=0,
-                temporal_link=False,
-            )
+                )
+                for text, vector in zip(seed_texts, embedder.embed_batch(seed_texts))
+            ],
+            semantic_neighbors=0,
+            temporal_link=False,
+        )
 
-        turn_total_latency: list[float] = []
+        turn_total_ns = np.empty(runs, dtype=np.int64)
         completion_latency: list[float] = []
         reflection_latency: list[float] = []
 
@@ -139,16 +153,13 @@ def run_benchmark(runs: int, reflection_frequency: int, seed_count: int) -> dict
             else:
                 prompt = f"Operational update request turn {i}"
 
-            start = time.perf_counter()
+            start = time.perf_counter_ns()
             turn = loop.run_turn(
                 prompt,
                 session_id="phase4_child",
                 parent_session_id="phase4_parent",
             )
-            end = time.perf_counter()
-
-            total_ms = (end - start) * 1000.0
-            turn_total_latency.append(total_ms)
+            turn_total_ns[i] = time.perf_counter_ns() - start
             completion_latency.append(turn.completion.latency_ms)
 
             if turn.completion.stored_thoughts:
@@ -175,7 +186,7 @@ def run_benchmark(runs: int, reflection_frequency: int, seed_count: int) -> dict
                 "reflection_frequency": reflection_frequency,
             },
             "agentic_loop": {
-                "turn_total_latency": _stats(turn_total_latency),
+                "turn_total_latency": _stats(turn_total_ns.astype(np.float64) * 1e-6),
                 "completion_latency": _stats(completion_latency),
                 "reflection_latency": _stats(reflection_latency),
                 "thought_store_success_rate_pct": (stored_success / runs) * 100.0 if runs else 0.0,
@@ -192,6 +203,13 @@ def run_benchmark(runs: int, reflection_frequency: int, seed_count: int) -> dict
         store.close()
 
 
+def _dump_json(path: Path, data: object) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Phase 4 agentic loop benchmark")
     parser.add_argument("--runs", type=int, default=180)
@@ -206,7 +224,7 @@ def main() -> int:
         seed_count=max(1, args.seed_count),
     )
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    _dump_json(args.output, result)
 
     section = result["agentic_loop"]
     print("Agentic loop benchmark complete.")
@@ -6,15 +6,20 @@ import argparse
 import json
 import math
 import platform
-import random
-import statistics
 import string
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from time import perf_counter
+from time import perf_counter_ns
 from typing import Callable, Dict, List
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
@@ -28,44 +33,50 @@ from thought_wrapper import (
 from thought_wrapper.samples import RAW_SPEC_OUTPUT
 
 
-def _stats(values: List[float]) -> Dict[str, float]:
-    ordered = sorted(values)
-    count = len(ordered)
+def _stats(values: np.ndarray | List[float]) -> Dict[str, float]:
+    arr = np.asarray(values, dtype=np.float64)
+    count = arr.size
     if count == 0:
         return {"count": 0}
     p50_idx = int(0.50 * (count - 1))
     p95_idx = int(0.95 * (count - 1))
+    # One selection yields min, p50, p95 and max; no full sort needed.
+    selected = np.partition(arr, (0, p50_idx, p95_idx, count - 1))
+    mean = arr.mean()
+    dev = arr - mean
     return {
         "count": count,
-        "avg_ms": sum(ordered) / count,
-        "median_ms": ordered[p50_idx],
-        "p95_ms": ordered[p95_idx],
-        "min_ms": ordered[0],
-        "max_ms": ordered[-1],
-        "std_ms": statistics.pstdev(ordered) if count > 1 else 0.0,
+        "avg_ms": float(mean),
+        "median_ms": float(selected[p50_idx]),
+        "p95_ms": float(selected[p95_idx]),
+        "min_ms": float(selected[0]),
+        "max_ms": float(selected[-1]),
+        "std_ms": float(np.sqrt(dev @ dev / count)) if count > 1 else 0.0,
     }
 
 
-def _time_function(fn: Callable[[], object], runs: int, warmup: int = 200) -> List[float]:
+def _time_function(fn: Callable[[], object], runs: int, warmup: int = 200) -> np.ndarray:
     for _ in range(warmup):
         fn()
 
-    samples = []
-    for _ in range(runs):
-        start = perf_counter()
+    # Integer ns timestamps in the loop; convert to ms once afterwards.
+    samples_ns = np.empty(runs, dtype=np.int64)
+    for i in range(runs):
+        start = perf_counter_ns()
         fn()
-        end = perf_counter()
-        samples.append((end - start) * 1000.0)
-    return samples
+        samples_ns[i] = perf_counter_ns() - start
+    return samples_ns.astype(np.float64) * 1e-6
+
 
+_ALPHABET = np.frombuffer((string.ascii_letters + string.digits + " .,;:-_/\n\t").encode("ascii"), dtype=np.uint8)
 
-def _random_text(rng: random.Random, size: int) -> str:
-    alphabet = string.ascii_letters + string.digits + " .,;:-_/\n\t"
-    return "".join(rng.choice(alphabet) for _ in range(size))
+
+def _random_text(rng: np.random.Generator, size: int) -> str:
+    return _ALPHABET[rng.integers(0, _ALPHABET.size, size=size)].tobytes().decode("ascii")
 
 
 def _make_synthetic_output(total_chars: int, tag_count: int, seed: int) -> str:
-    rng = random.Random(seed)
+    rng = np.random.default_rng(seed)
     if tag_count <= 0:
         return _random_text(rng, total_chars)
 
@@ -82,22 +93,39 @@ def _make_synthetic_output(total_chars: int, tag_count: int, seed: int) -> str:
     return "".join(chunks)
 
 
+_ACCURACY_POOL_CHARS = 1 << 20
+
+
 def _accuracy_study(cases: int, max_tags: int = 30) -> Dict[str, float]:
-    rng = random.Random(20260228)
+    rng = np.random.default_rng(20260228)
     exact_case_matches = 0
     total_tags_expected = 0
     total_tags_matched = 0
 
+    # Slice every fragment out of one pre-generated pool instead of building each from scratch.
+    pool = _random_text(rng, _ACCURACY_POOL_CHARS)
+    cursor = 0
+
+    def _take(size: int) -> str:
+        nonlocal cursor
+        if cursor + size > len(pool):
+            cursor = 0
+        fragment = pool[cursor : cursor + size]
+        cursor += size
+        return fragment
+
     for _ in range(cases):
-        tag_count = rng.randint(0, max_tags)
+        tag_count = int(rng.integers(0, max_tags, endpoint=True))
+        gap_sizes = rng.integers(0, 20, size=tag_count + 1, endpoint=True).tolist()
+        content_sizes = rng.integers(1, 100, size=tag_count, endpoint=True).tolist()
         text_chunks = []
         expected = {}
         for i in range(tag_count):
-            text_chunks.append(_random_text(rng, rng.randint(0, 20)))
-            content = _random_text(rng, rng.randint(1, 100)).replace("]", "")
+            text_chunks.append(_take(gap_sizes[i]))
+            content = _take(content_sizes[i]).replace("]", "")
             text_chunks.append(f"/thought[{content}]")
             expected[f"thought_{i}"] = content.strip()
-        text_chunks.append(_random_text(rng, rng.randint(0, 20)))
+        text_chunks.append(_take(gap_sizes[-1]))
         text = "".join(text_chunks)
 
         extracted = parse_thought_tags(text)
@@ -167,6 +195,13 @@ def run_benchmark(runs: int, scale_runs: int, accuracy_cases: int) -> Dict[str,
     return benchmark_results
 
 
+def _dump_json(path: Path, data: object) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Benchmark /thought tag parsing and cleaning.")
     parser.add_argument("--runs", type=int, default=1000, help="Runs for the Section 5 reproduction benchmark.")
@@ -182,7 +217,7 @@ def main() -> int:
 
     results = run_benchmark(runs=args.runs, scale_runs=args.scale_runs, accuracy_cases=args.accuracy_cases)
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    _dump_json(args.output, results)
 
     spec = results["spec_sample"]
     accuracy = results["accuracy"]
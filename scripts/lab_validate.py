@@ -6,9 +6,15 @@ import argparse
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
@@ -25,6 +31,12 @@ def _run(cmd: list[str]) -> subprocess.CompletedProcess[str]:
     return subprocess.run(cmd, check=False, text=True, capture_output=True)
 
 
+def _load_json(path: Path) -> dict:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
 def _make_report(
     report_path: Path,
     unittest_result: subprocess.CompletedProcess[str],
@@ -103,27 +115,30 @@ def main() -> int:
     parser.add_argument("--report-output", type=Path, default=Path("results/lab_validation_report.md"))
     args = parser.parse_args()
 
-    unit = _run([sys.executable, "-m", "unittest", "discover", "-s", "tests", "-v"])
-    benchmark = _run(
-        [
-            sys.executable,
-            "scripts/benchmark.py",
-            "--runs",
-            str(args.runs),
-            "--scale-runs",
-            str(args.scale_runs),
-            "--accuracy-cases",
-            str(args.accuracy_cases),
-            "--output",
-            str(args.benchmark_output),
-        ]
-    )
+    # Tests and benchmark are independent; overlap them and join before the report.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        unit_future = pool.submit(_run, [sys.executable, "-m", "unittest", "discover", "-s", "tests", "-v"])
+        benchmark = _run(
+            [
+                sys.executable,
+                "scripts/benchmark.py",
+                "--runs",
+                str(args.runs),
+                "--scale-runs",
+                str(args.scale_runs),
+                "--accuracy-cases",
+                str(args.accuracy_cases),
+                "--output",
+                str(args.benchmark_output),
+            ]
+        )
+        unit = unit_future.result()
 
     if benchmark.returncode != 0:
         sys.stderr.write(benchmark.stdout + benchmark.stderr)
         return benchmark.returncode
 
-    bench_data = json.loads(args.benchmark_output.read_text(encoding="utf-8"))
+    bench_data = _load_json(args.benchmark_output)
     spec_dict_ok = parse_thought_tags(RAW_SPEC_OUTPUT) == EXPECTED_SPEC_THOUGHTS
     spec_clean_ok = clean_thought_tags(RAW_SPEC_OUTPUT) == EXPECTED_SPEC_CLEAN_OUTPUT
 
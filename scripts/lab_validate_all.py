@@ -3,18 +3,72 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
+import shutil
 import subprocess
 import sys
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import BinaryIO, Sequence
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-def _run(cmd: list[str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(cmd, check=False, capture_output=True, text=True)
+
+async def _pump(stream: asyncio.StreamReader, sink: BinaryIO, prefix: bytes, captured: bytearray) -> None:
+    # Forward whole lines only so concurrent children do not interleave mid-line; all pumps share one
+    # event-loop thread, so no lock is needed around the writes.
+    pending = b""
+    while chunk := await stream.read(65536):
+        captured += chunk
+        lines, sep, pending = (pending + chunk).rpartition(b"\n")
+        if sep:
+            sink.write(b"".join(prefix + line + b"\n" for line in lines.split(b"\n")))
+            sink.flush()
+    if pending:
+        sink.write(prefix + pending + b"\n")
+        sink.flush()
+
+
+async def _run(label: str, cmd: Sequence[str]) -> subprocess.CompletedProcess[str]:
+    """Run cmd, streaming its output live under a [label] prefix and keeping a copy for the report."""
+    proc = await asyncio.create_subprocess_exec(*cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    prefix = f"[{label}] ".encode()
+    out = bytearray()
+    err = bytearray()
+    await asyncio.gather(
+        _pump(proc.stdout, sys.stdout.buffer, prefix, out),
+        _pump(proc.stderr, sys.stderr.buffer, prefix, err),
+    )
+    returncode = await proc.wait()
+    return subprocess.CompletedProcess(
+        cmd, returncode, out.decode("utf-8", errors="replace"), err.decode("utf-8", errors="replace")
+    )
+
+
+# Benchmarks whose p95 latency is a hard gate; they run one at a time so the result does not
+# depend on how many cores the host has to spare for the other jobs.
+_LATENCY_GATED = ("py_bench", "graph_bench", "agent_bench")
+
+
+async def _run_all(commands: dict[str, tuple[str, ...]]) -> dict[str, subprocess.CompletedProcess[str]]:
+    # Ungated children run concurrently, then each gated benchmark runs alone; results keep the job-table order.
+    ungated = {name: cmd for name, cmd in commands.items() if name not in _LATENCY_GATED}
+    finished = await asyncio.gather(*(_run(name, cmd) for name, cmd in ungated.items()))
+    results = dict(zip(ungated, finished))
+    for name in _LATENCY_GATED:
+        if name in commands:
+            results[name] = await _run(name, commands[name])
+    return {name: results[name] for name in commands}
 
 
 def _load_json(path: Path) -> dict:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     return json.loads(path.read_text(encoding="utf-8"))
 
 
@@ -22,6 +76,59 @@ def _fmt(value: float) -> str:
     return f"{value:.6f}"
 
 
+def _wrapper_section(data: dict | None, missing_hint: str) -> str:
+    """Parser/cleaner benchmark bullets for one language port, or a hint on how to produce them."""
+    if not data:
+        return f"- Missing: {missing_hint}\n"
+    spec = data["spec_sample"]
+    acc = data["accuracy"]
+    return (
+        f"- Regex parse avg: {_fmt(spec['regex_parse']['avg_ms'])} ms\n"
+        f"- Regex parse p95: {_fmt(spec['regex_parse']['p95_ms'])} ms\n"
+        f"- Regex clean avg: {_fmt(spec['regex_clean']['avg_ms'])} ms\n"
+        f"- Regex clean p95: {_fmt(spec['regex_clean']['p95_ms'])} ms\n"
+        f"- Exact-case accuracy: {acc['exact_case_accuracy_pct']:.2f}%\n"
+        f"- Per-tag accuracy: {acc['per_tag_accuracy_pct']:.2f}%\n"
+    )
+
+
+_PERF_EVENTS = "cycles,instructions,cache-references,cache-misses,branch-misses"
+
+
+def _parse_perf_stat(path: Path) -> dict[str, float | None]:
+    """Counters from `perf stat -x,` output; None for events the CPU/kernel did not count."""
+    counters: dict[str, float | None] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        fields = line.split(",")
+        if line.startswith("#") or len(fields) < 3 or not fields[2]:
+            continue
+        event = fields[2].split(":")[0]
+        try:
+            counters[event] = float(fields[0])
+        except ValueError:
+            counters[event] = None
+    return counters
+
+
+def _perf_section(perf: dict[str, dict[str, float | None]]) -> str:
+    if not perf:
+        return ""
+    lines = ["", "## Microarchitecture Counters (perf stat)", ""]
+    for name, counters in perf.items():
+        cycles = counters.get("cycles")
+        instructions = counters.get("instructions")
+        refs = counters.get("cache-references")
+        misses = counters.get("cache-misses")
+        ipc = f"{instructions / cycles:.2f}" if cycles and instructions is not None else "n/a"
+        miss_rate = f"{misses / refs * 100.0:.2f}%" if refs and misses is not None else "n/a"
+        branch = counters.get("branch-misses")
+        lines.append(
+            f"- {name}: IPC {ipc}, cache miss rate {miss_rate}, "
+            f"branch misses {'n/a' if branch is None else f'{branch:.0f}'}"
+        )
+    return "\n".join(lines) + "\n"
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Consolidated validation runner")
     parser.add_argument("--python-runs", type=int, default=1000)
@@ -33,12 +140,21 @@ def main() -> int:
     parser.add_argument("--agent-reflection-frequency", type=int, default=2)
     parser.add_argument("--agent-seed-count", type=int, default=40)
     parser.add_argument("--report-output", type=Path, default=Path("results/lab_validation_report.md"))
+    parser.add_argument(
+        "--perf",
+        action="store_true",
+        help="Run each benchmark under `perf stat` and add hardware counters to the report (Linux only).",
+    )
     args = parser.parse_args()
+    if args.perf and shutil.which("perf") is None:
+        parser.error("--perf requires the Linux `perf` tool on PATH")
 
-    py_tests = _run([sys.executable, "-m", "unittest", "discover", "-s", "tests", "-v"])
-    py_bench = _run(
-        [
-            sys.executable,
+    python = sys.executable
+    # Declarative job table: adding a benchmark is one entry here.
+    commands: dict[str, tuple[str, ...]] = {
+        "py_tests": (python, "-m", "unittest", "discover", "-s", "tests", "-v"),
+        "py_bench": (
+            python,
             "scripts/benchmark.py",
             "--runs",
             str(args.python_runs),
@@ -48,11 +164,9 @@ def main() -> int:
             "1000",
             "--output",
             "results/benchmark_results.json",
-        ]
-    )
-    tms_bench = _run(
-        [
-            sys.executable,
+        ),
+        "tms_bench": (
+            python,
             "scripts/tms_benchmark.py",
             "--runs",
             str(args.tms_runs),
@@ -60,11 +174,9 @@ def main() -> int:
             str(args.tms_corpus),
             "--output",
             "results/tms_benchmark_results.json",
-        ]
-    )
-    graph_bench = _run(
-        [
-            sys.executable,
+        ),
+        "graph_bench": (
+            python,
             "scripts/tms_graph_benchmark.py",
             "--runs",
             str(args.graph_runs),
@@ -72,11 +184,9 @@ def main() -> int:
             str(args.graph_corpus),
             "--output",
             "results/tms_graph_benchmark_results.json",
-        ]
-    )
-    agent_bench = _run(
-        [
-            sys.executable,
+        ),
+        "agent_bench": (
+            python,
             "scripts/agent_loop_benchmark.py",
             "--runs",
             str(args.agent_runs),
@@ -86,21 +196,28 @@ def main() -> int:
             str(args.agent_seed_count),
             "--output",
             "results/agent_loop_benchmark_results.json",
-        ]
-    )
+        ),
+    }
+    perf: dict[str, dict[str, float | None]] = {}
+    with tempfile.TemporaryDirectory() as perf_dir:
+        perf_files: dict[str, Path] = {}
+        if args.perf:
+            for name in commands:
+                if name.endswith("_bench"):
+                    perf_files[name] = Path(perf_dir) / f"{name}.csv"
+                    cmd = ("perf", "stat", "-x,", "-e", _PERF_EVENTS, "-o", str(perf_files[name]), "--")
+                    commands[name] = cmd + commands[name]
+        # Children write disjoint result files; only the latency-gated ones need the machine to themselves.
+        results = asyncio.run(_run_all(commands))
+        for name, path in perf_files.items():
+            if path.exists():
+                perf[name] = _parse_perf_stat(path)
+    py_tests = results.pop("py_tests")
 
-    if py_bench.returncode != 0:
-        sys.stderr.write(py_bench.stdout + py_bench.stderr)
-        return py_bench.returncode
-    if tms_bench.returncode != 0:
-        sys.stderr.write(tms_bench.stdout + tms_bench.stderr)
-        return tms_bench.returncode
-    if graph_bench.returncode != 0:
-        sys.stderr.write(graph_bench.stdout + graph_bench.stderr)
-        return graph_bench.returncode
-    if agent_bench.returncode != 0:
-        sys.stderr.write(agent_bench.stdout + agent_bench.stderr)
-        return agent_bench.returncode
+    for name, bench in results.items():
+        if bench.returncode != 0:
+            sys.stderr.write(f"{name} failed with exit code {bench.returncode}\n")
+            return bench.returncode
 
     py_json = _load_json(Path("results/benchmark_results.json"))
     tms_json = _load_json(Path("results/tms_benchmark_results.json"))
@@ -134,140 +251,91 @@ def main() -> int:
         and agent["turn_total_latency"]["p95_ms"] < 120.0
     )
 
-    lines = [
-        "# Consolidated Lab Validation Report",
-        "",
-        f"- Generated (UTC): {datetime.now(timezone.utc).isoformat()}",
-        "- Scope: Python parser/cleaner, TypeScript port, Java port, Python TMS core, ThoughtGraph, Reflection Engine, and Phase 4 multi-model/agentic loop integrations",
-        "",
-        "## Gate Status",
-        "",
-        f"- Python tests: {'PASS' if py_tests.returncode == 0 else 'FAIL'}",
-        f"- Python parser gates (accuracy>=99.9, p95<1ms): {'PASS' if py_pass else 'FAIL'}",
-        f"- TMS quality gate (top1>=99%): {'PASS' if tms_pass else 'FAIL'}",
-        f"- Reflection gate (success>=99%, p95<50ms): {'PASS' if reflection_pass else 'FAIL'}",
-        f"- Phase 4 agentic gate (store/reflection/recall>=99%, p95<120ms): {'PASS' if phase4_pass else 'FAIL'}",
-        f"- TypeScript artifacts present: {'YES' if ts_json else 'NO'}",
-        f"- Java artifacts present: {'YES' if java_json else 'NO'}",
-        "",
-        "## Python Wrapper",
-        "",
-        f"- Regex parse avg: {_fmt(py_spec['regex_parse']['avg_ms'])} ms",
-        f"- Regex parse p95: {_fmt(py_spec['regex_parse']['p95_ms'])} ms",
-        f"- Regex clean avg: {_fmt(py_spec['regex_clean']['avg_ms'])} ms",
-        f"- Regex clean p95: {_fmt(py_spec['regex_clean']['p95_ms'])} ms",
-        f"- Exact-case accuracy: {py_acc['exact_case_accuracy_pct']:.2f}%",
-        f"- Per-tag accuracy: {py_acc['per_tag_accuracy_pct']:.2f}%",
-        "",
-        "## TypeScript Wrapper",
-        "",
-    ]
-
-    if ts_json:
-        ts_spec = ts_json["spec_sample"]
-        ts_acc = ts_json["accuracy"]
-        lines.extend(
-            [
-                f"- Regex parse avg: {_fmt(ts_spec['regex_parse']['avg_ms'])} ms",
-                f"- Regex parse p95: {_fmt(ts_spec['regex_parse']['p95_ms'])} ms",
-                f"- Regex clean avg: {_fmt(ts_spec['regex_clean']['avg_ms'])} ms",
-                f"- Regex clean p95: {_fmt(ts_spec['regex_clean']['p95_ms'])} ms",
-                f"- Exact-case accuracy: {ts_acc['exact_case_accuracy_pct']:.2f}%",
-                f"- Per-tag accuracy: {ts_acc['per_tag_accuracy_pct']:.2f}%",
-            ]
-        )
-    else:
-        lines.append("- Missing: run `npm run lab:validate` in `typescript/`")
-
-    lines.extend(["", "## Java Wrapper", ""])
-    if java_json:
-        j_spec = java_json["spec_sample"]
-        j_acc = java_json["accuracy"]
-        lines.extend(
-            [
-                f"- Regex parse avg: {_fmt(j_spec['regex_parse']['avg_ms'])} ms",
-                f"- Regex parse p95: {_fmt(j_spec['regex_parse']['p95_ms'])} ms",
-                f"- Regex clean avg: {_fmt(j_spec['regex_clean']['avg_ms'])} ms",
-                f"- Regex clean p95: {_fmt(j_spec['regex_clean']['p95_ms'])} ms",
-                f"- Exact-case accuracy: {j_acc['exact_case_accuracy_pct']:.2f}%",
-                f"- Per-tag accuracy: {j_acc['per_tag_accuracy_pct']:.2f}%",
-            ]
-        )
-    else:
-        lines.append("- Missing: run `mvn -Pbenchmarks verify` in `java/`")
-
     tms_ops = tms_json["operations"]
     tms_quality = tms_json["quality"]
-    lines.extend(
-        [
-            "",
-            "## TMS Core (Python)",
-            "",
-            f"- Vector backend: {tms_json['metadata']['vector_backend']}",
-            f"- Store single avg: {_fmt(tms_ops['store_single']['avg_ms'])} ms",
-            f"- Batch store (20) avg: {_fmt(tms_ops['batch_store_20']['avg_ms'])} ms",
-            f"- Retrieve filtered avg: {_fmt(tms_ops['retrieve_filtered']['avg_ms'])} ms",
-            f"- Semantic search avg: {_fmt(tms_ops['semantic_search']['avg_ms'])} ms",
-            f"- Semantic search p95: {_fmt(tms_ops['semantic_search']['p95_ms'])} ms",
-            f"- Top-1 exact match: {tms_quality['top1_exact_match_pct']:.2f}%",
-            "",
-            "## TMS Graph + Reflection (Python)",
-            "",
-            f"- Graph backend: {graph_json['metadata']['graph_backend']}",
-            f"- Add thought avg: {_fmt(graph_json['graph_operations']['add_thought']['avg_ms'])} ms",
-            f"- Link avg: {_fmt(graph_json['graph_operations']['link']['avg_ms'])} ms",
-            f"- Find paths avg: {_fmt(graph_json['graph_operations']['find_paths']['avg_ms'])} ms",
-            f"- Cluster avg: {_fmt(graph_json['graph_operations']['cluster_by_topic']['avg_ms'])} ms",
-            f"- Reflection latency avg: {_fmt(graph_json['reflection_cycle']['latency']['avg_ms'])} ms",
-            f"- Reflection latency p95: {_fmt(graph_json['reflection_cycle']['latency']['p95_ms'])} ms",
-            f"- Reflection success rate: {graph_json['reflection_cycle']['success_rate_pct']:.2f}%",
-            "",
-            "## Phase 4 Agentic Loop (Python)",
-            "",
-            f"- Turn total avg: {_fmt(agent['turn_total_latency']['avg_ms'])} ms",
-            f"- Turn total p95: {_fmt(agent['turn_total_latency']['p95_ms'])} ms",
-            f"- Completion avg: {_fmt(agent['completion_latency']['avg_ms'])} ms",
-            f"- Reflection p95: {_fmt(agent['reflection_latency']['p95_ms'])} ms",
-            f"- Thought store success rate: {agent['thought_store_success_rate_pct']:.2f}%",
-            f"- Reflection success rate: {agent['reflection_success_rate_pct']:.2f}%",
-            f"- Recall probe hit rate: {agent['recall_probe_hit_rate_pct']:.2f}%",
-            "",
-            "## Artifacts",
-            "",
-            "- Python benchmark: `results/benchmark_results.json`",
-            "- TMS benchmark: `results/tms_benchmark_results.json`",
-            "- TMS graph benchmark: `results/tms_graph_benchmark_results.json`",
-            "- Agent loop benchmark: `results/agent_loop_benchmark_results.json`",
-            "- TypeScript benchmark: `typescript/results/benchmark_results.json`",
-            "- Java benchmark: `java/results/benchmark_results.json`",
-            "",
-            "## Python Test Output",
-            "",
-            "```text",
-            py_tests.stdout.strip() or "(no stdout)",
-            py_tests.stderr.strip() or "(no stderr)",
-            "```",
-        ]
+    graph_ops = graph_json["graph_operations"]
+    reflection = graph_json["reflection_cycle"]
+    report = (
+        "# Consolidated Lab Validation Report\n"
+        "\n"
+        f"- Generated (UTC): {datetime.now(timezone.utc).isoformat()}\n"
+        "- Scope: Python parser/cleaner, TypeScript port, Java port, Python TMS core, ThoughtGraph, Reflection Engine, and Phase 4 multi-model/agentic loop integrations\n"
+        "\n"
+        "## Gate Status\n"
+        "\n"
+        f"- Python tests: {'PASS' if py_tests.returncode == 0 else 'FAIL'}\n"
+        f"- Python parser gates (accuracy>=99.9, p95<1ms): {'PASS' if py_pass else 'FAIL'}\n"
+        f"- TMS quality gate (top1>=99%): {'PASS' if tms_pass else 'FAIL'}\n"
+        f"- Reflection gate (success>=99%, p95<50ms): {'PASS' if reflection_pass else 'FAIL'}\n"
+        f"- Phase 4 agentic gate (store/reflection/recall>=99%, p95<120ms): {'PASS' if phase4_pass else 'FAIL'}\n"
+        f"- TypeScript artifacts present: {'YES' if ts_json else 'NO'}\n"
+        f"- Java artifacts present: {'YES' if java_json else 'NO'}\n"
+        "\n"
+        "## Python Wrapper\n"
+        "\n"
+        f"{_wrapper_section(py_json, '')}"
+        "\n"
+        "## TypeScript Wrapper\n"
+        "\n"
+        f"{_wrapper_section(ts_json, 'run `npm run lab:validate` in `typescript/`')}"
+        "\n"
+        "## Java Wrapper\n"
+        "\n"
+        f"{_wrapper_section(java_json, 'run `mvn -Pbenchmarks verify` in `java/`')}"
+        "\n"
+        "## TMS Core (Python)\n"
+        "\n"
+        f"- Vector backend: {tms_json['metadata']['vector_backend']}\n"
+        f"- Store single avg: {_fmt(tms_ops['store_single']['avg_ms'])} ms\n"
+        f"- Batch store (20) avg: {_fmt(tms_ops['batch_store_20']['avg_ms'])} ms\n"
+        f"- Retrieve filtered avg: {_fmt(tms_ops['retrieve_filtered']['avg_ms'])} ms\n"
+        f"- Semantic search avg: {_fmt(tms_ops['semantic_search']['avg_ms'])} ms\n"
+        f"- Semantic search p95: {_fmt(tms_ops['semantic_search']['p95_ms'])} ms\n"
+        f"- Top-1 exact match: {tms_quality['top1_exact_match_pct']:.2f}%\n"
+        "\n"
+        "## TMS Graph + Reflection (Python)\n"
+        "\n"
+        f"- Graph backend: {graph_json['metadata']['graph_backend']}\n"
+        f"- Add thought avg: {_fmt(graph_ops['add_thought']['avg_ms'])} ms\n"
+        f"- Link avg: {_fmt(graph_ops['link']['avg_ms'])} ms\n"
+        f"- Find paths avg: {_fmt(graph_ops['find_paths']['avg_ms'])} ms\n"
+        f"- Cluster avg: {_fmt(graph_ops['cluster_by_topic']['avg_ms'])} ms\n"
+        f"- Reflection latency avg: {_fmt(reflection['latency']['avg_ms'])} ms\n"
+        f"- Reflection latency p95: {_fmt(reflection['latency']['p95_ms'])} ms\n"
+        f"- Reflection success rate: {reflection['success_rate_pct']:.2f}%\n"
+        "\n"
+        "## Phase 4 Agentic Loop (Python)\n"
+        "\n"
+        f"- Turn total avg: {_fmt(agent['turn_total_latency']['avg_ms'])} ms\n"
+        f"- Turn total p95: {_fmt(agent['turn_total_latency']['p95_ms'])} ms\n"
+        f"- Completion avg: {_fmt(agent['completion_latency']['avg_ms'])} ms\n"
+        f"- Reflection p95: {_fmt(agent['reflection_latency']['p95_ms'])} ms\n"
+        f"- Thought store success rate: {agent['thought_store_success_rate_pct']:.2f}%\n"
+        f"- Reflection success rate: {agent['reflection_success_rate_pct']:.2f}%\n"
+        f"- Recall probe hit rate: {agent['recall_probe_hit_rate_pct']:.2f}%\n"
+        "\n"
+        "## Artifacts\n"
+        "\n"
+        "- Python benchmark: `results/benchmark_results.json`\n"
+        "- TMS benchmark: `results/tms_benchmark_results.json`\n"
+        "- TMS graph benchmark: `results/tms_graph_benchmark_results.json`\n"
+        "- Agent loop benchmark: `results/agent_loop_benchmark_results.json`\n"
+        "- TypeScript benchmark: `typescript/results/benchmark_results.json`\n"
+        "- Java benchmark: `java/results/benchmark_results.json`\n"
+        "\n"
+        "## Python Test Output\n"
+        "\n"
+        "```text\n"
+        f"{py_tests.stdout.strip() or '(no stdout)'}\n"
+        f"{py_tests.stderr.strip() or '(no stderr)'}\n"
+        "```\n"
+        f"{_perf_section(perf)}"
     )
 
     args.report_output.parent.mkdir(parents=True, exist_ok=True)
-    args.report_output.write_text("\n".join(lines) + "\n", encoding="utf-8")
-
-    sys.stdout.write(py_tests.stdout)
-    if py_tests.stderr:
-        sys.stderr.write(py_tests.stderr)
-    sys.stdout.write(py_bench.stdout)
-    if py_bench.stderr:
-        sys.stderr.write(py_bench.stderr)
-    sys.stdout.write(tms_bench.stdout)
-    if tms_bench.stderr:
-        sys.stderr.write(tms_bench.stderr)
-    sys.stdout.write(graph_bench.stdout)
-    if graph_bench.stderr:
-        sys.stderr.write(graph_bench.stderr)
-    sys.stdout.write(agent_bench.stdout)
-    if agent_bench.stderr:
-        sys.stderr.write(agent_bench.stderr)
+    # Bytes, not write_text: one encode and no newline translation.
+    args.report_output.write_bytes(report.encode("utf-8"))
+
     sys.stdout.write(f"Consolidated report written to {args.report_output}\n")
 
     if py_tests.returncode != 0:
@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
+import os
 import platform
-import random
-import statistics
 import sys
-import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from time import perf_counter_ns
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
@@ -19,33 +27,64 @@ if str(PROJECT_ROOT) not in sys.path:
 from thought_wrapper.tms import HashEmbedder, ReflectionEngine, Thought, ThoughtGraph, ThoughtStore
 
 
-def _stats(values: list[float]) -> dict[str, float]:
-    ordered = sorted(values)
-    n = len(ordered)
+def _stats(values: np.ndarray | list[float]) -> dict[str, float]:
+    arr = np.asarray(values, dtype=np.float64)
+    n = arr.size
+    p50_idx = int(0.5 * (n - 1))
+    p95_idx = int(0.95 * (n - 1))
+    # One selection yields min, p50, p95 and max; no full sort needed.
+    selected = np.partition(arr, (0, p50_idx, p95_idx, n - 1))
+    mean = arr.mean()
+    dev = arr - mean
     return {
         "count": n,
-        "avg_ms": sum(ordered) / n,
-        "median_ms": ordered[int(0.5 * (n - 1))],
-        "p95_ms": ordered[int(0.95 * (n - 1))],
-        "min_ms": ordered[0],
-        "max_ms": ordered[-1],
-        "std_ms": statistics.pstdev(ordered) if n > 1 else 0.0,
+        "avg_ms": float(mean),
+        "median_ms": float(selected[p50_idx]),
+        "p95_ms": float(selected[p95_idx]),
+        "min_ms": float(selected[0]),
+        "max_ms": float(selected[-1]),
+        "std_ms": float(np.sqrt(dev @ dev / n)) if n > 1 else 0.0,
     }
 
 
-def _time(fn, runs: int, warmup: int = 30) -> list[float]:
+def _time(fn, runs: int, warmup: int = 30) -> np.ndarray:
     for _ in range(warmup):
         fn()
-    out = []
-    for _ in range(runs):
-        start = time.perf_counter()
+    # Integer ns timestamps in the loop; convert to ms once afterwards.
+    samples_ns = np.empty(runs, dtype=np.int64)
+    for i in range(runs):
+        start = perf_counter_ns()
         fn()
-        end = time.perf_counter()
-        out.append((end - start) * 1000.0)
-    return out
+        samples_ns[i] = perf_counter_ns() - start
+    return samples_ns.astype(np.float64) * 1e-6
+
+
+_SUFFIX_ALPHABET = np.frombuffer(b"abcdefghijklmnopqrstuvwxyz0123456789", dtype="S1")
+
+
+def _random_suffixes(rng: np.random.Generator, count: int, length: int) -> list[str]:
+    # One draw for the whole corpus; each row of S1 chars is reinterpreted as one S<length> string.
+    chars = rng.choice(_SUFFIX_ALPHABET, size=(count, length))
+    return chars.view(f"S{length}").ravel().astype(str).tolist()
+
+
+_REFLECTION_MODES = ("reasoning", "summarization", "contradiction_detection", "planning")
+_WORKER_ENGINE: ReflectionEngine | None = None
 
 
-def run_benchmark(runs: int, corpus_size: int) -> dict[str, object]:
+def _init_reflect_worker(db_path: str) -> None:
+    # Each process opens its own connection and index over the shared WAL database.
+    global _WORKER_ENGINE
+    store = ThoughtStore(db_path=db_path, embedding_dim=64, vector_backend="numpy")
+    _WORKER_ENGINE = ReflectionEngine(store, graph=None, embedder=HashEmbedder(dimension=64), embedding_dim=64)
+
+
+def _reflect_one(mode: str, query: str, session_id: str) -> tuple[float, bool]:
+    result = _WORKER_ENGINE.reflect(query=query, current_session_id=session_id, mode=mode, top_k=3)
+    return result.latency_ms, bool(result.stored_reflections)
+
+
+def run_benchmark(runs: int, corpus_size: int, *, reflect_workers: int = 0) -> dict[str, object]:
     embedder = HashEmbedder(dimension=64)
     tmp_dir = Path("results/.tmp_tms_graph")
     tmp_dir.mkdir(parents=True, exist_ok=True)
@@ -56,36 +95,38 @@ def run_benchmark(runs: int, corpus_size: int) -> dict[str, object]:
     store = ThoughtStore(db_path=db_path, embedding_dim=64, vector_backend="numpy")
     graph = ThoughtGraph(store)
     engine = ReflectionEngine(store, graph=graph, embedder=embedder, embedding_dim=64)
-    rng = random.Random(20260228)
+    rng = np.random.default_rng(20260228)
 
     try:
         store.create_session("root")
         store.create_session("child", parent_session_id="root")
 
-        seeded: list[Thought] = []
         now = datetime.now(timezone.utc)
-        for i in range(corpus_size):
-            text = f"seed-{i}-" + "".join(rng.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(12))
-            t = Thought(
-                session_id="root" if i % 2 == 0 else "child",
-                category="reasoning" if i % 3 else "plan",
-                confidence=0.6 + ((i % 20) / 100.0),
-                tags=["phase3", "seed"],
-                raw_text=text,
-                cleaned_text=text,
-                embedding_vector=embedder.embed(text),
-                embedding_dim=64,
-                timestamp_utc=now - timedelta(seconds=(corpus_size - i)),
-            )
-            graph.add_thought(t, semantic_neighbors=0, temporal_link=True)
-            seeded.append(t)
+        seed_texts = [f"seed-{i}-{suffix}" for i, suffix in enumerate(_random_suffixes(rng, corpus_size, 12))]
+        seeded = graph.add_thoughts(
+            (
+                Thought(
+                    session_id="root" if i % 2 == 0 else "child",
+                    category="reasoning" if i % 3 else "plan",
+                    confidence=0.6 + ((i % 20) / 100.0),
+                    tags=["phase3", "seed"],
+                    raw_text=text,
+                    cleaned_text=text,
+                    embedding_vector=vec,
+                    embedding_dim=64,
+                    timestamp_utc=now - timedelta(seconds=(corpus_size - i)),
+                )
+                for i, (text, vec) in enumerate(zip(seed_texts, embedder.embed_batch(seed_texts)))
+            ),
+            semantic_neighbors=0,
+            temporal_link=True,
+        )
 
         # Graph operation benches.
-        add_idx = {"value": 0}
+        add_counter = itertools.count()
 
         def bench_add() -> None:
-            i = add_idx["value"]
-            add_idx["value"] += 1
+            i = next(add_counter)
             txt = f"bench-add-{i}"
             graph.add_thought(
                 Thought(
@@ -95,7 +136,7 @@ def run_benchmark(runs: int, corpus_size: int) -> dict[str, object]:
                     tags=["bench-add"],
                     raw_text=txt,
                     cleaned_text=txt,
-                    embedding_vector=embedder.embed(txt),
+                    embedding_vector=embedder.embed_array(txt),
                     embedding_dim=64,
                 ),
                 semantic_neighbors=1,
@@ -104,46 +145,44 @@ def run_benchmark(runs: int, corpus_size: int) -> dict[str, object]:
             )
 
         link_pairs = [(seeded[i].id, seeded[(i + 1) % len(seeded)].id) for i in range(min(400, len(seeded) - 1))]
-        link_idx = {"value": 0}
+        link_cycle = itertools.cycle(link_pairs)
 
         def bench_link() -> None:
-            i = link_idx["value"] % len(link_pairs)
-            link_idx["value"] += 1
-            src, tgt = link_pairs[i]
+            src, tgt = next(link_cycle)
             graph.link(src, tgt, relation="explicit-reference", weight=0.8)
 
         path_pairs = [(seeded[i].id, seeded[min(i + 5, len(seeded) - 1)].id) for i in range(min(200, len(seeded) - 6))]
-        path_idx = {"value": 0}
+        path_cycle = itertools.cycle(path_pairs)
 
         def bench_paths() -> None:
-            i = path_idx["value"] % len(path_pairs)
-            path_idx["value"] += 1
-            src, tgt = path_pairs[i]
+            src, tgt = next(path_cycle)
             graph.find_paths(src, tgt, max_depth=5, limit=5)
 
         def bench_cluster() -> None:
             graph.cluster_by_topic(min_cluster_size=2)
 
-        def bench_temporal_range() -> None:
-            end = datetime.now(timezone.utc)
-            start = end - timedelta(minutes=15)
-            graph.temporal_range(start_time_utc=start, end_time_utc=end, session_id="child", limit=150)
-
         add_samples = _time(bench_add, runs=max(100, runs // 2), warmup=20)
         link_samples = _time(bench_link, runs=runs, warmup=30)
         path_samples = _time(bench_paths, runs=runs, warmup=30)
         cluster_samples = _time(bench_cluster, runs=max(80, runs // 4), warmup=10)
+
+        # Window fixed once, after the add bench has written its thoughts, so no clock read is timed.
+        range_end = datetime.now(timezone.utc)
+        range_start = range_end - timedelta(minutes=15)
+
+        def bench_temporal_range() -> None:
+            graph.temporal_range(start_time_utc=range_start, end_time_utc=range_end, session_id="child", limit=150)
+
         temporal_samples = _time(bench_temporal_range, runs=runs, warmup=30)
 
         # Reflection cycle benchmark + quality.
-        reflection_modes = ["reasoning", "summarization", "contradiction_detection", "planning"]
         reflection_latency: list[float] = []
         reflection_success = 0
         reflection_engine = ReflectionEngine(store, graph=None, embedder=embedder, embedding_dim=64)
         store.create_session("reflect_local")
-        for i in range(40):
-            text = f"reflect-seed-{i}"
-            graph.add_thought(
+        reflect_texts = [f"reflect-seed-{i}" for i in range(40)]
+        graph.add_thoughts(
+            (
                 Thought(
                     session_id="reflect_local",
                     category="reasoning",
@@ -151,21 +190,34 @@ def run_benchmark(runs: int, corpus_size: int) -> dict[str, object]:
                     tags=["phase3", "reflect"],
                     raw_text=text,
                     cleaned_text=text,
-                    embedding_vector=embedder.embed(text),
+                    embedding_vector=vec,
                     embedding_dim=64,
-                ),
-                semantic_neighbors=0,
-                temporal_link=False,
-            )
+                )
+                for text, vec in zip(reflect_texts, embedder.embed_batch(reflect_texts))
+            ),
+            semantic_neighbors=0,
+            temporal_link=False,
+        )
 
         reflection_total = max(60, runs // 3)
-        for i in range(reflection_total):
-            mode = reflection_modes[i % len(reflection_modes)]
-            query = f"phase3-query-{i}"
-            result = reflection_engine.reflect(query=query, current_session_id="reflect_local", mode=mode, top_k=3)
-            reflection_latency.append(result.latency_ms)
-            if result.stored_reflections:
-                reflection_success += 1
+        cycle_modes = [_REFLECTION_MODES[i % len(_REFLECTION_MODES)] for i in range(reflection_total)]
+        cycle_queries = [f"phase3-query-{i}" for i in range(reflection_total)]
+        if reflect_workers > 0:
+            # Opt-in: workers see the seeded corpus but not each other's freshly stored reflections.
+            with ProcessPoolExecutor(
+                max_workers=reflect_workers, initializer=_init_reflect_worker, initargs=(str(db_path),)
+            ) as pool:
+                cycles = list(
+                    pool.map(_reflect_one, cycle_modes, cycle_queries, itertools.repeat("reflect_local"))
+                )
+            reflection_latency = [latency for latency, _ in cycles]
+            reflection_success = sum(ok for _, ok in cycles)
+        else:
+            for mode, query in zip(cycle_modes, cycle_queries):
+                result = reflection_engine.reflect(query=query, current_session_id="reflect_local", mode=mode, top_k=3)
+                reflection_latency.append(result.latency_ms)
+                if result.stored_reflections:
+                    reflection_success += 1
 
         return {
             "metadata": {
@@ -175,6 +227,7 @@ def run_benchmark(runs: int, corpus_size: int) -> dict[str, object]:
                 "runs": runs,
                 "corpus_size": corpus_size,
                 "graph_backend": graph.backend_name,
+                "reflect_workers": reflect_workers,
             },
             "graph_operations": {
                 "add_thought": _stats(add_samples),
@@ -194,16 +247,29 @@ def run_benchmark(runs: int, corpus_size: int) -> dict[str, object]:
         store.close()
 
 
+def _dump_json(path: Path, data: object) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Phase 3 graph/reflection benchmark")
     parser.add_argument("--runs", type=int, default=300)
     parser.add_argument("--corpus-size", type=int, default=900)
     parser.add_argument("--output", type=Path, default=Path("results/tms_graph_benchmark_results.json"))
+    parser.add_argument(
+        "--parallel-reflect",
+        action="store_true",
+        help="Spread reflection cycles over one worker process per CPU (default: serial, comparable to past runs).",
+    )
     args = parser.parse_args()
 
-    result = run_benchmark(runs=args.runs, corpus_size=args.corpus_size)
+    reflect_workers = (os.cpu_count() or 1) if args.parallel_reflect else 0
+    result = run_benchmark(runs=args.runs, corpus_size=args.corpus_size, reflect_workers=reflect_workers)
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    _dump_json(args.output, result)
 
     print("TMS graph benchmark complete.")
     print(f"Output: {args.output}")
@@ -1,4 +1,6 @@
 import asyncio
+import threading
+import time
 import unittest
 
 from thought_wrapper.agent import AgentLoop
@@ -6,6 +8,9 @@ from thought_wrapper.sdk import ThoughtLLM, ThoughtLLMConfig
 from thought_wrapper.tms import HashEmbedder, ReflectionEngine, ThoughtGraph, ThoughtStore
 
 
+_LOOP_OUTPUT = '<thought id="loop-%d" category="reasoning" confidence="0.91">%s</thought>\nFinal answer.'
+
+
 class _LoopClient:
     provider_name = "mock-loop"
 
@@ -20,12 +25,7 @@ class _LoopClient:
     ) -> str:
         del system_prompt, model, temperature, max_tokens
         snippet = user_prompt[:50].replace('"', "'")
-        return (
-            f'<thought id="loop-{abs(hash(snippet)) % 100000}" category="reasoning" confidence="0.91">'
-            f"{snippet}"
-            "</thought>\n"
-            "Final answer."
-        )
+        return _LOOP_OUTPUT % (abs(hash(snippet)) % 100000, snippet)
 
 
 class TestAgentLoop(unittest.TestCase):
@@ -72,16 +72,72 @@ class TestAgentLoop(unittest.TestCase):
         self.assertEqual(out.turns[0].turn_index, 1)
         self.assertTrue(all(turn.completion.stored_thoughts for turn in out.turns))
 
+    def test_run_sessions_keeps_per_session_order(self) -> None:
+        loop = AgentLoop(self.llm, reflection_frequency=2)
+        inputs = {f"loop-par-{i}": [f"s{i} turn {j}" for j in range(3)] for i in range(4)}
+        out = loop.run_sessions(inputs, max_workers=4)
+        self.assertEqual(list(out), list(inputs))
+        for session_id, result in out.items():
+            self.assertEqual(result.session_id, session_id)
+            self.assertEqual([t.turn_index for t in result.turns], [1, 2, 3])
+            self.assertEqual([t.user_input for t in result.turns], inputs[session_id])
+            self.assertEqual([t.completion.reflection is not None for t in result.turns], [False, True, False])
+        with self.assertRaises(ValueError):
+            loop.run_sessions(inputs, max_workers=0)
+
     def test_async_run(self) -> None:
-        loop = AgentLoop(self.llm, reflection_frequency=1)
+        loop = AgentLoop(self.llm, reflection_frequency=1, max_concurrent=2)
 
         async def _run() -> None:
             turn = await loop.arun_turn("async input", session_id="loop-async")
             self.assertEqual(turn.turn_index, 1)
             session = await loop.arun_session(["a", "b"], session_id="loop-async-2")
             self.assertEqual(len(session.turns), 2)
+            parallel = await loop.arun_session(
+                [f"p{i}" for i in range(5)], session_id="loop-async-2", allow_parallel=True
+            )
+            self.assertEqual([t.turn_index for t in parallel.turns], [3, 4, 5, 6, 7])
+            self.assertEqual([t.user_input for t in parallel.turns], [f"p{i}" for i in range(5)])
+            self.assertTrue(all(t.completion.stored_thoughts for t in parallel.turns))
+            sessions = await loop.arun_sessions({"loop-async-3": ["c", "d"], "loop-async-4": ["e"]})
+            self.assertEqual(list(sessions), ["loop-async-3", "loop-async-4"])
+            self.assertEqual([t.turn_index for t in sessions["loop-async-3"].turns], [1, 2])
+
+        asyncio.run(_run())
+        with self.assertRaises(ValueError):
+            AgentLoop(self.llm, max_concurrent=0)
+
+    def test_async_limit_is_shared_across_calls(self) -> None:
+        in_flight = peak = 0
+        guard = threading.Lock()
+        complete = self.llm.complete
+
+        def _tracked(*args, **kwargs):
+            nonlocal in_flight, peak
+            with guard:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            try:
+                time.sleep(0.01)
+                return complete(*args, **kwargs)
+            finally:
+                with guard:
+                    in_flight -= 1
+
+        self.llm.complete = _tracked
+        loop = AgentLoop(self.llm, max_concurrent=2)
+
+        async def _run() -> None:
+            await asyncio.gather(
+                *(
+                    loop.arun_session([f"q{i}-{j}" for j in range(3)], session_id=f"loop-cap-{i}", allow_parallel=True)
+                    for i in range(3)
+                ),
+                loop.arun_turn("solo", session_id="loop-cap-solo"),
+            )
 
         asyncio.run(_run())
+        self.assertEqual(peak, 2)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ from thought_wrapper import (
     clean_thought_tags_linear,
     parse_and_clean,
     parse_thought_tags,
+    parse_thought_tags_batch,
     parse_thought_tags_linear,
 )
 
@@ -21,15 +22,32 @@ class TestThoughtWrapperCore(unittest.TestCase):
         text = "A /thought[line1\nline2\nline3] B"
         self.assertEqual(parse_thought_tags(text), {"thought_0": "line1\nline2\nline3"})
 
+    def test_parse_batch_matches_single_calls(self) -> None:
+        texts = ["A /thought[x] B /thought[ y ]", "none", "/thought[a]/thought[b]/thought[c]", ""]
+        self.assertEqual(parse_thought_tags_batch(texts), [parse_thought_tags(t) for t in texts])
+        self.assertEqual(parse_thought_tags_batch(["/fact[z]"], tag_name="fact"), [{"fact_0": "z"}])
+        with self.assertRaises(ValueError):
+            parse_thought_tags_batch([], "")
+
     def test_parse_with_custom_tag_name(self) -> None:
         text = "A /fact[x] B /fact[y]"
         self.assertEqual(parse_thought_tags(text, tag_name="fact"), {"fact_0": "x", "fact_1": "y"})
 
+    def test_tag_name_is_matched_literally(self) -> None:
+        text = "A /t.*[x] B /tzz[y] C"
+        self.assertEqual(parse_thought_tags(text, tag_name="t.*"), {"t.*_0": "x"})
+        self.assertEqual(clean_thought_tags(text, tag_name="t.*"), "A\nB /tzz[y] C")
+
     def test_clean_removes_tags_and_normalizes_whitespace(self) -> None:
         text = "Intro\n\n /thought[a] \n\nBody\n /thought[b]\nOutro"
         cleaned = clean_thought_tags(text)
         self.assertEqual(cleaned, "Intro\nBody\nOutro")
 
+    def test_clean_absorbs_whitespace_around_adjacent_tags(self) -> None:
+        text = "A　\t/thought[x]\r\n/thought[y]/thought[z \n]\x0b B  \n\n\n\n C\t\n"
+        self.assertEqual(clean_thought_tags(text), "A\n\nB\n\nC")
+        self.assertEqual(clean_thought_tags("/thought[a]"), "")
+
     def test_no_tags_returns_empty_map(self) -> None:
         text = "No tags here."
         self.assertEqual(parse_thought_tags(text), {})
@@ -53,6 +71,22 @@ class TestThoughtWrapperCore(unittest.TestCase):
         self.assertEqual(regex_result, {"thought_0": "value [with nested"})
         self.assertEqual(linear_result, {"thought_0": "value [with nested] tokens"})
 
+    def test_linear_parser_skips_unclosed_outer_tag(self) -> None:
+        text = "x /thought[open /thought[b] y"
+        self.assertEqual(parse_thought_tags_linear(text), {"thought_0": "b"})
+        self.assertEqual(clean_thought_tags_linear(text), "x /thought[open\ny")
+
+    def test_linear_parser_skips_unclosed_nested_outer_tag(self) -> None:
+        text = "/thought[[a] /thought[b [c]] z"
+        self.assertEqual(parse_thought_tags_linear(text), {"thought_0": "b [c]"})
+        self.assertEqual(clean_thought_tags_linear(text), "/thought[[a]\nz")
+        self.assertEqual(parse_thought_tags_linear("/thought[[ x" * 3000 + "]"), {})
+
+    def test_linear_parser_accepts_lone_surrogates(self) -> None:
+        text = "/thought[a [b] \ud800] z"
+        self.assertEqual(parse_thought_tags_linear(text), {"thought_0": "a [b] \ud800"})
+        self.assertEqual(clean_thought_tags_linear(text), "z")
+
     def test_linear_cleaner_removes_nested_tag(self) -> None:
         text = "Top /thought[a [b] c] Bottom"
         self.assertEqual(clean_thought_tags_linear(text), "Top\nBottom")
@@ -5,12 +5,12 @@ import unittest
 from thought_wrapper import clean_thought_tags, parse_thought_tags
 
 
+# Closing bracket is excluded so regex-extracted tag payloads stay deterministic.
+_TOKEN_ALPHABET = string.ascii_letters + string.digits + " .,;:-_/\n\t[()"
+
+
 def _random_token(rng: random.Random, min_len: int = 0, max_len: int = 32) -> str:
-    alphabet = string.ascii_letters + string.digits + " .,;:-_/\n\t[]()"
-    size = rng.randint(min_len, max_len)
-    value = "".join(rng.choice(alphabet) for _ in range(size))
-    # Keep regex test deterministic by excluding closing bracket from valid tag payload.
-    return value.replace("]", "")
+    return "".join(rng.choices(_TOKEN_ALPHABET, k=rng.randint(min_len, max_len)))
 
 
 def _build_case(rng: random.Random) -> tuple[str, dict[str, str]]:
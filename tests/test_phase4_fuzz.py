@@ -28,9 +28,11 @@ class _FuzzClient:
         return out
 
 
+_TEXT_ALPHABET = string.ascii_lowercase + string.digits + " "
+
+
 def _rand_text(rng: random.Random, min_len: int = 5, max_len: int = 32) -> str:
-    alphabet = string.ascii_lowercase + string.digits + " "
-    return "".join(rng.choice(alphabet) for _ in range(rng.randint(min_len, max_len))).strip() or "x"
+    return "".join(rng.choices(_TEXT_ALPHABET, k=rng.randint(min_len, max_len))).strip() or "x"
 
 
 class TestPhase4Fuzz(unittest.TestCase):
@@ -1,4 +1,7 @@
+import json
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
 
 from thought_wrapper.sdk.clients import (
@@ -7,6 +10,7 @@ from thought_wrapper.sdk.clients import (
     OllamaClient,
     OpenAIClient,
     XAIClient,
+    _http_json,
 )
 
 
@@ -88,6 +92,84 @@ class TestSdkClients(unittest.TestCase):
             )
             self.assertEqual(out, "llamacpp-ok")
 
+    def test_http_json_reuses_connection(self) -> None:
+        peers: list[tuple[str, int]] = []
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                peers.append(self.client_address)
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                status = 500 if payload.get("fail") else 200
+                body = json.dumps({"echo": payload}).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/v1/chat"
+        try:
+            with patch("urllib.request.getproxies", return_value={}):
+                self.assertEqual(_http_json(url, {"n": 1}, headers={}), {"echo": {"n": 1}})
+                self.assertEqual(_http_json(url, {"n": 2}, headers={}), {"echo": {"n": 2}})
+                with self.assertRaises(RuntimeError):
+                    _http_json(url, {"fail": True}, headers={})
+            self.assertEqual(len(peers), 3)
+            self.assertEqual(len(set(peers)), 1)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_http_json_only_replays_on_stale_reused_socket(self) -> None:
+        posts: list[int] = []
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                posts.append(payload["n"])
+                if payload.get("partial"):
+                    # Response started, then the socket closes mid-body.
+                    self.wfile.write(b"HTTP/1.1 200 OK\r\nContent-Length: 100\r\n\r\n{")
+                    self.close_connection = True
+                    return
+                body = json.dumps({"echo": payload}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                # Advertised keep-alive, but the server drops the idle socket anyway.
+                self.close_connection = bool(payload.get("idle_close"))
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/v1/chat"
+        try:
+            with patch("urllib.request.getproxies", return_value={}):
+                first = _http_json(url, {"n": 1, "idle_close": True}, headers={})
+                self.assertEqual(first, {"echo": {"n": 1, "idle_close": True}})
+                # The reused socket is stale, so the request is sent once more on a new connection.
+                self.assertEqual(_http_json(url, {"n": 2}, headers={}), {"echo": {"n": 2}})
+                with self.assertRaises(RuntimeError):
+                    _http_json(url, {"n": 3, "partial": True}, headers={})
+            self.assertEqual(posts, [1, 2, 3])
+        finally:
+            server.shutdown()
+            server.server_close()
+
 
 if __name__ == "__main__":
     unittest.main()
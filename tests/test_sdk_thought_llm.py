@@ -105,6 +105,46 @@ class TestSdkThoughtLLM(unittest.TestCase):
         self.assertIsNotNone(second.reflection)
         self.assertTrue(second.reflection.stored_reflections)
 
+    def test_semantic_cache_skips_repeat_client_calls(self) -> None:
+        llm = self._make_llm(
+            [
+                '<thought id="c1" category="reasoning" confidence="0.9">first</thought>\nCached answer',
+                '<thought id="c2" category="reasoning" confidence="0.9">second</thought>\nFresh answer',
+                '<thought id="c3" category="reasoning" confidence="0.9">third</thought>\nOther session',
+            ],
+            reflect_enabled=False,
+            semantic_cache_size=8,
+        )
+        first = llm.complete("summarize rollout", session_id="s_cache")
+        hit = llm.complete("summarize rollout", session_id="s_cache")
+        self.assertFalse(first.cache_hit)
+        self.assertTrue(hit.cache_hit)
+        self.assertEqual(hit.cleaned_output, first.cleaned_output)
+        self.assertEqual(hit.stored_thoughts, [])
+        self.assertEqual(len(llm.client.calls), 1)
+
+        bypass = llm.complete("summarize rollout", session_id="s_cache", no_cache=True)
+        other = llm.complete("summarize rollout", session_id="s_cache_other")
+        self.assertIn("Fresh answer", bypass.cleaned_output)
+        self.assertIn("Other session", other.cleaned_output)
+        self.assertFalse(other.cache_hit)
+        self.assertEqual(len(llm.client.calls), 3)
+
+    def test_semantic_cache_scope_and_session_bookkeeping(self) -> None:
+        llm = self._make_llm([], reflect_enabled=True, reflection_frequency=2, semantic_cache_size=2)
+        llm.complete("summarize rollout", session_id="s_scope")
+        hit = llm.complete("summarize rollout", session_id="s_scope")
+        self.assertTrue(hit.cache_hit)
+        # Hits skip create_session and do not advance the reflection cadence.
+        self.assertEqual(llm._calls, 1)
+        for kwargs in ({"category": "fact"}, {"tags": ["x"]}, {"recall_top_k": 2}, {"reflection_mode": "planning"}):
+            self.assertFalse(llm.complete("summarize rollout", session_id="s_scope", **kwargs).cache_hit)
+        self.assertEqual(len(llm.client.calls), 5)
+        self.assertEqual(len(llm._semantic_cache), 2)
+        self.assertEqual(sum(len(v.prompts) for v in llm._semantic_cache_vectors.values()), 2)
+        llm.clear_semantic_cache()
+        self.assertFalse(llm.complete("summarize rollout", session_id="s_scope").cache_hit)
+
     def test_cross_session_recall_via_parent_lineage(self) -> None:
         seed = Thought(
             session_id="root",
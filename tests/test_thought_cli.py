@@ -1,5 +1,8 @@
 import io
 import json
+import socket
+import tempfile
+import threading
 import unittest
 from contextlib import redirect_stdout
 from pathlib import Path
@@ -66,6 +69,19 @@ class TestThoughtCli(unittest.TestCase):
         finally:
             self._cleanup(db)
 
+    def test_output_is_ascii_escaped(self) -> None:
+        db = self._new_db_path("cli_ascii")
+        try:
+            base = ["thought_cli.py", "--db", str(db), "--embed-dim", "32"]
+            self._run_cli(base + ["store", "--session", "s_cli", "--raw-text", "x /thought[café → memory]"])
+            code, out = self._run_cli(base + ["retrieve", "--query", "café memory", "--session", "s_cli"])
+            self.assertEqual(code, 0)
+            self.assertTrue(out.isascii())
+            self.assertIn("caf\\u00e9 \\u2192 memory", out)
+            self.assertEqual(json.loads(out)[0]["text"], "café → memory")
+        finally:
+            self._cleanup(db)
+
     def test_loop_and_reflect_commands(self) -> None:
         db = self._new_db_path("cli_loop")
         try:
@@ -108,8 +124,8 @@ class TestThoughtCli(unittest.TestCase):
             self._cleanup(db)
 
     def test_import_jsonl(self) -> None:
-        db = self._new_db_path("cli_import")
         data = Path("results") / f"cli_import_{uuid4().hex}.jsonl"
+        data.parent.mkdir(parents=True, exist_ok=True)
         try:
             rows = [
                 {"session_id": "s1", "raw_output": "A /thought[first] B", "category": "reasoning", "tags": ["a"]},
@@ -119,8 +135,7 @@ class TestThoughtCli(unittest.TestCase):
 
             cmd = [
                 "thought_cli.py",
-                "--db",
-                str(db),
+                "--in-memory",
                 "--embed-dim",
                 "16",
                 "import-jsonl",
@@ -132,24 +147,44 @@ class TestThoughtCli(unittest.TestCase):
             payload = json.loads(out)
             self.assertEqual(payload["imported_thoughts"], 2)
         finally:
-            self._cleanup(db)
             self._cleanup(data)
 
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "serve needs Unix domain sockets")
+    def test_serve_shares_runtime_across_invocations(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            sock_path = Path(tmp) / "tms.sock"
+            runtime = thought_cli._make_runtime(None, 16)
+            server = thought_cli._make_server(sock_path, runtime)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                base = ["thought_cli.py", "--server-socket", str(sock_path)]
+                code, out = self._run_cli(
+                    base + ["store", "--session", "s_srv", "--raw-text", "A /thought[served memory] B"]
+                )
+                self.assertEqual(code, 0)
+                self.assertEqual(json.loads(out)["stored"], 1)
+                # A second invocation sees the first one's in-memory writes.
+                code, out = self._run_cli(base + ["retrieve", "--query", "served memory", "--session", "s_srv"])
+                self.assertEqual(code, 0)
+                self.assertEqual([hit["text"] for hit in json.loads(out)], ["served memory"])
+                with self.assertRaises(RuntimeError):
+                    self._run_cli(base + ["store", "--session", "s_srv"])
+            finally:
+                server.shutdown()
+                server.server_close()
+                runtime[0].close()
+
     def test_store_requires_input(self) -> None:
-        db = self._new_db_path("cli_err")
-        try:
-            cmd = [
-                "thought_cli.py",
-                "--db",
-                str(db),
-                "store",
-                "--session",
-                "s",
-            ]
-            with self.assertRaises(ValueError):
-                self._run_cli(cmd)
-        finally:
-            self._cleanup(db)
+        cmd = [
+            "thought_cli.py",
+            "--in-memory",
+            "store",
+            "--session",
+            "s",
+        ]
+        with self.assertRaises(ValueError):
+            self._run_cli(cmd)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,15 @@
 import asyncio
+import json
+import tempfile
 import unittest
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
 
 from thought_wrapper.tms import HashEmbedder, Thought, ThoughtFilters, ThoughtStore
-from thought_wrapper.tms.pipeline import parse_and_store
+from thought_wrapper.tms import store as store_module
+from thought_wrapper.tms.pipeline import parse_and_store, parse_thoughts, parse_thoughts_batch
 
 
 class TestTmsCore(unittest.TestCase):
@@ -20,6 +26,49 @@ class TestTmsCore(unittest.TestCase):
                 embedding_dim=2,
             )
 
+    def test_thought_embedding_vector_is_float32_array(self) -> None:
+        thought = Thought(session_id="s1", raw_text="x", cleaned_text="x", embedding_vector=[1, 0.5])
+        self.assertEqual(thought.embedding_vector.dtype, np.float32)
+        restored = Thought.model_validate_json(thought.model_dump_json())
+        self.assertEqual(restored.embedding_vector.tolist(), [1.0, 0.5])
+        self.assertEqual(restored, thought)
+        vec = HashEmbedder(dimension=4).embed_array("shared")
+        self.assertIs(
+            Thought(session_id="s1", raw_text="x", cleaned_text="x", embedding_vector=vec).embedding_vector, vec
+        )
+        with self.assertRaises(Exception):
+            Thought(session_id="s1", raw_text="x", cleaned_text="x", embedding_vector=[[0.1], [0.2]])
+
+    def test_hash_embedder_is_deterministic_unit_vector(self) -> None:
+        for dim in (1, 16, 17, 384):
+            embedder = HashEmbedder(dimension=dim)
+            vec = embedder.embed_array("deterministic")
+            self.assertEqual(len(vec), dim)
+            self.assertEqual(vec.dtype, np.float32)
+            self.assertEqual(vec.tolist(), HashEmbedder(dimension=dim).embed("deterministic"))
+            self.assertAlmostEqual(float(np.dot(vec, vec)), 1.0, places=5)
+        self.assertNotEqual(HashEmbedder(dimension=16).embed("a"), HashEmbedder(dimension=16).embed("b"))
+
+    def test_hash_embedder_batch_matches_single(self) -> None:
+        embedder = HashEmbedder(dimension=24)
+        texts = ["alpha", "", "beta gamma"]
+        self.assertEqual([row.tolist() for row in embedder.embed_batch(texts)], [embedder.embed(t) for t in texts])
+        self.assertEqual(embedder.embed_batch([]), [])
+
+    def test_hash_embedder_cache_returns_read_only_vectors(self) -> None:
+        embedder = HashEmbedder(dimension=8)
+        first = embedder.embed_array("cached query")
+        hits_before = HashEmbedder.cache_info().hits
+        with self.assertRaises(ValueError):
+            first[0] = 42.0
+        # embed() keeps its public contract: a fresh, JSON-serializable list per call.
+        as_list = embedder.embed("cached query")
+        self.assertIsInstance(as_list, list)
+        as_list[0] = 42.0
+        self.assertNotEqual(embedder.embed("cached query")[0], 42.0)
+        self.assertEqual(json.loads(json.dumps(embedder.embed("cached query"))), first.tolist())
+        self.assertEqual(HashEmbedder.cache_info().hits, hits_before + 3)
+
     def test_store_and_retrieve_roundtrip(self) -> None:
         store = ThoughtStore(embedding_dim=4, vector_backend="numpy")
         try:
@@ -38,6 +87,9 @@ class TestTmsCore(unittest.TestCase):
             self.assertEqual(len(out), 1)
             self.assertEqual(out[0].id, thought.id)
             self.assertEqual(out[0].session_id, "session_a")
+            self.assertEqual(out[0].embedding_vector.tolist(), [1.0, 0.0, 0.0, 0.0])
+            payload = store._conn.execute("SELECT payload_json FROM thoughts").fetchone()[0]
+            self.assertNotIn("embedding_vector", payload)
         finally:
             store.close()
 
@@ -70,6 +122,28 @@ class TestTmsCore(unittest.TestCase):
         finally:
             store.close()
 
+    def test_batch_store_bulk_index_handles_repeated_ids(self) -> None:
+        def _t(tid: str, vec: list[float]) -> Thought:
+            return Thought(id=tid, session_id="s", raw_text=tid, cleaned_text=tid, embedding_vector=vec)
+
+        for backend in ("numpy", "faiss"):
+            try:
+                store = ThoughtStore(embedding_dim=4, vector_backend=backend)
+            except RuntimeError:
+                continue
+            try:
+                store.batch_store([_t(f"t{i}", [1.0, float(i), 0.0, 0.0]) for i in range(20)])
+                store.batch_store(
+                    [_t("t0", [0.0, 0.0, 1.0, 0.0]), _t("new", [0.0, 1.0, 0.0, 0.0]), _t("new", [0.0, 0.0, 0.0, 2.0])]
+                )
+                self.assertEqual(len(store.retrieve(limit=50)), 21)
+                self.assertEqual(store.semantic_search([0.0, 0.0, 1.0, 0.0], limit=1, alpha=1.0)[0].thought.id, "t0")
+                top = store.semantic_search([0.0, 0.0, 0.0, 1.0], limit=1, alpha=1.0)[0]
+                self.assertEqual(top.thought.id, "new")
+                self.assertAlmostEqual(top.semantic_score, 1.0, places=5)
+            finally:
+                store.close()
+
     def test_retrieve_with_filters(self) -> None:
         store = ThoughtStore(embedding_dim=4, vector_backend="numpy")
         try:
@@ -108,6 +182,40 @@ class TestTmsCore(unittest.TestCase):
         finally:
             store.close()
 
+    def test_retrieve_tags_any_applies_before_limit(self) -> None:
+        store = ThoughtStore(embedding_dim=2, vector_backend="numpy")
+        try:
+            now = datetime.now(timezone.utc)
+            store.batch_store(
+                Thought(
+                    session_id="s",
+                    raw_text=f"t{i}",
+                    cleaned_text=f"t{i}",
+                    tags=["rare"] if i < 3 else ["common"],
+                    embedding_vector=[1.0, 0.0],
+                    timestamp_utc=now + timedelta(seconds=i),
+                )
+                for i in range(20)
+            )
+            out = store.retrieve(filters=ThoughtFilters(tags_any=["rare", "missing"]), limit=3)
+            self.assertEqual([t.raw_text for t in out], ["t2", "t1", "t0"])
+        finally:
+            store.close()
+
+    def test_session_lineage_walks_ancestors_and_stops_on_cycles(self) -> None:
+        store = ThoughtStore(embedding_dim=2, vector_backend="numpy")
+        try:
+            store.create_session("child", parent_session_id="parent")
+            store.create_session("parent", parent_session_id="root")
+            self.assertEqual(store.get_session_lineage("child"), ["child", "parent", "root"])
+            self.assertEqual(store.get_session_lineage("child", include_self=False), ["parent", "root"])
+            self.assertEqual(store.get_session_lineage("unknown"), ["unknown"])
+            store.create_session("root", parent_session_id="child")
+            self.assertEqual(store.get_session_lineage("parent"), ["parent", "root", "child"])
+            self.assertEqual(store.get_session_lineage("parent", include_self=False), ["root", "child", "parent"])
+        finally:
+            store.close()
+
     def test_semantic_search_ranking(self) -> None:
         store = ThoughtStore(embedding_dim=4, vector_backend="numpy")
         try:
@@ -141,6 +249,191 @@ class TestTmsCore(unittest.TestCase):
         finally:
             store.close()
 
+    def test_semantic_search_prefilters_selective_session(self) -> None:
+        store = ThoughtStore(embedding_dim=4, vector_backend="numpy")
+        try:
+            crowd = [
+                Thought(
+                    session_id="crowd",
+                    raw_text=f"near-{i}",
+                    cleaned_text=f"near-{i}",
+                    embedding_vector=[1, 0.01 * i, 0, 0],
+                    embedding_dim=4,
+                )
+                for i in range(30)
+            ]
+            lone = Thought(
+                session_id="lone",
+                raw_text="far",
+                cleaned_text="far",
+                embedding_vector=[0, 0, 1, 0],
+                embedding_dim=4,
+            )
+            store.batch_store([*crowd, lone])
+            # The lone thought ranks outside the unfiltered candidate window but must still be found.
+            results = store.semantic_search(
+                [1, 0, 0, 0], filters=ThoughtFilters(session_id="lone"), limit=1, max_candidates=5
+            )
+            self.assertEqual([r.thought.id for r in results], [lone.id])
+        finally:
+            store.close()
+
+    def test_semantic_search_batch_matches_single_queries(self) -> None:
+        embedder = HashEmbedder(dimension=16)
+        for backend in ("numpy", "faiss"):
+            try:
+                store = ThoughtStore(embedding_dim=16, vector_backend=backend)
+            except RuntimeError:
+                continue
+            try:
+                texts = [f"batch memory {i}" for i in range(40)]
+                store.batch_store(
+                    Thought(
+                        session_id="even" if i % 2 == 0 else "odd",
+                        raw_text=text,
+                        cleaned_text=text,
+                        embedding_vector=vec,
+                        embedding_dim=16,
+                    )
+                    for i, (text, vec) in enumerate(zip(texts, embedder.embed_batch(texts)))
+                )
+                queries = embedder.embed_batch(["batch memory 3", "batch memory 8", "unrelated"])
+                for filters in (None, ThoughtFilters(session_id="odd")):
+                    batched = store.semantic_search_batch(queries, filters=filters, limit=3, alpha=1.0)
+                    single = [store.semantic_search(q, filters=filters, limit=3, alpha=1.0) for q in queries]
+                    self.assertEqual(
+                        [[hit.thought.id for hit in hits] for hits in batched],
+                        [[hit.thought.id for hit in hits] for hits in single],
+                    )
+                self.assertEqual(store.semantic_search_batch([]), [])
+            finally:
+                store.close()
+
+    def test_numpy_int8_scan_matches_float_ranking(self) -> None:
+        if store_module.simsimd is None:
+            self.skipTest("simsimd is not installed")
+        embedder = HashEmbedder(dimension=32)
+        texts = [f"memory item {i}" for i in range(200)]
+        backend = store_module._NumpyVectorBackend(32)
+        backend.build(list(zip(texts, embedder.embed_batch(texts))))
+        backend.upsert(texts[7], embedder.embed_array("replacement"))
+        query = embedder.embed_array("memory item 42")
+        backend.int8_min_rows = 10**9
+        exact = backend.search(query, top_k=5)
+        backend.int8_min_rows = 0
+        approx = backend.search(query, top_k=5)
+        self.assertEqual([tid for tid, _ in approx], [tid for tid, _ in exact])
+        self.assertEqual(approx[0][0], "memory item 42")
+        self.assertEqual(backend.search(embedder.embed_array("replacement"), top_k=1)[0][0], texts[7])
+
+    def test_sqlite_vec_backend_ranking(self) -> None:
+        try:
+            store = ThoughtStore(embedding_dim=4, vector_backend="sqlite-vec")
+        except RuntimeError:
+            self.skipTest("sqlite-vec extension is not loadable in this environment")
+        try:
+            self.assertEqual(store.vector_backend_name, "sqlite-vec")
+            store.batch_store(
+                [
+                    Thought(
+                        session_id="s1",
+                        raw_text=text,
+                        cleaned_text=text,
+                        embedding_vector=vec,
+                        embedding_dim=4,
+                    )
+                    for text, vec in (("alpha", [1, 0, 0, 0]), ("beta", [0, 1, 0, 0]))
+                ]
+            )
+            results = store.semantic_search([1, 0.1, 0, 0], limit=2, alpha=1.0)
+            self.assertEqual([r.thought.raw_text for r in results], ["alpha", "beta"])
+            self.assertAlmostEqual(results[0].semantic_score, 0.995, places=2)
+        finally:
+            store.close()
+
+    def test_faiss_backend_incremental_upsert(self) -> None:
+        try:
+            store = ThoughtStore(embedding_dim=4, vector_backend="faiss")
+        except RuntimeError:
+            self.skipTest("faiss is not installed")
+        try:
+            alpha = Thought(
+                session_id="s1",
+                raw_text="alpha",
+                cleaned_text="alpha",
+                embedding_vector=[1, 0, 0, 0],
+                embedding_dim=4,
+            )
+            store.store(alpha)
+            for i in range(20):
+                store.store(
+                    Thought(
+                        session_id="s1",
+                        raw_text=f"filler-{i}",
+                        cleaned_text=f"filler-{i}",
+                        embedding_vector=[0, 0, 1, float(i)],
+                        embedding_dim=4,
+                    )
+                )
+            self.assertEqual(store.semantic_search([1, 0, 0, 0], limit=1, alpha=1.0)[0].thought.id, alpha.id)
+
+            store.store(alpha.model_copy(update={"embedding_vector": [0, 1, 0, 0]}))
+            top = store.semantic_search([0, 1, 0, 0], limit=1, alpha=1.0)[0]
+            self.assertEqual(top.thought.id, alpha.id)
+            self.assertAlmostEqual(top.semantic_score, 1.0, places=5)
+        finally:
+            store.close()
+
+    def test_hnsw_backend_matches_exact_top_hit(self) -> None:
+        try:
+            store = ThoughtStore(embedding_dim=32, vector_backend="hnsw")
+        except RuntimeError:
+            self.skipTest("faiss is not installed")
+        embedder = HashEmbedder(dimension=32)
+        try:
+            self.assertEqual(store.vector_backend_name, "hnsw")
+            texts = [f"hnsw memory {i}" for i in range(300)]
+            thoughts = [
+                Thought(session_id="s1", raw_text=t, cleaned_text=t, embedding_vector=v, embedding_dim=32)
+                for t, v in zip(texts, embedder.embed_batch(texts))
+            ]
+            store.batch_store(thoughts)
+            for i in (0, 57, 299):
+                top = store.semantic_search(embedder.embed(texts[i]), limit=1, alpha=1.0)[0]
+                self.assertEqual(top.thought.id, thoughts[i].id)
+            store.store(thoughts[3].model_copy(update={"embedding_vector": embedder.embed("moved")}))
+            top = store.semantic_search(embedder.embed("moved"), limit=1, alpha=1.0)[0]
+            self.assertEqual(top.thought.id, thoughts[3].id)
+        finally:
+            store.close()
+
+    def test_auto_backend_falls_back_without_extensions(self) -> None:
+        store = ThoughtStore(embedding_dim=4, vector_backend="auto")
+        try:
+            self.assertIn(store.vector_backend_name, {"faiss", "sqlite-vec", "numpy"})
+        finally:
+            store.close()
+
+    def test_file_store_read_pool_sees_committed_writes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ThoughtStore(Path(tmp) / "pool.sqlite", embedding_dim=4, vector_backend="numpy", read_pool_size=2)
+            try:
+                mode = store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+                self.assertEqual(mode, "wal")
+                thought = Thought(
+                    session_id="pooled",
+                    raw_text="pooled",
+                    cleaned_text="pooled",
+                    embedding_vector=[1, 0, 0, 0],
+                    embedding_dim=4,
+                )
+                store.store(thought)
+                self.assertEqual(store.get_thought_by_id(thought.id).id, thought.id)
+                self.assertEqual(len(store.retrieve(filters=ThoughtFilters(session_id="pooled"))), 1)
+                self.assertEqual(store.semantic_search([1, 0, 0, 0], limit=1)[0].thought.id, thought.id)
+            finally:
+                store.close()
+
     def test_async_methods(self) -> None:
         async def _run() -> None:
             store = ThoughtStore(embedding_dim=4, vector_backend="numpy")
@@ -201,6 +494,26 @@ class TestTmsCore(unittest.TestCase):
         finally:
             store.close()
 
+    def test_parse_thoughts_batch_matches_per_row_parse(self) -> None:
+        embedder = HashEmbedder(dimension=8)
+        rows = [
+            {"raw_output": "A /thought[one] B /thought[two]", "session_id": "s1", "tags": ["t"]},
+            {"raw_output": "no tags", "session_id": "s2"},
+            {"raw_output": "X /thought[a [b] c] Y", "session_id": "s3", "category": "plan", "confidence": 0.5},
+        ]
+        batch = parse_thoughts_batch(rows, embedder=embedder, embedding_dim=8)
+        single = [parse_thoughts(row.pop("raw_output"), embedder=embedder, embedding_dim=8, **row) for row in rows]
+
+        def _summary(result):
+            return result.cleaned_output, result.used_linear_fallback, [
+                (t.session_id, t.category, t.confidence, t.tags, t.raw_text, t.embedding_vector.tolist())
+                for t in result.thoughts
+            ]
+
+        self.assertEqual([_summary(r) for r in batch], [_summary(r) for r in single])
+        with self.assertRaises(ValueError):
+            parse_thoughts_batch([{"raw_output": "x", "session_id": " "}])
+
 
 if __name__ == "__main__":
     unittest.main()
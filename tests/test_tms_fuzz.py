@@ -1,15 +1,17 @@
 import random
 import string
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from thought_wrapper.tms import HashEmbedder, Thought, ThoughtFilters, ThoughtStore
 from thought_wrapper.tms.pipeline import parse_and_store
 
 
+_WORD_ALPHABET = string.ascii_letters + string.digits + "_-."
+
+
 def _random_word(rng: random.Random, min_len: int = 1, max_len: int = 24) -> str:
-    alphabet = string.ascii_letters + string.digits + "_-."
-    size = rng.randint(min_len, max_len)
-    return "".join(rng.choice(alphabet) for _ in range(size))
+    return "".join(rng.choices(_WORD_ALPHABET, k=rng.randint(min_len, max_len)))
 
 
 class TestTmsFuzz(unittest.TestCase):
@@ -40,26 +42,37 @@ class TestTmsFuzz(unittest.TestCase):
 
     def test_randomized_parse_and_store_counts(self) -> None:
         rng = random.Random(20260228)
+        # Cases are generated up front so the sequential RNG stream stays deterministic.
+        cases = []
+        for case_id in range(100):
+            count = rng.randint(0, 8)
+            chunks = [_random_word(rng, 0, 10)]
+            for _ in range(count):
+                content = _random_word(rng, 1, 20).replace("]", "")
+                chunks.append(f"/thought[{content}]")
+                chunks.append(_random_word(rng, 0, 6))
+            cases.append((case_id, "".join(chunks), count))
+
         store = ThoughtStore(embedding_dim=24, vector_backend="numpy")
+
+        def _run_case(case: tuple[int, str, int]) -> int:
+            case_id, raw, _ = case
+            result = parse_and_store(
+                raw,
+                store,
+                session_id=f"case_{case_id}",
+                embedder=HashEmbedder(dimension=24),
+                embedding_dim=24,
+            )
+            return len(result.thoughts)
+
         try:
-            for case_id in range(100):
-                count = rng.randint(0, 8)
-                chunks = [_random_word(rng, 0, 10)]
-                for _ in range(count):
-                    content = _random_word(rng, 1, 20).replace("]", "")
-                    chunks.append(f"/thought[{content}]")
-                    chunks.append(_random_word(rng, 0, 6))
-                raw = "".join(chunks)
-                result = parse_and_store(
-                    raw,
-                    store,
-                    session_id=f"case_{case_id}",
-                    embedder=HashEmbedder(dimension=24),
-                    embedding_dim=24,
-                )
-                self.assertEqual(len(result.thoughts), count)
+            # Concurrent writers against one store exercise its locking, not just the parser.
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                parsed_counts = list(pool.map(_run_case, cases))
+            self.assertEqual(parsed_counts, [count for _, _, count in cases])
             stored = store.retrieve(limit=2000)
-            self.assertGreaterEqual(len(stored), 0)
+            self.assertEqual(len(stored), sum(count for _, _, count in cases))
         finally:
             store.close()
 
@@ -1,4 +1,6 @@
 import asyncio
+import os
+import tempfile
 import unittest
 from datetime import datetime, timedelta, timezone
 
@@ -36,6 +38,16 @@ class TestTmsGraph(unittest.TestCase):
         paths = self.graph.find_paths(t1.id, t2.id, max_depth=2, relations={"temporal-successor"})
         self.assertTrue(paths)
 
+    def test_add_thoughts_matches_sequential_temporal_links(self) -> None:
+        now = datetime.now(timezone.utc)
+        batch = [
+            self._thought(f"bulk-{i}", session_id="bulk", ts=now + timedelta(seconds=i)) for i in range(4)
+        ]
+        self.graph.add_thoughts(batch, semantic_neighbors=0)
+        self.assertEqual(len(self.store.retrieve(filters=ThoughtFilters(session_id="bulk"), limit=10)), 4)
+        paths = self.graph.find_paths(batch[0].id, batch[-1].id, max_depth=3, relations={"temporal-successor"})
+        self.assertEqual(paths, [[t.id for t in batch]])
+
     def test_link_and_find_paths(self) -> None:
         a = self._thought("a", session_id="s")
         b = self._thought("b", session_id="s")
@@ -47,6 +59,55 @@ class TestTmsGraph(unittest.TestCase):
         paths = self.graph.find_paths(a.id, c.id, max_depth=3)
         self.assertEqual(paths[0], [a.id, b.id, c.id])
 
+    def test_find_paths_sees_new_links_and_respects_depth(self) -> None:
+        self.graph.link("a", "b", relation="explicit-reference")
+        self.graph.link("b", "c", relation="explicit-reference")
+        self.assertEqual(self.graph.find_paths("a", "c", max_depth=1), [])
+        self.assertEqual(self.graph.find_paths("a", "c", max_depth=2), [["a", "b", "c"]])
+        self.graph.link("a", "c", relation="semantic-similarity")
+        self.assertEqual(self.graph.find_paths("a", "c", max_depth=2), [["a", "c"], ["a", "b", "c"]])
+        self.assertEqual(
+            self.graph.find_paths("a", "c", max_depth=2, relations={"semantic-similarity"}), [["a", "c"]]
+        )
+        self.assertEqual(self.graph.find_paths("a", "missing"), [])
+
+    def test_graph_queries_see_links_from_other_connections(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "graph.sqlite")
+            store_a = ThoughtStore(db_path=db_path, embedding_dim=16, vector_backend="numpy")
+            store_b = ThoughtStore(db_path=db_path, embedding_dim=16, vector_backend="numpy")
+            try:
+                graph_a, graph_b = ThoughtGraph(store_a), ThoughtGraph(store_b)
+                graph_a.link("x", "y", relation="explicit-reference")
+                self.assertEqual(graph_a.find_paths("x", "z"), [])
+                graph_b.link("y", "z", relation="explicit-reference")
+                self.assertEqual(graph_a.find_paths("x", "z"), [["x", "y", "z"]])
+                # A second graph over the same connection is seen as well.
+                ThoughtGraph(store_a).link("z", "w", relation="explicit-reference")
+                self.assertEqual(graph_a.find_paths("x", "w"), [["x", "y", "z", "w"]])
+                # neighbors() must not walk the snapshot once another connection has linked.
+                graph_b.link("w", "v", relation="explicit-reference")
+                self.assertEqual(graph_a.neighbors("w"), ["v"])
+            finally:
+                store_a.close()
+                store_b.close()
+
+    def test_neighbors_match_with_and_without_csr_snapshot(self) -> None:
+        self.graph.link_many(
+            [
+                ("a", "b", "explicit-reference", 1.0, {}),
+                ("b", "c", "semantic-similarity", 1.0, {}),
+                ("a", "d", "explicit-reference", 1.0, {}),
+            ]
+        )
+        cold = [self.graph.neighbors("a", hops=h) for h in (1, 2)]
+        cold_rel = self.graph.neighbors("a", hops=2, relations={"explicit-reference"})
+        self.graph.find_paths("a", "c")  # materializes the CSR snapshot
+        self.assertEqual([self.graph.neighbors("a", hops=h) for h in (1, 2)], cold)
+        self.assertEqual(self.graph.neighbors("a", hops=2, relations={"explicit-reference"}), cold_rel)
+        self.assertEqual(cold, [["b", "d"], ["b", "d", "c"]])
+        self.assertEqual(self.graph.neighbors("missing"), [])
+
     def test_cluster_by_topic(self) -> None:
         t1 = self._thought("cluster-a1", session_id="s")
         t2 = self._thought("cluster-a2", session_id="s")
@@ -58,6 +119,18 @@ class TestTmsGraph(unittest.TestCase):
         flattened = [set(c) for c in clusters]
         self.assertIn({t1.id, t2.id}, flattened)
 
+    def test_cluster_by_topic_merges_chained_components(self) -> None:
+        t = {name: self._thought(f"chain-{name}", session_id="s") for name in "abcdxyz"}
+        self.graph.add_thoughts(t.values(), semantic_neighbors=0)
+        edges = [("c", "d"), ("a", "b"), ("d", "b"), ("x", "y")]
+        self.graph.link_many([(t[s].id, t[d].id, "semantic-similarity", 0.9, {}) for s, d in edges])
+        self.graph.link(t["y"].id, t["z"].id, relation="explicit-reference")
+        chain = sorted(t[name].id for name in "abcd")
+        clusters = self.graph.cluster_by_topic(min_cluster_size=2)
+        self.assertIn(chain, clusters)
+        self.assertIn(sorted([t["x"].id, t["y"].id]), clusters)
+        self.assertEqual(self.graph.cluster_by_topic(min_cluster_size=3), [chain])
+
     def test_temporal_range(self) -> None:
         now = datetime.now(timezone.utc)
         old = self._thought("old", session_id="s", ts=now - timedelta(hours=2))
@@ -108,6 +181,10 @@ class TestTmsGraph(unittest.TestCase):
             await self.graph.alink(a.id, b.id, relation="explicit-reference")
             paths = await self.graph.afind_paths(a.id, b.id)
             self.assertTrue(paths)
+            batch = [self._thought(f"async-batch-{i}", session_id="a") for i in range(3)]
+            await self.graph.aadd_thoughts(batch, semantic_neighbors=0)
+            await self.graph.alink_many([(b.id, batch[0].id, "explicit-reference", 1.0, {})])
+            self.assertIn(batch[0].id, await self.graph.aneighbors(b.id, hops=1))
 
         asyncio.run(_run())
 
@@ -74,6 +74,7 @@ class TestTmsGraphFuzz(unittest.TestCase):
                 )
 
             modes = ["reasoning", "summarization", "contradiction_detection", "planning"]
+            stored_counts: list[int] = []
             for i in range(30):
                 mode = modes[i % len(modes)]
                 result = engine.reflect(
@@ -82,7 +83,9 @@ class TestTmsGraphFuzz(unittest.TestCase):
                     mode=mode,
                     top_k=6,
                 )
-                self.assertGreaterEqual(len(result.stored_reflections), 1)
+                stored_counts.append(len(result.stored_reflections))
+            # One assertion after the loop; a failure still shows every cycle's count.
+            self.assertNotIn(0, stored_counts, stored_counts)
         finally:
             store.close()
 
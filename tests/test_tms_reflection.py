@@ -2,7 +2,7 @@ import asyncio
 import unittest
 
 from thought_wrapper.tms import HashEmbedder, ReflectionEngine, Thought, ThoughtGraph, ThoughtStore
-from thought_wrapper.tms.reflection import parse_structured_thoughts
+from thought_wrapper.tms.reflection import parse_structured_thoughts, strip_structured_thoughts
 
 
 class TestTmsReflection(unittest.TestCase):
@@ -45,6 +45,25 @@ class TestTmsReflection(unittest.TestCase):
         self.assertEqual(parsed[0].category, "plan")
         self.assertAlmostEqual(parsed[0].confidence, 0.95)
 
+    def test_parse_structured_thoughts_stops_at_first_close_tag(self) -> None:
+        text = (
+            '<thought id="a">x < y\n<b>bold</b></THOUGHT> between '
+            '<thought id="b">second</thought></thought> <thought id="c">unclosed'
+        )
+        parsed = parse_structured_thoughts(text)
+        self.assertEqual([(p.thought_id, p.content) for p in parsed], [("a", "x < y\n<b>bold</b>"), ("b", "second")])
+
+    def test_strip_structured_thoughts(self) -> None:
+        text = 'Intro  \n<thought id="a">hidden</THOUGHT>\n\n\nOutro <thought>open'
+        self.assertEqual(strip_structured_thoughts(text), "Intro\n\nOutro <thought>open")
+        self.assertEqual(strip_structured_thoughts("  plain  "), "plain")
+
+    def test_parse_structured_thoughts_word_boundary_and_unclosed_runs(self) -> None:
+        text = '<thoughts>skip</thoughts> <Thought id="k">kept</thought>' + "<thought>open " * 20000
+        parsed = parse_structured_thoughts(text)
+        self.assertEqual([(p.thought_id, p.content) for p in parsed], [("k", "kept")])
+        self.assertEqual(parse_structured_thoughts("<thought " * 20000 + "</thought>"), [])
+
     def test_reflect_default_cycle(self) -> None:
         self.store.create_session("s1")
         self._seed("s1", "launch readiness requires checklist")
@@ -4,12 +4,22 @@ from __future__ import annotations
 
 import argparse
 import json
+import signal
+import socket
+import socketserver
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
-from thought_wrapper.agent import AgentLoop
-from thought_wrapper.sdk import ThoughtLLM, ThoughtLLMConfig
-from thought_wrapper.tms import HashEmbedder, ReflectionEngine, ThoughtFilters, ThoughtGraph, ThoughtStore
-from thought_wrapper.tms.pipeline import parse_and_store
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+if TYPE_CHECKING:
+    from thought_wrapper.tms import HashEmbedder, ReflectionEngine, ThoughtGraph, ThoughtStore
+
+# thought_wrapper imports are deferred into the commands: a --server-socket client then only
+# pays for stdlib imports, which is the point of forwarding to a hot `serve` process.
 
 
 class _MockEchoClient:
@@ -25,7 +35,33 @@ class _MockEchoClient:
         )
 
 
-def _make_runtime(db_path: Path, embed_dim: int) -> tuple[ThoughtStore, ThoughtGraph, ReflectionEngine, HashEmbedder]:
+_IMPORT_BATCH_SIZE = 1000
+
+
+def _dumps(payload: object) -> str:
+    # Printed output stays ASCII-escaped so any console encoding (e.g. cp1252) can render it.
+    return json.dumps(payload, indent=2)
+
+
+def _loads(data: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_Runtime = tuple["ThoughtStore", "ThoughtGraph", "ReflectionEngine", "HashEmbedder"]
+
+
+def _dumps_line(payload: object) -> bytes:
+    # Compact single-line JSON framing for the serve socket.
+    if orjson is not None:
+        return orjson.dumps(payload) + b"\n"
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _make_runtime(db_path: Path | None, embed_dim: int) -> _Runtime:
+    from thought_wrapper.tms import HashEmbedder, ReflectionEngine, ThoughtGraph, ThoughtStore
+
     store = ThoughtStore(db_path=db_path, embedding_dim=embed_dim, vector_backend="auto")
     graph = ThoughtGraph(store)
     embedder = HashEmbedder(dimension=embed_dim)
@@ -33,10 +69,191 @@ def _make_runtime(db_path: Path, embed_dim: int) -> tuple[ThoughtStore, ThoughtG
     return store, graph, reflection, embedder
 
 
+def _cmd_store(runtime: _Runtime, args: argparse.Namespace) -> Any:
+    from thought_wrapper.tms.pipeline import parse_and_store
+
+    store, graph, _, embedder = runtime
+    raw_text = args.raw_text or ""
+    if args.raw_file:
+        raw_text = Path(args.raw_file).read_text(encoding="utf-8")
+    if not raw_text:
+        raise ValueError("Provide --raw-text or --raw-file")
+    result = parse_and_store(
+        raw_text,
+        store,
+        session_id=args.session,
+        category=args.category,
+        embedder=embedder,
+        embedding_dim=embedder.dimension,
+    )
+    graph.add_thoughts(result.thoughts, store_if_missing=False, semantic_neighbors=0)
+    return {"stored": len(result.thoughts), "cleaned_output": result.cleaned_output}
+
+
+def _cmd_retrieve(runtime: _Runtime, args: argparse.Namespace) -> Any:
+    from thought_wrapper.tms import ThoughtFilters
+
+    store, _, _, embedder = runtime
+    vec = embedder.embed_array(args.query)
+    filters = ThoughtFilters(session_id=args.session)
+    hits = store.semantic_search(vec, filters=filters, limit=args.limit)
+    return [
+        {
+            "id": h.thought.id,
+            "session_id": h.thought.session_id,
+            "category": h.thought.category,
+            "text": h.thought.cleaned_text,
+            "score": h.score,
+        }
+        for h in hits
+    ]
+
+
+def _cmd_reflect(runtime: _Runtime, args: argparse.Namespace) -> Any:
+    reflection = runtime[2]
+    result = reflection.reflect(
+        query=args.query,
+        current_session_id=args.session,
+        mode=args.mode,
+        top_k=args.top_k,
+    )
+    return {
+        "stored_reflections": len(result.stored_reflections),
+        "latency_ms": result.latency_ms,
+        "reflection_text": result.reflection_text,
+    }
+
+
+def _cmd_loop(runtime: _Runtime, args: argparse.Namespace) -> Any:
+    from thought_wrapper.agent import AgentLoop
+    from thought_wrapper.sdk import ThoughtLLM, ThoughtLLMConfig
+
+    store, graph, reflection, embedder = runtime
+    llm = ThoughtLLM(
+        _MockEchoClient(),
+        store=store,
+        graph=graph,
+        reflection_engine=reflection,
+        embedder=embedder,
+        config=ThoughtLLMConfig(model="mock", thought_tagging_enforcement="xml"),
+    )
+    loop = AgentLoop(llm, reflection_frequency=1)
+    turn = loop.run_turn(args.input, session_id=args.session)
+    return {
+        "cleaned_output": turn.completion.cleaned_output,
+        "stored_thoughts": len(turn.completion.stored_thoughts),
+        "reflected": turn.completion.reflection is not None,
+    }
+
+
+def _cmd_import_jsonl(runtime: _Runtime, args: argparse.Namespace) -> Any:
+    from thought_wrapper.tms.pipeline import parse_thoughts_batch
+
+    store, graph, _, embedder = runtime
+    count = 0
+    pending_rows: list[dict] = []
+
+    def _flush() -> int:
+        # One embed_batch call, one store transaction and one graph node/edge pass per batch of rows.
+        results = parse_thoughts_batch(pending_rows, embedder=embedder, embedding_dim=embedder.dimension)
+        pending_rows.clear()
+        thoughts = [thought for result in results for thought in result.thoughts]
+        if thoughts:
+            store.batch_store(thoughts)
+            graph.add_thoughts(thoughts, store_if_missing=False, semantic_neighbors=0)
+        return len(thoughts)
+
+    # Stream JSONL as bytes: memory stays O(batch) and there is no decode/re-encode per line.
+    with Path(args.path).open("rb", buffering=1 << 20) as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            row = _loads(line)
+            pending_rows.append(
+                {
+                    "raw_output": str(row["raw_output"]),
+                    "session_id": str(row["session_id"]),
+                    "category": str(row.get("category", "reasoning")),
+                    "tags": list(row.get("tags", [])),
+                }
+            )
+            if len(pending_rows) >= _IMPORT_BATCH_SIZE:
+                count += _flush()
+    if pending_rows:
+        count += _flush()
+    return {"imported_thoughts": count}
+
+
+_COMMANDS: dict[str, Callable[[_Runtime, argparse.Namespace], Any]] = {
+    "store": _cmd_store,
+    "retrieve": _cmd_retrieve,
+    "reflect": _cmd_reflect,
+    "loop": _cmd_loop,
+    "import-jsonl": _cmd_import_jsonl,
+}
+# Global options stay with the serving process; everything else is forwarded per request.
+_GLOBAL_OPTIONS = frozenset({"db", "embed_dim", "in_memory", "server_socket", "cmd"})
+_PATH_OPTIONS = ("raw_file", "path")
+
+
+def _make_server(socket_path: Path, runtime: _Runtime) -> socketserver.BaseServer:
+    """JSON-lines server over a Unix socket dispatching into the shared runtime."""
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        raise RuntimeError("serve requires Unix domain socket support")
+
+    class _Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    request = _loads(line)
+                    handler = _COMMANDS[request["cmd"]]
+                    response = {"ok": True, "result": handler(runtime, argparse.Namespace(**request["args"]))}
+                except Exception as exc:
+                    response = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+                self.wfile.write(_dumps_line(response))
+                self.wfile.flush()
+
+    if socket_path.is_socket():
+        # Stale socket left by a previous server that did not shut down cleanly.
+        socket_path.unlink()
+    server = socketserver.ThreadingUnixStreamServer(str(socket_path), _Handler)
+    server.daemon_threads = True
+    return server
+
+
+def _forward(socket_path: Path, args: argparse.Namespace) -> Any:
+    payload = {key: value for key, value in vars(args).items() if key not in _GLOBAL_OPTIONS}
+    for key in _PATH_OPTIONS:
+        if payload.get(key) is not None:
+            # The server may run from another working directory.
+            payload[key] = str(Path(payload[key]).resolve())
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        with sock.makefile("rwb") as stream:
+            stream.write(_dumps_line({"cmd": args.cmd, "args": payload}))
+            stream.flush()
+            response = _loads(stream.readline())
+    if not response["ok"]:
+        raise RuntimeError(f"thought_cli server error: {response['error']}")
+    return response["result"]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Thought CLI")
     parser.add_argument("--db", type=Path, default=Path("results/tms_cli.sqlite"))
     parser.add_argument("--embed-dim", type=int, default=384)
+    parser.add_argument(
+        "--in-memory",
+        action="store_true",
+        help="Use a throwaway in-memory SQLite store instead of --db (state is not kept between runs).",
+    )
+    parser.add_argument(
+        "--server-socket",
+        type=Path,
+        help="Forward the command to a running `serve` process instead of opening a runtime here.",
+    )
 
     sub = parser.add_subparsers(dest="cmd", required=True)
 
@@ -64,116 +281,38 @@ def main() -> int:
     import_p = sub.add_parser("import-jsonl", help="Batch import JSONL of raw outputs")
     import_p.add_argument("--path", type=Path, required=True)
 
-    args = parser.parse_args()
+    serve_p = sub.add_parser("serve", help="Keep one runtime hot and serve commands over a Unix socket")
+    serve_p.add_argument("--socket", type=Path, required=True)
 
-    store, graph, reflection, embedder = _make_runtime(args.db, args.embed_dim)
-    try:
-        if args.cmd == "store":
-            raw_text = args.raw_text or ""
-            if args.raw_file:
-                raw_text = args.raw_file.read_text(encoding="utf-8")
-            if not raw_text:
-                raise ValueError("Provide --raw-text or --raw-file")
-            result = parse_and_store(
-                raw_text,
-                store,
-                session_id=args.session,
-                category=args.category,
-                embedder=embedder,
-                embedding_dim=args.embed_dim,
-            )
-            for thought in result.thoughts:
-                graph.add_thought(thought, store_if_missing=False, semantic_neighbors=0)
-            print(json.dumps({"stored": len(result.thoughts), "cleaned_output": result.cleaned_output}, indent=2))
-            return 0
+    args = parser.parse_args()
 
-        if args.cmd == "retrieve":
-            vec = embedder.embed(args.query)
-            filters = ThoughtFilters(session_id=args.session)
-            hits = store.semantic_search(vec, filters=filters, limit=args.limit)
-            payload = [
-                {
-                    "id": h.thought.id,
-                    "session_id": h.thought.session_id,
-                    "category": h.thought.category,
-                    "text": h.thought.cleaned_text,
-                    "score": h.score,
-                }
-                for h in hits
-            ]
-            print(json.dumps(payload, indent=2))
-            return 0
+    if args.cmd != "serve" and args.server_socket is not None:
+        print(_dumps(_forward(args.server_socket, args)))
+        return 0
 
-        if args.cmd == "reflect":
-            result = reflection.reflect(
-                query=args.query,
-                current_session_id=args.session,
-                mode=args.mode,
-                top_k=args.top_k,
-            )
-            print(
-                json.dumps(
-                    {
-                        "stored_reflections": len(result.stored_reflections),
-                        "latency_ms": result.latency_ms,
-                        "reflection_text": result.reflection_text,
-                    },
-                    indent=2,
-                )
-            )
-            return 0
+    runtime = _make_runtime(None if args.in_memory else args.db, args.embed_dim)
+    try:
+        if args.cmd == "serve":
+            server = _make_server(args.socket, runtime)
 
-        if args.cmd == "loop":
-            llm = ThoughtLLM(
-                _MockEchoClient(),
-                store=store,
-                graph=graph,
-                reflection_engine=reflection,
-                embedder=embedder,
-                config=ThoughtLLMConfig(model="mock", thought_tagging_enforcement="xml"),
-            )
-            loop = AgentLoop(llm, reflection_frequency=1)
-            turn = loop.run_turn(args.input, session_id=args.session)
-            print(
-                json.dumps(
-                    {
-                        "cleaned_output": turn.completion.cleaned_output,
-                        "stored_thoughts": len(turn.completion.stored_thoughts),
-                        "reflected": turn.completion.reflection is not None,
-                    },
-                    indent=2,
-                )
-            )
-            return 0
+            def _stop(signum: int, frame: object) -> None:
+                raise KeyboardInterrupt
 
-        if args.cmd == "import-jsonl":
-            count = 0
-            for line in args.path.read_text(encoding="utf-8").splitlines():
-                if not line.strip():
-                    continue
-                row = json.loads(line)
-                session_id = str(row["session_id"])
-                raw_output = str(row["raw_output"])
-                result = parse_and_store(
-                    raw_output,
-                    store,
-                    session_id=session_id,
-                    category=str(row.get("category", "reasoning")),
-                    tags=list(row.get("tags", [])),
-                    embedder=embedder,
-                    embedding_dim=args.embed_dim,
-                )
-                for thought in result.thoughts:
-                    graph.add_thought(thought, store_if_missing=False, semantic_neighbors=0)
-                count += len(result.thoughts)
-            print(json.dumps({"imported_thoughts": count}, indent=2))
+            # Background/daemonized servers get SIGTERM rather than Ctrl-C; exit the same way.
+            signal.signal(signal.SIGTERM, _stop)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                server.server_close()
+                args.socket.unlink(missing_ok=True)
             return 0
-
-        raise ValueError(f"Unsupported command {args.cmd}")
+        print(_dumps(_COMMANDS[args.cmd](runtime, args)))
+        return 0
     finally:
-        store.close()
+        runtime[0].close()
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
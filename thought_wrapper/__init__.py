@@ -7,11 +7,13 @@ from .core import (
     clean_thought_tags_linear,
     parse_and_clean,
     parse_thought_tags,
+    parse_thought_tags_batch,
     parse_thought_tags_linear,
 )
 
 __all__ = [
     "parse_thought_tags",
+    "parse_thought_tags_batch",
     "parse_thought_tags_linear",
     "clean_thought_tags",
     "clean_thought_tags_linear",
@@ -44,6 +46,7 @@ try:
         aparse_and_store,
         build_reflection_prompt,
         parse_structured_thoughts,
+        strip_structured_thoughts,
         parse_and_store as parse_and_store_tms,
     )
 
@@ -58,6 +61,7 @@ try:
         "ThoughtGraph",
         "ReflectionEngine",
         "parse_structured_thoughts",
+        "strip_structured_thoughts",
         "HashEmbedder",
         "SentenceTransformerEmbedder",
         "parse_and_store_tms",
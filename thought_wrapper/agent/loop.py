@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Iterable
+from typing import Iterable, Mapping
 
 from thought_wrapper.sdk import ThoughtCompletionResult, ThoughtLLM
 
@@ -31,11 +33,19 @@ class AgentLoop:
         thought_llm: ThoughtLLM,
         *,
         reflection_frequency: int = 1,
+        max_concurrent: int = 8,
     ) -> None:
+        if max_concurrent <= 0:
+            raise ValueError("max_concurrent must be positive")
         self.thought_llm = thought_llm
         self.reflection_frequency = max(1, reflection_frequency)
+        self.max_concurrent = max_concurrent
         self._turn_counters: dict[str, int] = {}
         self._lock = threading.RLock()
+        # One provider-call limit per event loop (asyncio primitives are loop-bound).
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
 
     def run_turn(
         self,
@@ -45,9 +55,30 @@ class AgentLoop:
         parent_session_id: str | None = None,
         model: str | None = None,
     ) -> AgentTurnResult:
+        return self._complete_turn(
+            user_input,
+            turn_index=self._reserve_turns(session_id, 1),
+            session_id=session_id,
+            parent_session_id=parent_session_id,
+            model=model,
+        )
+
+    def _reserve_turns(self, session_id: str, count: int) -> int:
+        """Claim `count` consecutive turn indices for a session; returns the first."""
         with self._lock:
-            turn_index = self._turn_counters.get(session_id, 0) + 1
-            self._turn_counters[session_id] = turn_index
+            first = self._turn_counters.get(session_id, 0) + 1
+            self._turn_counters[session_id] = first + count - 1
+        return first
+
+    def _complete_turn(
+        self,
+        user_input: str,
+        *,
+        turn_index: int,
+        session_id: str,
+        parent_session_id: str | None,
+        model: str | None,
+    ) -> AgentTurnResult:
         should_reflect = turn_index % self.reflection_frequency == 0
         completion = self.thought_llm.complete(
             user_input,
@@ -82,9 +113,101 @@ class AgentLoop:
             )
         return out
 
+    def run_sessions(
+        self,
+        session_inputs: Mapping[str, Iterable[str]],
+        *,
+        max_workers: int = 8,
+        model: str | None = None,
+    ) -> dict[str, AgentSessionResult]:
+        """Run independent sessions concurrently; turns within a session stay in order."""
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        if len(session_inputs) <= 1 or max_workers == 1:
+            return {
+                session_id: self.run_session(inputs, session_id=session_id, model=model)
+                for session_id, inputs in session_inputs.items()
+            }
+        # Provider calls are network-bound and release the GIL, so threads overlap them.
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(session_inputs))) as pool:
+            futures = {
+                session_id: pool.submit(self.run_session, inputs, session_id=session_id, model=model)
+                for session_id, inputs in session_inputs.items()
+            }
+            return {session_id: future.result() for session_id, future in futures.items()}
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrent)
+        return semaphore
+
+    async def _dispatch(self, func, /, *args, **kwargs):
+        # Every async path runs its provider call through here, so they share one limit.
+        async with self._semaphore():
+            return await asyncio.to_thread(func, *args, **kwargs)
+
     async def arun_turn(self, *args, **kwargs) -> AgentTurnResult:
-        return await asyncio.to_thread(self.run_turn, *args, **kwargs)
+        return await self._dispatch(self.run_turn, *args, **kwargs)
 
-    async def arun_session(self, *args, **kwargs) -> AgentSessionResult:
-        return await asyncio.to_thread(self.run_session, *args, **kwargs)
+    async def arun_session(
+        self,
+        inputs: Iterable[str],
+        *,
+        session_id: str,
+        parent_session_id: str | None = None,
+        model: str | None = None,
+        allow_parallel: bool = False,
+    ) -> AgentSessionResult:
+        """Async run_session; with allow_parallel, independent turns are dispatched concurrently.
 
+        Turn indices are reserved up front in input order, so which turn reflects is fixed.
+        What it reflects over is not: that turn may run before earlier turns have stored their
+        thoughts. All async paths share the loop's `max_concurrent` provider-call limit.
+        """
+        out = AgentSessionResult(session_id=session_id)
+        if not allow_parallel:
+            for text in inputs:
+                out.turns.append(
+                    await self.arun_turn(
+                        text,
+                        session_id=session_id,
+                        parent_session_id=parent_session_id,
+                        model=model,
+                    )
+                )
+            return out
+        texts = list(inputs)
+        first = self._reserve_turns(session_id, len(texts)) if texts else 1
+        turns = await asyncio.gather(
+            *(
+                self._dispatch(
+                    self._complete_turn,
+                    text,
+                    turn_index=first + offset,
+                    session_id=session_id,
+                    parent_session_id=parent_session_id,
+                    model=model,
+                )
+                for offset, text in enumerate(texts)
+            )
+        )
+        out.turns.extend(turns)
+        return out
+
+    async def arun_sessions(
+        self,
+        session_inputs: Mapping[str, Iterable[str]],
+        *,
+        model: str | None = None,
+    ) -> dict[str, AgentSessionResult]:
+        """Async run_sessions; sessions run concurrently, turns within a session stay in order."""
+        results = await asyncio.gather(
+            *(
+                self.arun_session(inputs, session_id=session_id, model=model)
+                for session_id, inputs in session_inputs.items()
+            )
+        )
+        return dict(zip(session_inputs, results))
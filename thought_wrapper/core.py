@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import Dict, Iterable
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, NamedTuple
 
+import numpy as np
 
-@dataclass(frozen=True)
-class _TagMatch:
+
+class _TagMatch(NamedTuple):
     start: int
     end: int
     content: str
@@ -19,11 +21,38 @@ def _validate_tag_name(tag_name: str) -> None:
         raise ValueError("tag_name must be a non-empty string")
 
 
+_EXCESS_NEWLINES = re.compile(r"\n{3,}")
+
+
+def _collapse_whitespace(text: str) -> str:
+    """Trim blanks around newlines, cap blank-line runs at one, and strip the ends."""
+    if "\n" not in text:
+        # Every pattern below needs a newline; single-line text only needs the strip.
+        return text.strip()
+    # Per-line trim via str.strip is one C pass; a `[ \t]+\n` scan retries at every blank.
+    text = "\n".join([line.strip(" \t") for line in text.split("\n")])
+    if "\n\n\n" in text:
+        text = _EXCESS_NEWLINES.sub("\n\n", text)
+    return text.strip()
+
+
+@lru_cache(maxsize=64)
+def _tag_pattern(tag_name: str) -> re.Pattern[str]:
+    # `[^\]]*` is the same language as a lazy `.*?` up to the first `]` under DOTALL,
+    # but matches in one forward pass without per-character backtracking.
+    escaped = re.escape(tag_name)
+    return re.compile(rf"/{escaped}\[([^\]]*)\]")
+
+
+# Every built-in caller uses the default tag; skip the lru_cache key hashing for it.
+_DEFAULT_TAG_PATTERN = _tag_pattern("thought")
+
+
 def parse_thought_tags(text: str, tag_name: str = "thought") -> Dict[str, str]:
     """Extracts /<tag_name>[content] markers into a hash map (regex baseline)."""
     _validate_tag_name(tag_name)
-    pattern = rf"/{re.escape(tag_name)}\[(.*?)\]"
-    matches = re.findall(pattern, text, flags=re.DOTALL)
+    pattern = _DEFAULT_TAG_PATTERN if tag_name == "thought" else _tag_pattern(tag_name)
+    matches = pattern.findall(text)
     thoughts: Dict[str, str] = {}
     for idx, content in enumerate(matches):
         key = f"{tag_name}_{idx}"
@@ -31,42 +60,106 @@ def parse_thought_tags(text: str, tag_name: str = "thought") -> Dict[str, str]:
     return thoughts
 
 
+def parse_thought_tags_batch(texts: Iterable[str], tag_name: str = "thought") -> list[Dict[str, str]]:
+    """parse_thought_tags over many texts; validation, pattern lookup and key strings are shared."""
+    _validate_tag_name(tag_name)
+    pattern = _DEFAULT_TAG_PATTERN if tag_name == "thought" else _tag_pattern(tag_name)
+    findall = pattern.findall
+    keys: list[str] = []
+    out: list[Dict[str, str]] = []
+    for text in texts:
+        matches = findall(text)
+        for idx in range(len(keys), len(matches)):
+            keys.append(f"{tag_name}_{idx}")
+        out.append(dict(zip(keys, map(str.strip, matches))))
+    return out
+
+
+def _scan_tags(text: str, tag_name: str) -> tuple[list[str], str]:
+    """One regex pass yielding both the raw tag contents and the cleaned text."""
+    if f"/{tag_name}[" not in text:
+        # No marker means nothing to remove (e.g. re-cleaning already clean output).
+        return [], _collapse_whitespace(text)
+    # split on the one-group pattern alternates gap, content, gap, ... in a single C pass.
+    pattern = _DEFAULT_TAG_PATTERN if tag_name == "thought" else _tag_pattern(tag_name)
+    parts = pattern.split(text)
+    if len(parts) == 1:
+        return [], _collapse_whitespace(text)
+    gaps = parts[0::2]
+    # Each marker plus the whitespace run on either side becomes one newline, which is
+    # what stripping the gaps does (the old `\s*` prefix regex retried at every char).
+    pieces = [gaps[0].rstrip(), *[gap.strip() for gap in gaps[1:-1]], gaps[-1].lstrip()]
+    return parts[1::2], _collapse_whitespace("\n".join(pieces))
+
+
 def clean_thought_tags(text: str, tag_name: str = "thought") -> str:
     """Removes /<tag_name>[...] markers and collapses surrounding whitespace."""
     _validate_tag_name(tag_name)
-    pattern = rf"\s*/{re.escape(tag_name)}\[.*?\]\s*"
-    cleaned = re.sub(pattern, "\n", text, flags=re.DOTALL)
-    cleaned = re.sub(r"[ \t]+\n", "\n", cleaned)
-    cleaned = re.sub(r"\n[ \t]+", "\n", cleaned)
-    return re.sub(r"\n{3,}", "\n\n", cleaned).strip()
+    return _scan_tags(text, tag_name)[1]
+
+
+def _bracket_depth_index(text: str) -> Callable[[int], int]:
+    """Index bracket depths once; returns a lookup from a tag body offset to its closing `]` (or -1).
+
+    A tag closes at the first `]` after its body that returns to the depth before its `[`.
+    """
+    # UTF-32 code units index exactly like str offsets (surrogatepass keeps lone surrogates
+    # as one unit each), so the bracket walk is vectorized.
+    codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    positions = np.flatnonzero((codes == 0x5B) | (codes == 0x5D))
+    is_open = codes[positions] == 0x5B
+    depth_after = np.cumsum(np.where(is_open, 1, -1))
+    openers = positions[is_open].tolist()
+    opener_depth = depth_after[is_open].tolist()
+    # `]` positions sorted by (depth after them, offset); each depth owns one contiguous run.
+    closer_depth = depth_after[~is_open]
+    order = np.argsort(closer_depth, kind="stable")
+    closers = positions[~is_open][order].tolist()
+    depths, starts = np.unique(closer_depth[order], return_index=True)
+    ends = [*starts[1:].tolist(), len(closers)]
+    runs = dict(zip(depths.tolist(), zip(starts.tolist(), ends)))
+
+    def close_for(body: int) -> int:
+        lo, hi = runs.get(opener_depth[bisect_left(openers, body - 1)] - 1, (0, 0))
+        pos = bisect_left(closers, body, lo, hi)
+        return closers[pos] if pos < hi else -1
+
+    return close_for
 
 
 def _iter_tag_matches_linear(text: str, tag_name: str) -> Iterable[_TagMatch]:
     marker = f"/{tag_name}["
     marker_len = len(marker)
     scan_idx = 0
+    close_for: Callable[[int], int] | None = None
 
-    while scan_idx < len(text):
+    while True:
         start = text.find(marker, scan_idx)
         if start < 0:
             break
 
-        cursor = start + marker_len
-        depth = 1
-        while cursor < len(text):
-            char = text[cursor]
-            if char == "[":
-                depth += 1
-            elif char == "]":
-                depth -= 1
-                if depth == 0:
-                    yield _TagMatch(start=start, end=cursor + 1, content=text[start + marker_len : cursor])
-                    scan_idx = cursor + 1
-                    break
-            cursor += 1
-        else:
+        body = start + marker_len
+        if close_for is None:
+            close = text.find("]", body)
+            if close < 0:
+                # Unclosed tag: skip current slash and continue scanning.
+                scan_idx = start + 1
+                continue
+            if text.find("[", body, close) < 0:
+                # Common case: no nested brackets, so the first `]` closes the tag.
+                yield _TagMatch(start, close + 1, text[body:close])
+                scan_idx = close + 1
+                continue
+            # Nested: index depths once; later tags then resolve by bisect instead of
+            # rescanning the tail with find (quadratic over runs of unclosed markers).
+            close_for = _bracket_depth_index(text)
+        cursor = close_for(body)
+        if cursor < 0:
             # Unclosed tag: skip current slash and continue scanning.
             scan_idx = start + 1
+            continue
+        yield _TagMatch(start, cursor + 1, text[body:cursor])
+        scan_idx = cursor + 1
 
 
 def parse_thought_tags_linear(text: str, tag_name: str = "thought") -> Dict[str, str]:
@@ -83,7 +176,7 @@ def clean_thought_tags_linear(text: str, tag_name: str = "thought") -> str:
     _validate_tag_name(tag_name)
     matches = list(_iter_tag_matches_linear(text, tag_name))
     if not matches:
-        return re.sub(r"\n{3,}", "\n\n", text).strip()
+        return _EXCESS_NEWLINES.sub("\n\n", text).strip()
 
     out_parts = []
     cursor = 0
@@ -93,11 +186,7 @@ def clean_thought_tags_linear(text: str, tag_name: str = "thought") -> str:
         cursor = match.end
     out_parts.append(text[cursor:])
 
-    cleaned = "".join(out_parts)
-    cleaned = re.sub(r"[ \t]+\n", "\n", cleaned)
-    cleaned = re.sub(r"\n[ \t]+", "\n", cleaned)
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
-    return cleaned.strip()
+    return _collapse_whitespace("".join(out_parts))
 
 
 def parse_and_clean(text: str, tag_name: str = "thought", linear: bool = False) -> tuple[str, Dict[str, str]]:
@@ -106,7 +195,7 @@ def parse_and_clean(text: str, tag_name: str = "thought", linear: bool = False)
         thoughts = parse_thought_tags_linear(text=text, tag_name=tag_name)
         cleaned = clean_thought_tags_linear(text=text, tag_name=tag_name)
         return cleaned, thoughts
-    thoughts = parse_thought_tags(text=text, tag_name=tag_name)
-    cleaned = clean_thought_tags(text=text, tag_name=tag_name)
-    return cleaned, thoughts
+    _validate_tag_name(tag_name)
+    contents, cleaned = _scan_tags(text, tag_name)
+    return cleaned, {f"{tag_name}_{idx}": content.strip() for idx, content in enumerate(contents)}
 
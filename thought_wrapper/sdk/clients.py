@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import http.client
 import json
 import os
+import threading
 import urllib.error
+import urllib.parse
 import urllib.request
 from dataclasses import dataclass
 from typing import Protocol
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 class LLMClient(Protocol):
     provider_name: str
@@ -25,24 +33,50 @@ class LLMClient(Protocol):
         ...
 
 
-def _http_json(
-    url: str,
-    payload: dict,
-    *,
-    headers: dict[str, str],
-    timeout_s: float = 60.0,
-) -> dict:
-    body = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        url=url,
-        data=body,
-        headers={"Content-Type": "application/json", **headers},
-        method="POST",
-    )
+_KEEPALIVE = threading.local()
+
+
+def _dumps_body(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    # Compact separators: no whitespace bytes on the wire.
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _loads_body(raw: bytes) -> dict:
+    # Both decoders take UTF-8 bytes directly; no intermediate str copy.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _keepalive_connection(scheme: str, netloc: str, timeout_s: float) -> http.client.HTTPConnection:
+    # One persistent connection per (thread, host): skips TCP/TLS setup on repeat calls.
+    pool = _KEEPALIVE.__dict__.setdefault("conns", {})
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conn_cls(netloc, timeout=timeout_s)
+        pool[(scheme, netloc)] = conn
+    conn.timeout = timeout_s
+    if conn.sock is not None:
+        # The constructor timeout only applies at connect time.
+        conn.sock.settimeout(timeout_s)
+    return conn
+
+
+def _drop_keepalive_connection(scheme: str, netloc: str) -> None:
+    conn = _KEEPALIVE.__dict__.get("conns", {}).pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def _http_json_urllib(url: str, body: bytes, headers: dict[str, str], timeout_s: float) -> dict:
+    req = urllib.request.Request(url=url, data=body, headers=headers, method="POST")
     try:
         with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-            raw = resp.read().decode("utf-8")
-        return json.loads(raw)
+            raw = resp.read()
+        return _loads_body(raw)
     except urllib.error.HTTPError as exc:  # pragma: no cover - network dependent
         msg = exc.read().decode("utf-8", errors="ignore")
         raise RuntimeError(f"HTTP {exc.code} from {url}: {msg}") from exc
@@ -50,6 +84,49 @@ def _http_json(
         raise RuntimeError(f"Network error calling {url}: {exc}") from exc
 
 
+def _http_json(
+    url: str,
+    payload: dict,
+    *,
+    headers: dict[str, str],
+    timeout_s: float = 60.0,
+) -> dict:
+    body = _dumps_body(payload)
+    all_headers = {"Content-Type": "application/json", **headers}
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or parts.scheme in urllib.request.getproxies():
+        # Proxied (or unusual) URLs keep urllib's proxy/redirect handling.
+        return _http_json_urllib(url, body, all_headers, timeout_s)
+
+    target = parts.path or "/"
+    if parts.query:
+        target = f"{target}?{parts.query}"
+    for attempt in range(2):
+        conn = _keepalive_connection(parts.scheme, parts.netloc, timeout_s)
+        reused = conn.sock is not None
+        sent = False
+        try:
+            conn.request("POST", target, body=body, headers=all_headers)
+            sent = True
+            resp = conn.getresponse()
+            raw = resp.read()
+        except (OSError, http.client.HTTPException) as exc:
+            _drop_keepalive_connection(parts.scheme, parts.netloc)
+            # Replay the POST only when a reused idle socket turned out to be stale: it failed
+            # while sending, or closed before any response byte. Later failures may follow a
+            # request the server already acted on.
+            stale = reused and (not sent or isinstance(exc, http.client.RemoteDisconnected))
+            if stale and not attempt:
+                continue
+            raise RuntimeError(f"Network error calling {url}: {exc}") from exc
+        if resp.will_close:
+            _drop_keepalive_connection(parts.scheme, parts.netloc)
+        if resp.status >= 400:
+            raise RuntimeError(f"HTTP {resp.status} from {url}: {raw.decode('utf-8', errors='ignore')}")
+        return _loads_body(raw)
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
 @dataclass
 class OpenAIClient:
     api_key: str | None = None
@@ -30,6 +30,7 @@ class ThoughtCompletionResult:
     provider: str = ""
     latency_ms: float = 0.0
     prompt_used: str = ""
+    cache_hit: bool = False
 
 
 @dataclass
@@ -44,4 +45,7 @@ class ThoughtLLMConfig:
     reflect_enabled: bool = True
     recall_top_k: int = 8
     reflection_mode: Literal["reasoning", "summarization", "contradiction_detection", "planning"] = "reasoning"
+    # Semantic response cache: 0 disables; hits need cosine >= threshold within the same session/settings.
+    semantic_cache_size: int = 0
+    semantic_cache_threshold: float = 0.95
 
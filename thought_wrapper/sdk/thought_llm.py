@@ -3,20 +3,24 @@
 from __future__ import annotations
 
 import asyncio
-import re
 import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from typing import Sequence
 
+import numpy as np
+
 from thought_wrapper.tms import (
     HashEmbedder,
     ReflectionEngine,
     Thought,
     ThoughtGraph,
     ThoughtStore,
+    embed_vector,
     parse_and_store,
     parse_structured_thoughts,
+    strip_structured_thoughts,
 )
 from thought_wrapper.tms.prompt_helpers import SYSTEM_PROMPT_CODEX3, THOUGHT_TAG_GUIDANCE
 
@@ -24,15 +28,50 @@ from .clients import LLMClient
 from .models import ThoughtCompletionResult, ThoughtLLMConfig
 
 
-_XML_THOUGHT_RE = re.compile(r"<thought\b[^>]*>.*?</thought>", flags=re.IGNORECASE | re.DOTALL)
+# System-prompt suffix per enforcement mode, built once instead of per completion.
+_ENFORCEMENT_SUFFIXES = {
+    "xml": "\n" + THOUGHT_TAG_GUIDANCE + "\nUse only XML <thought ...> tags for intermediate reasoning.",
+    "slash": "\nFor intermediate reasoning, use /thought[...] tags. Keep final answer outside those tags.",
+}
+_DEFAULT_ENFORCEMENT_SUFFIX = "\nPrefer XML <thought> tags; /thought[...] is acceptable fallback."
+# Complete system prompts for the default (no caller override) case, per enforcement mode.
+_DEFAULT_SYSTEM_PROMPTS = {mode: SYSTEM_PROMPT_CODEX3 + suffix for mode, suffix in _ENFORCEMENT_SUFFIXES.items()}
+_DEFAULT_FALLBACK_SYSTEM_PROMPT = SYSTEM_PROMPT_CODEX3 + _DEFAULT_ENFORCEMENT_SUFFIX
+
+
+class _ScopeVectors:
+    """Unit prompt vectors of one cache scope, stored as rows of a growable matrix."""
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._matrix: np.ndarray | None = None
 
+    def add(self, prompt: str, vector: np.ndarray) -> None:
+        row = len(self.prompts)
+        if self._matrix is None:
+            self._matrix = np.empty((4, vector.shape[0]), dtype=np.float32)
+        elif row == self._matrix.shape[0]:
+            self._matrix = np.concatenate([self._matrix, np.empty_like(self._matrix)])
+        self._matrix[row] = vector
+        self._rows[prompt] = row
+        self.prompts.append(prompt)
 
-def _strip_xml_thought_tags(text: str) -> str:
-    cleaned = _XML_THOUGHT_RE.sub("\n", text)
-    cleaned = re.sub(r"[ \t]+\n", "\n", cleaned)
-    cleaned = re.sub(r"\n[ \t]+", "\n", cleaned)
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
-    return cleaned.strip()
+    def remove(self, prompt: str) -> None:
+        # Swap the last row into the freed slot so rows stay contiguous.
+        row = self._rows.pop(prompt)
+        last = len(self.prompts) - 1
+        if row != last:
+            moved = self.prompts[last]
+            self._matrix[row] = self._matrix[last]
+            self.prompts[row] = moved
+            self._rows[moved] = row
+        self.prompts.pop()
+
+    def best_match(self, vector: np.ndarray) -> tuple[str, float]:
+        scores = self._matrix[: len(self.prompts)] @ vector
+        best = int(np.argmax(scores))
+        return self.prompts[best], float(scores[best])
 
 
 @dataclass
@@ -69,6 +108,10 @@ class ThoughtLLM:
         self.config = config
         self._calls = 0
         self._lock = threading.RLock()
+        # (scope, user_prompt) -> result in LRU order; scope pins session and prompt settings.
+        self._semantic_cache: OrderedDict[tuple[tuple, str], ThoughtCompletionResult] = OrderedDict()
+        # scope -> unit prompt vectors of that scope's entries, kept stacked for one matmul per lookup.
+        self._semantic_cache_vectors: dict[tuple, _ScopeVectors] = {}
 
     def complete(
         self,
@@ -86,11 +129,48 @@ class ThoughtLLM:
         reflection_mode: str | None = None,
         thought_tagging_enforcement: str | None = None,
         recall_top_k: int | None = None,
+        no_cache: bool = False,
     ) -> ThoughtCompletionResult:
         """Run model completion and integrate output into thought memory."""
         if not session_id.strip():
             raise ValueError("session_id must be non-empty")
 
+        enforcement = thought_tagging_enforcement or self.config.thought_tagging_enforcement
+        # Embedded once: feeds both the response cache and memory recall.
+        query_vec = embed_vector(self.embedder, user_prompt)
+        use_cache = self.config.semantic_cache_size > 0 and not no_cache
+        if use_cache:
+            start = time.perf_counter()
+            # Every argument that shapes the prompt, the stored thoughts or the result.
+            cache_scope = (
+                session_id,
+                parent_session_id,
+                system_prompt,
+                model or self.config.model,
+                self.config.temperature if temperature is None else temperature,
+                self.config.max_tokens if max_tokens is None else max_tokens,
+                enforcement,
+                recall_top_k or self.config.recall_top_k,
+                category,
+                tuple(tags or ()),
+                reflection_mode or self.config.reflection_mode,
+            )
+            prompt_vec = np.asarray(query_vec, dtype=np.float32)
+            norm = float(np.linalg.norm(prompt_vec))
+            if norm > 0:
+                prompt_vec = prompt_vec / norm
+            cached = self._semantic_cache_lookup(cache_scope, user_prompt, prompt_vec)
+            if cached is not None:
+                # Served without a model call: nothing is stored or reflected, the session
+                # is not (re)created and the hit does not count toward reflection_frequency.
+                return replace(
+                    cached,
+                    stored_thoughts=[],
+                    reflection=None,
+                    latency_ms=(time.perf_counter() - start) * 1000.0,
+                    cache_hit=True,
+                )
+
         with self._lock:
             self._calls += 1
             call_index = self._calls
@@ -101,7 +181,6 @@ class ThoughtLLM:
             self.store.create_session(session_id)
 
         recall_k = recall_top_k or self.config.recall_top_k
-        query_vec = self.embedder.embed(user_prompt)
         current_hits = self.store.semantic_search(
             query_vec,
             filters=None,
@@ -125,22 +204,10 @@ class ThoughtLLM:
             f"- ({t.session_id}/{t.category}/{t.confidence:.2f}) {t.cleaned_text}" for t in recalled
         )
 
-        enforcement = thought_tagging_enforcement or self.config.thought_tagging_enforcement
-        default_system = system_prompt or SYSTEM_PROMPT_CODEX3
-        if enforcement == "xml":
-            enforced = (
-                default_system
-                + "\n"
-                + THOUGHT_TAG_GUIDANCE
-                + "\nUse only XML <thought ...> tags for intermediate reasoning."
-            )
-        elif enforcement == "slash":
-            enforced = (
-                default_system
-                + "\nFor intermediate reasoning, use /thought[...] tags. Keep final answer outside those tags."
-            )
+        if system_prompt:
+            enforced = system_prompt + _ENFORCEMENT_SUFFIXES.get(enforcement, _DEFAULT_ENFORCEMENT_SUFFIX)
         else:
-            enforced = default_system + "\nPrefer XML <thought> tags; /thought[...] is acceptable fallback."
+            enforced = _DEFAULT_SYSTEM_PROMPTS.get(enforcement, _DEFAULT_FALLBACK_SYSTEM_PROMPT)
 
         final_user_prompt = user_prompt
         if recall_context:
@@ -166,8 +233,8 @@ class ThoughtLLM:
             enforcement=enforcement,
         )
 
-        for thought in stored_thoughts:
-            self.graph.add_thought(thought, store_if_missing=False, semantic_neighbors=0, temporal_link=True)
+        # One node transaction and one edge transaction for the whole turn.
+        self.graph.add_thoughts(stored_thoughts, store_if_missing=False, semantic_neighbors=0, temporal_link=True)
 
         do_reflect = self.config.reflect_enabled if reflect is None else reflect
         reflection = None
@@ -180,7 +247,7 @@ class ThoughtLLM:
             )
 
         latency_ms = (time.perf_counter() - start) * 1000.0
-        return ThoughtCompletionResult(
+        result = ThoughtCompletionResult(
             raw_output=raw_output,
             cleaned_output=cleaned_output,
             stored_thoughts=stored_thoughts,
@@ -191,10 +258,46 @@ class ThoughtLLM:
             latency_ms=latency_ms,
             prompt_used=enforced,
         )
+        if use_cache:
+            with self._lock:
+                key = (cache_scope, user_prompt)
+                if key not in self._semantic_cache:
+                    self._semantic_cache_vectors.setdefault(cache_scope, _ScopeVectors()).add(user_prompt, prompt_vec)
+                self._semantic_cache[key] = result
+                self._semantic_cache.move_to_end(key)
+                while len(self._semantic_cache) > self.config.semantic_cache_size:
+                    (scope, prompt), _ = self._semantic_cache.popitem(last=False)
+                    vectors = self._semantic_cache_vectors[scope]
+                    vectors.remove(prompt)
+                    if not vectors.prompts:
+                        del self._semantic_cache_vectors[scope]
+        return result
 
     async def acomplete(self, *args, **kwargs) -> ThoughtCompletionResult:
         return await asyncio.to_thread(self.complete, *args, **kwargs)
 
+    def clear_semantic_cache(self) -> None:
+        with self._lock:
+            self._semantic_cache.clear()
+            self._semantic_cache_vectors.clear()
+
+    def _semantic_cache_lookup(
+        self, scope: tuple, user_prompt: str, prompt_vec: np.ndarray
+    ) -> ThoughtCompletionResult | None:
+        with self._lock:
+            exact = self._semantic_cache.get((scope, user_prompt))
+            if exact is not None:
+                self._semantic_cache.move_to_end((scope, user_prompt))
+                return exact
+            vectors = self._semantic_cache_vectors.get(scope)
+            if vectors is None:
+                return None
+            prompt, score = vectors.best_match(prompt_vec)
+            if score < self.config.semantic_cache_threshold:
+                return None
+            self._semantic_cache.move_to_end((scope, prompt))
+            return self._semantic_cache[(scope, prompt)]
+
     def _ingest_output(
         self,
         raw_output: str,
@@ -204,14 +307,19 @@ class ThoughtLLM:
         tags: list[str],
         enforcement: str,
     ) -> tuple[str, list[Thought]]:
-        parsed_xml = parse_structured_thoughts(raw_output)
+        # Slash mode never ingests XML tags, so skip the XML scan entirely.
+        parsed_xml = [] if enforcement == "slash" else parse_structured_thoughts(raw_output)
         use_xml = enforcement == "xml" or (enforcement == "auto" and bool(parsed_xml))
 
         if use_xml and parsed_xml:
+            contents = [item.content.strip() for item in parsed_xml]
+            embed_batch = getattr(self.embedder, "embed_batch", None)
+            if embed_batch is not None and len(contents) > 1:
+                vectors = embed_batch(contents)
+            else:
+                vectors = [embed_vector(self.embedder, content) for content in contents]
             thoughts: list[Thought] = []
-            for item in parsed_xml:
-                content = item.content.strip()
-                vec = self.embedder.embed(content)
+            for item, content, vec in zip(parsed_xml, contents, vectors):
                 thoughts.append(
                     Thought(
                         id=item.thought_id,
@@ -227,7 +335,7 @@ class ThoughtLLM:
                 )
             if thoughts:
                 self.store.batch_store(thoughts)
-            return _strip_xml_thought_tags(raw_output), thoughts
+            return strip_structured_thoughts(raw_output), thoughts
 
         parsed = parse_and_store(
             raw_output,
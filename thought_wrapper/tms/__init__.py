@@ -1,9 +1,9 @@
 """Thought Memory System exports."""
 
-from .embeddings import HashEmbedder, SentenceTransformerEmbedder, resolve_embedder
+from .embeddings import HashEmbedder, SentenceTransformerEmbedder, embed_vector, resolve_embedder
 from .graph import ThoughtEdge, ThoughtGraph
 from .models import ParseStoreResult, ReflectionResult, ScoredThought, Thought, ThoughtFilters
-from .pipeline import aparse_and_store, parse_and_store
+from .pipeline import aparse_and_store, parse_and_store, parse_thoughts, parse_thoughts_batch
 from .prompt_helpers import (
     EXAMPLE_CONVERSATION_LOOP,
     REFLECTION_TEMPLATES,
@@ -12,7 +12,7 @@ from .prompt_helpers import (
     THOUGHT_TAG_GUIDANCE,
     build_reflection_prompt,
 )
-from .reflection import ReflectionEngine, parse_structured_thoughts
+from .reflection import ReflectionEngine, parse_structured_thoughts, strip_structured_thoughts
 from .store import ThoughtStore
 
 __all__ = [
@@ -26,9 +26,13 @@ __all__ = [
     "ThoughtGraph",
     "ReflectionEngine",
     "parse_structured_thoughts",
+    "strip_structured_thoughts",
     "HashEmbedder",
     "SentenceTransformerEmbedder",
     "resolve_embedder",
+    "embed_vector",
+    "parse_thoughts",
+    "parse_thoughts_batch",
     "parse_and_store",
     "aparse_and_store",
     "THOUGHT_TAG_GUIDANCE",
@@ -5,10 +5,13 @@ from __future__ import annotations
 import hashlib
 import math
 from dataclasses import dataclass
-from typing import Protocol
+from functools import lru_cache
+from typing import Protocol, Sequence
 
 import numpy as np
 
+_LANES_PER_DIGEST = hashlib.sha256().digest_size // np.dtype(np.uint16).itemsize
+
 
 class Embedder(Protocol):
     """Embedding provider interface."""
@@ -21,6 +24,50 @@ class Embedder(Protocol):
         ...
 
 
+def embed_vector(embedder: Embedder, text: str) -> np.ndarray:
+    """Embed text as a float32 array, zero-copy when the embedder provides embed_array()."""
+    embed_array = getattr(embedder, "embed_array", None)
+    if embed_array is not None:
+        return embed_array(text)
+    return np.asarray(embedder.embed(text), dtype=np.float32)
+
+
+@lru_cache(maxsize=64)
+def _digest_offsets(dimension: int) -> tuple[bytes, ...]:
+    return tuple(offset.to_bytes(4, "little") for offset in range(0, dimension, _LANES_PER_DIGEST))
+
+
+def _hash_embed_rows(texts: Sequence[str], dimension: int) -> np.ndarray:
+    # One sha256 digest yields 16 uint16 lanes; hash all blocks up front and convert once.
+    offsets = _digest_offsets(dimension)
+    blocks: list[bytes] = []
+    for text in texts:
+        # Hash the text once and fork the state per offset: sha256(text + offset) without rehashing text.
+        prefix = hashlib.sha256(text.encode("utf-8"))
+        for offset in offsets:
+            block = prefix.copy()
+            block.update(offset)
+            blocks.append(block.digest())
+    digest = b"".join(blocks)
+    lanes = len(offsets) * _LANES_PER_DIGEST
+    out = np.frombuffer(digest, dtype=np.uint16).reshape(len(texts), lanes)[:, :dimension].astype(np.float32)
+    # In place: same ops and rounding as (ints / 65535) * 2 - 1 without three temporaries.
+    out /= 65535.0
+    out *= 2.0
+    out -= 1.0
+
+    # Exactly what np.linalg.norm(axis=1) computes for real input, minus its dispatch overhead.
+    norms = np.sqrt(np.add.reduce(out * out, axis=1, keepdims=True))
+    norms[norms == 0] = 1.0
+    out /= norms
+    return out
+
+
+@lru_cache(maxsize=8192)
+def _hash_embed_bytes(text: str, dimension: int) -> bytes:
+    return _hash_embed_rows((text,), dimension).tobytes()
+
+
 @dataclass
 class HashEmbedder:
     """Deterministic offline fallback embedder (no external model dependencies)."""
@@ -28,25 +75,33 @@ class HashEmbedder:
     dimension: int = 384
 
     def embed(self, text: str) -> list[float]:
+        return self.embed_array(text).tolist()
+
+    def embed_array(self, text: str) -> np.ndarray:
+        """embed() as a read-only zero-copy float32 view over the cached vector."""
         if self.dimension <= 0:
             raise ValueError("dimension must be positive")
+        # Cached as immutable float32 bytes; callers get a read-only zero-copy view.
+        return np.frombuffer(_hash_embed_bytes(text, self.dimension), dtype=np.float32)
 
-        out = np.zeros(self.dimension, dtype=np.float32)
-        seed = text.encode("utf-8")
-        offset = 0
-
-        while offset < self.dimension:
-            block = hashlib.sha256(seed + offset.to_bytes(4, "little")).digest()
-            ints = np.frombuffer(block, dtype=np.uint16).astype(np.float32)
-            floats = (ints / 65535.0) * 2.0 - 1.0
-            take = min(len(floats), self.dimension - offset)
-            out[offset : offset + take] = floats[:take]
-            offset += take
-
-        norm = float(np.linalg.norm(out))
-        if norm > 0:
-            out /= norm
-        return out.astype(np.float32).tolist()
+    def embed_batch(self, texts: Sequence[str]) -> list[np.ndarray]:
+        """Embed many texts with one vectorized pass; rows match embed_array() exactly."""
+        if self.dimension <= 0:
+            raise ValueError("dimension must be positive")
+        if not texts:
+            return []
+        # Hash each distinct text once; repeated texts reuse the row.
+        unique = list(dict.fromkeys(texts))
+        if len(unique) == len(texts):
+            return list(_hash_embed_rows(texts, self.dimension))
+        rows = _hash_embed_rows(unique, self.dimension)
+        position = {text: idx for idx, text in enumerate(unique)}
+        return list(rows[[position[text] for text in texts]])
+
+    @staticmethod
+    def cache_info():
+        """Hit/miss statistics of the process-wide hash embedding cache."""
+        return _hash_embed_bytes.cache_info()
 
 
 class SentenceTransformerEmbedder:
@@ -56,6 +111,7 @@ class SentenceTransformerEmbedder:
         self,
         model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
         dimension: int = 384,
+        cache_size: int = 4096,
     ) -> None:
         try:
             from sentence_transformers import SentenceTransformer  # type: ignore
@@ -68,29 +124,42 @@ class SentenceTransformerEmbedder:
         self._dimension = int(dimension)
         if self._dimension <= 0:
             raise ValueError("dimension must be positive")
+        # Model inference dominates; memoize per instance as immutable float32 bytes.
+        self._embed_bytes = lru_cache(maxsize=cache_size)(self._encode_bytes)
 
     @property
     def dimension(self) -> int:
         return self._dimension
 
-    def embed(self, text: str) -> list[float]:
+    def _encode_bytes(self, text: str) -> bytes:
         vec = self._model.encode(text, normalize_embeddings=True)
         arr = np.asarray(vec, dtype=np.float32).flatten()
         if arr.size == self._dimension:
-            return arr.tolist()
+            return arr.tobytes()
         if arr.size > self._dimension:
             clipped = arr[: self._dimension]
             norm = float(np.linalg.norm(clipped))
             if norm > 0:
                 clipped /= norm
-            return clipped.tolist()
+            return clipped.tobytes()
         # Pad smaller vectors to requested dimension.
         padded = np.zeros(self._dimension, dtype=np.float32)
         padded[: arr.size] = arr
         norm = float(np.linalg.norm(padded))
         if norm > 0:
             padded /= norm
-        return padded.tolist()
+        return padded.tobytes()
+
+    def embed(self, text: str) -> list[float]:
+        return self.embed_array(text).tolist()
+
+    def embed_array(self, text: str) -> np.ndarray:
+        """embed() as a read-only zero-copy float32 view over the cached vector."""
+        return np.frombuffer(self._embed_bytes(text), dtype=np.float32)
+
+    def cache_info(self):
+        """Hit/miss statistics of this embedder's model-output cache."""
+        return self._embed_bytes.cache_info()
 
 
 def resolve_embedder(
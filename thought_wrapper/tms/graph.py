@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Iterable, Literal, Sequence
 
+import numpy as np
+
 from .models import Thought
 from .store import ThoughtStore, _dt_to_iso, _iso_to_dt
 
@@ -30,6 +32,90 @@ class ThoughtEdge:
     metadata: dict[str, object]
 
 
+@dataclass(frozen=True)
+class _EdgeCSR:
+    """Edge snapshot in CSR form over a dense node index."""
+
+    node_ids: list[str]
+    node_index: dict[str, int]
+    relations: list[str]
+    indptr: np.ndarray  # int32[N + 1]
+    sources: np.ndarray  # int32[E], sorted
+    indices: np.ndarray  # int32[E], edge targets grouped by source
+    relation_codes: np.ndarray  # int32[E]
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple[str, str, str]]) -> "_EdgeCSR":
+        node_index: dict[str, int] = {}
+        relation_index: dict[str, int] = {}
+        count = len(rows)
+        src = np.empty(count, dtype=np.int32)
+        dst = np.empty(count, dtype=np.int32)
+        rel = np.empty(count, dtype=np.int32)
+        for i, (source_id, target_id, relation) in enumerate(rows):
+            src[i] = node_index.setdefault(source_id, len(node_index))
+            dst[i] = node_index.setdefault(target_id, len(node_index))
+            rel[i] = relation_index.setdefault(relation, len(relation_index))
+        # Stable sort keeps insertion order within each source, matching the old adjacency lists.
+        order = np.argsort(src, kind="stable")
+        indptr = np.zeros(len(node_index) + 1, dtype=np.int32)
+        np.cumsum(np.bincount(src, minlength=len(node_index)), out=indptr[1:])
+        return cls(
+            node_ids=list(node_index),
+            node_index=node_index,
+            relations=list(relation_index),
+            indptr=indptr,
+            sources=src[order],
+            indices=dst[order],
+            relation_codes=rel[order],
+        )
+
+    def edge_mask(self, relations: set[str] | None) -> np.ndarray | None:
+        if not relations:
+            return None
+        codes = [code for code, name in enumerate(self.relations) if name in relations]
+        return np.isin(self.relation_codes, codes)
+
+    def hops_to(self, target: int, max_depth: int, edge_mask: np.ndarray | None) -> np.ndarray:
+        """Reverse BFS: fewest hops from each node to target, max_depth + 1 if farther."""
+        hops = np.full(len(self.node_ids), max_depth + 1, dtype=np.int32)
+        hops[target] = 0
+        frontier = np.zeros(len(self.node_ids), dtype=bool)
+        frontier[target] = True
+        for depth in range(1, max_depth + 1):
+            hit = frontier[self.indices]
+            if edge_mask is not None:
+                hit &= edge_mask
+            reached = np.zeros_like(frontier)
+            reached[self.sources[hit]] = True
+            reached &= hops > depth
+            if not reached.any():
+                break
+            hops[reached] = depth
+            frontier = reached
+        return hops
+
+
+def _component_labels(src: np.ndarray, dst: np.ndarray, n: int) -> np.ndarray:
+    """Undirected connected components over an edge list: one shared root index per component."""
+    labels = np.arange(n, dtype=np.int64)
+    while True:
+        # Hook: each endpoint's root adopts the smaller root across the edge; labels only ever decrease.
+        low = np.minimum(labels[src], labels[dst])
+        hooked = labels.copy()
+        np.minimum.at(hooked, labels[src], low)
+        np.minimum.at(hooked, labels[dst], low)
+        # Pointer jumping flattens every chain back to its root.
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
 class ThoughtGraph:
     """Directed thought graph persisted in SQLite with optional analytic backends."""
 
@@ -42,6 +128,8 @@ class ThoughtGraph:
         self._igraph = None
         self._graph_backend = None
         self._igraph_name_to_idx: dict[str, int] = {}
+        self._edge_csr: _EdgeCSR | None = None
+        self._edge_csr_version: tuple[int, int] | None = None
         self._init_schema()
         self._init_backend()
         self._rebuild_backend_locked()
@@ -78,7 +166,11 @@ class ThoughtGraph:
             self._conn.execute("CREATE INDEX IF NOT EXISTS idx_graph_edges_source ON thought_graph_edges(source_id)")
             self._conn.execute("CREATE INDEX IF NOT EXISTS idx_graph_edges_target ON thought_graph_edges(target_id)")
             self._conn.execute("CREATE INDEX IF NOT EXISTS idx_graph_edges_relation ON thought_graph_edges(relation)")
-            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_graph_nodes_session ON thought_graph_nodes(session_id)")
+            # (session_id, timestamp_utc) serves session lookups and session-scoped time ranges in index order.
+            self._conn.execute("DROP INDEX IF EXISTS idx_graph_nodes_session")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_graph_nodes_session_time ON thought_graph_nodes(session_id, timestamp_utc)"
+            )
             self._conn.execute("CREATE INDEX IF NOT EXISTS idx_graph_nodes_time ON thought_graph_nodes(timestamp_utc)")
             self._conn.commit()
 
@@ -104,7 +196,27 @@ class ThoughtGraph:
             self._backend_name = "builtin"
             self._graph_backend = None
 
+    def _edge_version_locked(self) -> tuple[int, int]:
+        # data_version moves when another connection commits; MAX(edge_id) catches inserts made
+        # through this connection by another ThoughtGraph on the same store.
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        max_edge_id = self._conn.execute("SELECT MAX(edge_id) FROM thought_graph_edges").fetchone()[0]
+        return int(data_version), int(max_edge_id or 0)
+
+    def _edge_csr_locked(self) -> _EdgeCSR:
+        version = self._edge_version_locked()
+        if self._edge_csr is None or self._edge_csr_version != version:
+            rows = self._conn.execute(
+                "SELECT source_id, target_id, relation FROM thought_graph_edges ORDER BY edge_id"
+            ).fetchall()
+            self._edge_csr = _EdgeCSR.from_rows(
+                [(str(row["source_id"]), str(row["target_id"]), str(row["relation"])) for row in rows]
+            )
+            self._edge_csr_version = version
+        return self._edge_csr
+
     def _rebuild_backend_locked(self) -> None:
+        self._edge_csr = None
         rows_nodes = self._conn.execute("SELECT thought_id FROM thought_graph_nodes").fetchall()
         rows_edges = self._conn.execute(
             "SELECT source_id, target_id, relation, weight FROM thought_graph_edges"
@@ -184,21 +296,7 @@ class ThoughtGraph:
             self._store.store(thought)
 
         with self._lock:
-            self._conn.execute(
-                """
-                INSERT INTO thought_graph_nodes (thought_id, session_id, timestamp_utc, metadata_json)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(thought_id) DO UPDATE SET
-                    session_id=excluded.session_id,
-                    timestamp_utc=excluded.timestamp_utc
-                """,
-                (
-                    thought.id,
-                    thought.session_id,
-                    _dt_to_iso(thought.timestamp_utc),
-                    json.dumps({}),
-                ),
-            )
+            self._upsert_node_locked(thought)
             self._conn.commit()
             self._backend_add_node_locked(thought.id)
 
@@ -206,37 +304,114 @@ class ThoughtGraph:
             self._link_temporal_successor(thought)
 
         if semantic_neighbors > 0:
-            nearest = self._store.semantic_search(thought.embedding_vector, limit=semantic_neighbors + 5, alpha=1.0)
-            for item in nearest:
-                other = item.thought
-                if other.id == thought.id:
-                    continue
-                if item.semantic_score < semantic_threshold:
-                    continue
-                self.link(
-                    other.id,
-                    thought.id,
-                    relation="semantic-similarity",
-                    weight=float(item.semantic_score),
-                )
+            self._link_semantic_neighbors(thought, semantic_neighbors, semantic_threshold)
         return thought
 
+    def add_thoughts(
+        self,
+        thoughts: Iterable[Thought],
+        *,
+        store_if_missing: bool = True,
+        semantic_neighbors: int = 3,
+        semantic_threshold: float = 0.80,
+        temporal_link: bool = True,
+    ) -> list[Thought]:
+        """Bulk add_thought: one store write, one node transaction, one edge transaction.
+
+        Temporal predecessors are resolved in input order, exactly as repeated add_thought
+        calls would. Semantic neighbors are searched once the whole batch is stored.
+        """
+        thoughts_list = list(thoughts)
+        if not thoughts_list:
+            return []
+
+        if store_if_missing:
+            with self._lock:
+                existing = {
+                    str(row["id"])
+                    for row in self._store._fetch_rows_by_ids_locked([t.id for t in thoughts_list])
+                }
+            missing = [t for t in thoughts_list if t.id not in existing]
+            if missing:
+                self._store.batch_store(missing)
+
+        pending_edges: list[tuple[str, str, str, float, dict[str, object]]] = []
+        with self._lock:
+            cur = self._conn.cursor()
+            try:
+                cur.execute("BEGIN")
+                for thought in thoughts_list:
+                    self._upsert_node_locked(thought)
+                    if temporal_link:
+                        predecessor = self._temporal_predecessor_locked(thought)
+                        if predecessor is not None:
+                            pending_edges.append((predecessor, thought.id, "temporal-successor", 1.0, {}))
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+            for thought in thoughts_list:
+                self._backend_add_node_locked(thought.id)
+
+        if pending_edges:
+            self.link_many(pending_edges)
+        if semantic_neighbors > 0:
+            for thought in thoughts_list:
+                self._link_semantic_neighbors(thought, semantic_neighbors, semantic_threshold)
+        return thoughts_list
+
+    def _upsert_node_locked(self, thought: Thought) -> None:
+        self._conn.execute(
+            """
+            INSERT INTO thought_graph_nodes (thought_id, session_id, timestamp_utc, metadata_json)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(thought_id) DO UPDATE SET
+                session_id=excluded.session_id,
+                timestamp_utc=excluded.timestamp_utc
+            """,
+            (
+                thought.id,
+                thought.session_id,
+                _dt_to_iso(thought.timestamp_utc),
+                json.dumps({}),
+            ),
+        )
+
+    def _link_semantic_neighbors(self, thought: Thought, semantic_neighbors: int, semantic_threshold: float) -> None:
+        nearest = self._store.semantic_search(thought.embedding_vector, limit=semantic_neighbors + 5, alpha=1.0)
+        for item in nearest:
+            other = item.thought
+            if other.id == thought.id:
+                continue
+            if item.semantic_score < semantic_threshold:
+                continue
+            self.link(
+                other.id,
+                thought.id,
+                relation="semantic-similarity",
+                weight=float(item.semantic_score),
+            )
+
+    def _temporal_predecessor_locked(self, thought: Thought) -> str | None:
+        row = self._conn.execute(
+            """
+            SELECT thought_id, timestamp_utc
+            FROM thought_graph_nodes
+            WHERE session_id = ? AND thought_id != ? AND timestamp_utc <= ?
+            ORDER BY timestamp_utc DESC
+            LIMIT 1
+            """,
+            (thought.session_id, thought.id, _dt_to_iso(thought.timestamp_utc)),
+        ).fetchone()
+        return None if row is None else str(row["thought_id"])
+
     def _link_temporal_successor(self, thought: Thought) -> None:
         with self._lock:
-            row = self._conn.execute(
-                """
-                SELECT thought_id, timestamp_utc
-                FROM thought_graph_nodes
-                WHERE session_id = ? AND thought_id != ? AND timestamp_utc <= ?
-                ORDER BY timestamp_utc DESC
-                LIMIT 1
-                """,
-                (thought.session_id, thought.id, _dt_to_iso(thought.timestamp_utc)),
-            ).fetchone()
-        if row is None:
+            predecessor = self._temporal_predecessor_locked(thought)
+        if predecessor is None:
             return
         self.link(
-            str(row["thought_id"]),
+            predecessor,
             thought.id,
             relation="temporal-successor",
             weight=1.0,
@@ -297,6 +472,8 @@ class ThoughtGraph:
             except Exception:
                 self._conn.rollback()
                 raise
+            finally:
+                self._edge_csr = None
 
     def neighbors(
         self,
@@ -309,6 +486,13 @@ class ThoughtGraph:
         """Return reachable neighbor IDs up to N hops."""
         if hops <= 0:
             return []
+        with self._lock:
+            csr = self._edge_csr
+            if csr is not None and self._edge_csr_version != self._edge_version_locked():
+                csr = None
+        if csr is not None:
+            # A snapshot is built and no connection has changed the edges since: walk it in memory.
+            return self._neighbors_from_csr(csr, thought_id, hops=hops, relations=relations, limit=limit)
         seen = {thought_id}
         out: list[str] = []
         queue = deque([(thought_id, 0)])
@@ -336,6 +520,38 @@ class ThoughtGraph:
                 queue.append((nxt, depth + 1))
         return out
 
+    @staticmethod
+    def _neighbors_from_csr(
+        csr: _EdgeCSR, thought_id: str, *, hops: int, relations: set[str] | None, limit: int
+    ) -> list[str]:
+        """neighbors() over the CSR snapshot; same fan-out cap and visit order as the per-node SQL walk."""
+        start = csr.node_index.get(thought_id)
+        if start is None:
+            return []
+        allowed = {code for code, name in enumerate(csr.relations) if name in relations} if relations else None
+        seen = {start}
+        out: list[int] = []
+        queue = deque([(start, 0)])
+        while queue and len(out) < limit:
+            node, depth = queue.popleft()
+            if depth >= hops:
+                continue
+            fetch_cap = max(max(1, limit - len(out)) * 2, 8)
+            lo = int(csr.indptr[node])
+            hi = min(int(csr.indptr[node + 1]), lo + fetch_cap)
+            targets = csr.indices[lo:hi].tolist()
+            codes = csr.relation_codes[lo:hi].tolist() if allowed is not None else None
+            for pos, nxt in enumerate(targets):
+                if codes is not None and codes[pos] not in allowed:
+                    continue
+                if nxt in seen:
+                    continue
+                seen.add(nxt)
+                out.append(nxt)
+                queue.append((nxt, depth + 1))
+        node_ids = csr.node_ids
+        return [node_ids[idx] for idx in out]
+
     def find_paths(
         self,
         source_id: str,
@@ -349,36 +565,44 @@ class ThoughtGraph:
         if source_id == target_id:
             return [[source_id]]
         with self._lock:
-            edges = self._conn.execute(
-                "SELECT source_id, target_id, relation FROM thought_graph_edges"
-            ).fetchall()
-        adjacency: dict[str, list[tuple[str, str]]] = {}
-        for row in edges:
-            src = str(row["source_id"])
-            tgt = str(row["target_id"])
-            rel = str(row["relation"])
-            adjacency.setdefault(src, []).append((tgt, rel))
-
-        paths: list[list[str]] = []
-        queue = deque([[source_id]])
+            csr = self._edge_csr_locked()
+        src = csr.node_index.get(source_id)
+        dst = csr.node_index.get(target_id)
+        if src is None or dst is None:
+            return []
+        edge_mask = csr.edge_mask(relations)
+        hops = csr.hops_to(dst, max_depth, edge_mask)
+        if hops[src] > max_depth:
+            return []
+
+        # Python lists index faster than numpy scalars inside the enumeration loop.
+        indptr = csr.indptr.tolist()
+        indices = csr.indices.tolist()
+        allowed = edge_mask.tolist() if edge_mask is not None else None
+        hops_left = hops.tolist()
+
+        paths: list[tuple[int, ...]] = []
+        queue = deque([(src,)])
         while queue and len(paths) < limit:
             path = queue.popleft()
-            if len(path) - 1 >= max_depth:
+            remaining = max_depth - (len(path) - 1)
+            if remaining <= 0:
                 continue
-            last = path[-1]
-            for nxt, rel in adjacency.get(last, []):
-                if relations and rel not in relations:
+            for edge in range(indptr[path[-1]], indptr[path[-1] + 1]):
+                if allowed is not None and not allowed[edge]:
                     continue
+                nxt = indices[edge]
                 if nxt in path:
                     continue
-                new_path = path + [nxt]
-                if nxt == target_id:
-                    paths.append(new_path)
+                if nxt == dst:
+                    paths.append(path + (nxt,))
                     if len(paths) >= limit:
                         break
-                else:
-                    queue.append(new_path)
-        return paths
+                elif hops_left[nxt] < remaining:
+                    # Branches that cannot reach the target within the depth budget are pruned.
+                    queue.append(path + (nxt,))
+        node_ids = csr.node_ids
+        return [[node_ids[idx] for idx in path] for path in paths]
 
     def cluster_by_topic(self, *, min_cluster_size: int = 2) -> list[list[str]]:
         """Cluster thought IDs using semantic links; backend-aware with built-in fallback."""
@@ -418,31 +642,23 @@ class ThoughtGraph:
                     out.append(sorted([nodes[i] for i in cluster]))
             return out
 
-        # Built-in fallback: connected components on undirected semantic adjacency.
-        adjacency: dict[str, set[str]] = {n: set() for n in nodes}
-        for src, tgt, _ in semantic_edges:
-            adjacency.setdefault(src, set()).add(tgt)
-            adjacency.setdefault(tgt, set()).add(src)
-
-        visited: set[str] = set()
-        clusters: list[list[str]] = []
-        for node in nodes:
-            if node in visited:
-                continue
-            queue = deque([node])
-            component = []
-            visited.add(node)
-            while queue:
-                cur = queue.popleft()
-                component.append(cur)
-                for nxt in adjacency.get(cur, set()):
-                    if nxt in visited:
-                        continue
-                    visited.add(nxt)
-                    queue.append(nxt)
-            if len(component) >= min_cluster_size:
-                clusters.append(sorted(component))
-        return clusters
+        # Built-in fallback: connected components on undirected semantic adjacency, labelled with
+        # array hooking/pointer jumping instead of a per-node Python BFS.
+        index = {node: idx for idx, node in enumerate(nodes)}
+        src = np.fromiter((index.setdefault(s, len(index)) for s, _, _ in semantic_edges), dtype=np.int64)
+        dst = np.fromiter((index.setdefault(t, len(index)) for _, t, _ in semantic_edges), dtype=np.int64)
+        names = list(index)
+        labels = _component_labels(src, dst, len(names))
+        sizes = np.bincount(labels, minlength=len(names))
+        # Ascending member index: clusters come out in order of their first node, like the BFS did.
+        label_of = labels.tolist()
+        groups: dict[int, list[str]] = {}
+        for idx in np.flatnonzero(sizes[labels] >= min_cluster_size).tolist():
+            label = label_of[idx]
+            if label not in groups and idx >= len(nodes):
+                continue  # Component of edge-only endpoints with no node row; the BFS never visited it.
+            groups.setdefault(label, []).append(names[idx])
+        return [sorted(members) for members in groups.values()]
 
     def temporal_range(
         self,
@@ -475,9 +691,18 @@ class ThoughtGraph:
     async def aadd_thought(self, thought: Thought, **kwargs) -> Thought:
         return await asyncio.to_thread(self.add_thought, thought, **kwargs)
 
+    async def aadd_thoughts(self, thoughts: Iterable[Thought], **kwargs) -> list[Thought]:
+        return await asyncio.to_thread(self.add_thoughts, list(thoughts), **kwargs)
+
     async def alink(self, source_id: str, target_id: str, **kwargs) -> None:
         await asyncio.to_thread(self.link, source_id, target_id, **kwargs)
 
+    async def alink_many(self, edges: Sequence[tuple[str, str, str, float, dict[str, object]]]) -> None:
+        await asyncio.to_thread(self.link_many, list(edges))
+
+    async def aneighbors(self, thought_id: str, **kwargs) -> list[str]:
+        return await asyncio.to_thread(self.neighbors, thought_id, **kwargs)
+
     async def afind_paths(self, source_id: str, target_id: str, **kwargs) -> list[list[str]]:
         return await asyncio.to_thread(self.find_paths, source_id, target_id, **kwargs)
 
@@ -3,16 +3,34 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, PlainValidator, WithJsonSchema, model_validator
 
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _as_float32_vector(value: object) -> np.ndarray:
+    # No copy when the input already is a contiguous float32 array (embedder output, stored blobs).
+    arr = np.ascontiguousarray(value, dtype=np.float32)
+    if arr.ndim != 1 or arr.size == 0:
+        raise ValueError("embedding_vector must be a non-empty 1-D sequence of floats")
+    return arr
+
+
+# Held as a contiguous float32 array; serialized back to a list of floats.
+EmbeddingVector = Annotated[
+    np.ndarray,
+    PlainValidator(_as_float32_vector),
+    PlainSerializer(lambda arr: np.asarray(arr, dtype=np.float32).tolist(), return_type=List[float]),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}, "minItems": 1}),
+]
+
+
 class Thought(BaseModel):
     """Canonical thought record persisted by the TMS."""
 
@@ -26,7 +44,7 @@ class Thought(BaseModel):
     tags: List[str] = Field(default_factory=list)
     raw_text: str = Field(min_length=1)
     cleaned_text: str = Field(min_length=1)
-    embedding_vector: List[float] = Field(min_length=1)
+    embedding_vector: EmbeddingVector
     embedding_dim: Optional[int] = None
 
     @model_validator(mode="after")
@@ -41,6 +59,13 @@ class Thought(BaseModel):
             )
         return self
 
+    def __eq__(self, other: object) -> bool:
+        # Field-wise like BaseModel.__eq__, but the vector compares by value.
+        if type(other) is not type(self):
+            return NotImplemented
+        mine, theirs = dict(self.__dict__), dict(other.__dict__)
+        return np.array_equal(mine.pop("embedding_vector"), theirs.pop("embedding_vector")) and mine == theirs
+
 
 class ThoughtFilters(BaseModel):
     """Metadata filters for retrieval/search operations."""
@@ -4,16 +4,15 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timezone
-from typing import Sequence
+from typing import Any, Mapping, Sequence
 
 from thought_wrapper.core import (
-    clean_thought_tags,
     clean_thought_tags_linear,
-    parse_thought_tags,
+    parse_and_clean,
     parse_thought_tags_linear,
 )
 
-from .embeddings import Embedder, resolve_embedder
+from .embeddings import Embedder, embed_vector, resolve_embedder
 from .models import ParseStoreResult, Thought
 from .store import ThoughtStore
 
@@ -22,29 +21,15 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def parse_and_store(
-    raw_output: str,
-    store: ThoughtStore,
-    *,
-    session_id: str,
-    category: str = "reasoning",
-    confidence: float = 0.9,
-    tags: Sequence[str] | None = None,
-    tag_name: str = "thought",
-    linear_fallback: bool = True,
-    embedder: Embedder | None = None,
-    embedding_dim: int = 384,
-) -> ParseStoreResult:
-    """Atomically parse tagged output, embed each thought, and persist."""
-    if not session_id.strip():
-        raise ValueError("session_id must be non-empty")
-
-    regex_thoughts = parse_thought_tags(raw_output, tag_name=tag_name)
+def _extract_thoughts(raw_output: str, *, tag_name: str, linear_fallback: bool) -> tuple[str, dict[str, str], bool]:
+    # Parse map and cleaned text come from one scan over the same matches.
+    cleaned_output, regex_thoughts = parse_and_clean(raw_output, tag_name=tag_name)
     thoughts_map = regex_thoughts
-    cleaned_output = clean_thought_tags(raw_output, tag_name=tag_name)
     used_linear_fallback = False
 
-    if linear_fallback:
+    # With no `[` inside any regex match there is no nesting, and the linear parser would find
+    # exactly the same tags; only run it when it could capture more.
+    if linear_fallback and any("[" in content for content in regex_thoughts.values()):
         linear_thoughts = parse_thought_tags_linear(raw_output, tag_name=tag_name)
         # Prefer linear parse when it captures additional content (e.g., nested brackets).
         should_use_linear = len(linear_thoughts) > len(regex_thoughts)
@@ -59,40 +44,159 @@ def parse_and_store(
             thoughts_map = linear_thoughts
             cleaned_output = clean_thought_tags_linear(raw_output, tag_name=tag_name)
             used_linear_fallback = True
+    return cleaned_output, thoughts_map, used_linear_fallback
 
-    resolved_embedder = resolve_embedder(embedder, dimension=embedding_dim)
-    thought_objects: list[Thought] = []
-    common_tags = list(tags or [])
-    now = _utc_now()
 
-    for _, content in thoughts_map.items():
-        clean_content = content.strip()
-        vector = resolved_embedder.embed(clean_content)
-        thought_objects.append(
-            Thought(
-                timestamp_utc=now,
-                session_id=session_id,
-                category=category,
-                confidence=confidence,
-                tags=common_tags,
-                raw_text=content,
-                cleaned_text=clean_content,
-                embedding_vector=vector,
-                embedding_dim=len(vector),
-            )
+def _embed_contents(embedder: Embedder, contents: Sequence[str]) -> list:
+    embed_batch = getattr(embedder, "embed_batch", None)
+    if embed_batch is not None and len(contents) > 1:
+        return list(embed_batch(contents))
+    return [embed_vector(embedder, content) for content in contents]
+
+
+def _build_thoughts(
+    contents: Sequence[str],
+    vectors: Sequence,
+    *,
+    now: datetime,
+    session_id: str,
+    category: str,
+    confidence: float,
+    tags: Sequence[str] | None,
+) -> list[Thought]:
+    common_tags = list(tags or [])
+    return [
+        Thought(
+            timestamp_utc=now,
+            session_id=session_id,
+            category=category,
+            confidence=confidence,
+            tags=common_tags,
+            raw_text=content,
+            cleaned_text=content.strip(),
+            embedding_vector=vector,
+            embedding_dim=len(vector),
         )
+        for content, vector in zip(contents, vectors)
+    ]
 
-    if thought_objects:
-        # Atomic batch write; no partial persistence if insertion fails.
-        store.batch_store(thought_objects)
 
+def parse_thoughts(
+    raw_output: str,
+    *,
+    session_id: str,
+    category: str = "reasoning",
+    confidence: float = 0.9,
+    tags: Sequence[str] | None = None,
+    tag_name: str = "thought",
+    linear_fallback: bool = True,
+    embedder: Embedder | None = None,
+    embedding_dim: int = 384,
+) -> ParseStoreResult:
+    """Parse tagged output and embed each thought without persisting (for caller-batched writes)."""
+    if not session_id.strip():
+        raise ValueError("session_id must be non-empty")
+
+    cleaned_output, thoughts_map, used_linear_fallback = _extract_thoughts(
+        raw_output, tag_name=tag_name, linear_fallback=linear_fallback
+    )
+    resolved_embedder = resolve_embedder(embedder, dimension=embedding_dim)
+    now = _utc_now()
+    contents = list(thoughts_map.values())
+    vectors = _embed_contents(resolved_embedder, [content.strip() for content in contents])
     return ParseStoreResult(
         cleaned_output=cleaned_output,
-        thoughts=thought_objects,
+        thoughts=_build_thoughts(
+            contents,
+            vectors,
+            now=now,
+            session_id=session_id,
+            category=category,
+            confidence=confidence,
+            tags=tags,
+        ),
         used_linear_fallback=used_linear_fallback,
     )
 
 
+def parse_thoughts_batch(
+    rows: Sequence[Mapping[str, Any]],
+    *,
+    tag_name: str = "thought",
+    linear_fallback: bool = True,
+    embedder: Embedder | None = None,
+    embedding_dim: int = 384,
+) -> list[ParseStoreResult]:
+    """parse_thoughts over many outputs, embedding every row's thoughts in one batch call.
+
+    Each row holds ``raw_output`` and ``session_id`` plus optional ``category``,
+    ``confidence`` and ``tags``, with the same defaults as parse_thoughts.
+    """
+    parsed: list[tuple[Mapping[str, Any], datetime, str, list[str], bool]] = []
+    for row in rows:
+        if not str(row["session_id"]).strip():
+            raise ValueError("session_id must be non-empty")
+        cleaned_output, thoughts_map, used_linear_fallback = _extract_thoughts(
+            row["raw_output"], tag_name=tag_name, linear_fallback=linear_fallback
+        )
+        parsed.append((row, _utc_now(), cleaned_output, list(thoughts_map.values()), used_linear_fallback))
+
+    resolved_embedder = resolve_embedder(embedder, dimension=embedding_dim)
+    vectors = _embed_contents(resolved_embedder, [content.strip() for item in parsed for content in item[3]])
+    results: list[ParseStoreResult] = []
+    offset = 0
+    for row, now, cleaned_output, contents, used_linear_fallback in parsed:
+        thoughts = _build_thoughts(
+            contents,
+            vectors[offset : offset + len(contents)],
+            now=now,
+            session_id=row["session_id"],
+            category=row.get("category", "reasoning"),
+            confidence=row.get("confidence", 0.9),
+            tags=row.get("tags"),
+        )
+        offset += len(contents)
+        results.append(
+            ParseStoreResult(
+                cleaned_output=cleaned_output,
+                thoughts=thoughts,
+                used_linear_fallback=used_linear_fallback,
+            )
+        )
+    return results
+
+
+def parse_and_store(
+    raw_output: str,
+    store: ThoughtStore,
+    *,
+    session_id: str,
+    category: str = "reasoning",
+    confidence: float = 0.9,
+    tags: Sequence[str] | None = None,
+    tag_name: str = "thought",
+    linear_fallback: bool = True,
+    embedder: Embedder | None = None,
+    embedding_dim: int = 384,
+) -> ParseStoreResult:
+    """Atomically parse tagged output, embed each thought, and persist."""
+    result = parse_thoughts(
+        raw_output,
+        session_id=session_id,
+        category=category,
+        confidence=confidence,
+        tags=tags,
+        tag_name=tag_name,
+        linear_fallback=linear_fallback,
+        embedder=embedder,
+        embedding_dim=embedding_dim,
+    )
+    if result.thoughts:
+        # Atomic batch write; no partial persistence if insertion fails.
+        store.batch_store(result.thoughts)
+    return result
+
+
 async def aparse_and_store(
     raw_output: str,
     store: ThoughtStore,
@@ -6,18 +6,62 @@ import asyncio
 import re
 import time
 from dataclasses import dataclass
-from typing import Callable, Iterable, Sequence
+from typing import Callable, Iterable, Iterator, Sequence
 from uuid import uuid4
 
-from .embeddings import Embedder, resolve_embedder
+from thought_wrapper.core import _collapse_whitespace
+
+from .embeddings import Embedder, embed_vector, resolve_embedder
 from .graph import ThoughtGraph
 from .models import ReflectionResult, Thought, ThoughtFilters
 from .prompt_helpers import REFLECTION_TEMPLATES, build_reflection_prompt
 from .store import ThoughtStore
 
 
-_THOUGHT_PATTERN = re.compile(r"<thought\b([^>]*)>(.*?)</thought>", flags=re.IGNORECASE | re.DOTALL)
-_ATTR_PATTERN = re.compile(r'(\w+)\s*=\s*"([^"]*?)"')
+# Body is "runs of non-`<`, then any `<` that does not open `</thought>`": the same language as a lazy
+# DOTALL `.*?` up to the first closing tag, but consumed a run at a time instead of probing every char.
+# Possessive quantifiers: the runs are unambiguous, so a failed attempt never backtracks into them.
+_THOUGHT_PATTERN = re.compile(
+    r"<thought\b([^>]*+)>([^<]*+(?:<(?!/thought>)[^<]*+)*+)</thought>",
+    flags=re.IGNORECASE,
+)
+_ATTR_PATTERN = re.compile(r'(\w+)\s*=\s*"([^"]*)"')
+_OPEN_TAG = "<thought"
+_CLOSE_TAG = "</thought>"
+
+
+def _iter_thought_blocks(text: str) -> Iterator[tuple[int, int, str, str]]:
+    """Yield (start, end, attrs, body) exactly as _THOUGHT_PATTERN.finditer would, in linear time.
+
+    finditer retries every later `<thought` when a block never closes, rescanning the tail each
+    time. Here a missing `>` or `</thought>` ends the scan: no later opener can find one either.
+    """
+    folded = text.lower()
+    if len(folded) != len(text):
+        # Case folding changed offsets (rare non-ASCII); defer to the regex.
+        for match in _THOUGHT_PATTERN.finditer(text):
+            yield match.start(), match.end(), match.group(1), match.group(2)
+        return
+    pos = 0
+    while True:
+        start = folded.find(_OPEN_TAG, pos)
+        if start < 0:
+            return
+        name_end = start + len(_OPEN_TAG)
+        follow = text[name_end : name_end + 1]
+        if follow.isalnum() or follow == "_":
+            # `<thoughts ...>` and similar: no word boundary (`\w` is isalnum() or `_`).
+            pos = start + 1
+            continue
+        attrs_end = text.find(">", name_end)
+        if attrs_end < 0:
+            return
+        close = folded.find(_CLOSE_TAG, attrs_end + 1)
+        if close < 0:
+            return
+        end = close + len(_CLOSE_TAG)
+        yield start, end, text[name_end:attrs_end], text[attrs_end + 1 : close]
+        pos = end
 
 
 @dataclass(frozen=True)
@@ -28,6 +72,19 @@ class ParsedStructuredThought:
     content: str
 
 
+def strip_structured_thoughts(text: str) -> str:
+    """Remove <thought ...>...</thought> blocks and collapse the surrounding whitespace."""
+    parts: list[str] = []
+    cursor = 0
+    for start, end, _, _ in _iter_thought_blocks(text):
+        parts.append(text[cursor:start])
+        cursor = end
+    if not parts:
+        return _collapse_whitespace(text)
+    parts.append(text[cursor:])
+    return _collapse_whitespace("\n".join(parts))
+
+
 def parse_structured_thoughts(
     text: str,
     *,
@@ -36,9 +93,8 @@ def parse_structured_thoughts(
 ) -> list[ParsedStructuredThought]:
     """Parse <thought ...>content</thought> tags into structured units."""
     out: list[ParsedStructuredThought] = []
-    for match in _THOUGHT_PATTERN.finditer(text):
-        attrs_raw = match.group(1) or ""
-        content = (match.group(2) or "").strip()
+    for _, _, attrs_raw, body in _iter_thought_blocks(text):
+        content = body.strip()
         if not content:
             continue
         attrs = {k.lower(): v for k, v in _ATTR_PATTERN.findall(attrs_raw)}
@@ -90,7 +146,7 @@ class ReflectionEngine:
             raise ValueError(f"Unsupported reflection mode: {mode}")
         start = time.perf_counter()
 
-        query_vector = self.embedder.embed(query)
+        query_vector = embed_vector(self.embedder, query)
         current_hits = self.store.semantic_search(
             query_vector,
             filters=ThoughtFilters(session_id=current_session_id),
@@ -132,9 +188,14 @@ class ReflectionEngine:
         else:
             self.store.create_session(current_session_id)
 
+        contents = [item.content for item in parsed]
+        embed_batch = getattr(self.embedder, "embed_batch", None)
+        if embed_batch is not None and len(contents) > 1:
+            vectors = embed_batch(contents)
+        else:
+            vectors = [embed_vector(self.embedder, content) for content in contents]
         to_store: list[Thought] = []
-        for item in parsed:
-            vector = self.embedder.embed(item.content)
+        for item, vector in zip(parsed, vectors):
             to_store.append(
                 Thought(
                     id=item.thought_id,
@@ -151,19 +212,13 @@ class ReflectionEngine:
 
         stored = self.store.batch_store(to_store) if to_store else []
         if self.graph is not None:
-            pending_edges: list[tuple[str, str, str, float, dict[str, object]]] = []
-            for t in stored:
-                self.graph.add_thought(t, store_if_missing=False, semantic_neighbors=0, temporal_link=True)
-                for recalled_thought in recalled[:1]:
-                    pending_edges.append(
-                        (
-                            recalled_thought.id,
-                            t.id,
-                            "explicit-reference",
-                            1.0,
-                            {"mode": mode},
-                        )
-                    )
+            # One node transaction for the batch; temporal predecessors resolve in order as before.
+            self.graph.add_thoughts(stored, store_if_missing=False, semantic_neighbors=0, temporal_link=True)
+            pending_edges: list[tuple[str, str, str, float, dict[str, object]]] = [
+                (recalled_thought.id, t.id, "explicit-reference", 1.0, {"mode": mode})
+                for t in stored
+                for recalled_thought in recalled[:1]
+            ]
             if pending_edges:
                 self.graph.link_many(pending_edges)
 
@@ -4,20 +4,35 @@ from __future__ import annotations
 
 import asyncio
 import json
+import queue
 import sqlite3
 import threading
+from contextlib import closing, contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Sequence, TYPE_CHECKING
+from typing import Iterable, Iterator, Sequence, TYPE_CHECKING
 
 import numpy as np
 
 from .models import ScoredThought, Thought, ThoughtFilters
 
+try:
+    import simsimd  # type: ignore
+except Exception:  # pragma: no cover - optional speedup
+    simsimd = None
+
 if TYPE_CHECKING:
     from .graph import ThoughtGraph
 
 
+# Applied to every connection on file-backed stores: readers never block the writer under WAL.
+_FILE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+)
+
+
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -36,16 +51,28 @@ def _iso_to_dt(value: str) -> datetime:
     return _to_utc(datetime.fromisoformat(value))
 
 
+def _sqlite_has_json1() -> bool:
+    try:
+        with closing(sqlite3.connect(":memory:")) as conn:
+            conn.execute("SELECT value FROM json_each('[]')").fetchall()
+        return True
+    except sqlite3.OperationalError:  # pragma: no cover - SQLite built without JSON1
+        return False
+
+
+_SQLITE_HAS_JSON1 = _sqlite_has_json1()
+
+
 def _vector_to_blob(vector: Sequence[float]) -> bytes:
     arr = np.asarray(vector, dtype=np.float32)
     return arr.tobytes()
 
 
-def _blob_to_vector(blob: bytes, dim: int) -> list[float]:
+def _blob_to_vector(blob: bytes, dim: int) -> np.ndarray:
     arr = np.frombuffer(blob, dtype=np.float32)
     if arr.size != dim:
         raise ValueError(f"Embedding blob size mismatch. expected={dim}, actual={arr.size}")
-    return arr.astype(np.float32).tolist()
+    return arr
 
 
 def _normalize(vec: np.ndarray) -> np.ndarray:
@@ -55,8 +82,48 @@ def _normalize(vec: np.ndarray) -> np.ndarray:
     return vec / norm
 
 
+def _normalize_rows(mat: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return mat / norms
+
+
+def _quantize_int8(mat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization; returns (codes, scales)."""
+    scales = np.abs(mat).max(axis=-1, keepdims=True) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.rint(mat / scales).astype(np.int8)
+    return codes, scales[..., 0].astype(np.float32)
+
+
+def _all_new_ids(id_to_idx: dict[str, int], items: Sequence[tuple[str, Sequence[float]]]) -> bool:
+    ids = [item[0] for item in items]
+    return len(set(ids)) == len(ids) and not any(thought_id in id_to_idx for thought_id in ids)
+
+
+def _subset_top_k(
+    matrix: np.ndarray,
+    id_to_idx: dict[str, int],
+    query: np.ndarray,
+    thought_ids: Sequence[str],
+    top_k: int,
+) -> list[tuple[str, float]]:
+    pairs = [(thought_id, id_to_idx[thought_id]) for thought_id in thought_ids if thought_id in id_to_idx]
+    if not pairs:
+        return []
+    ids = [thought_id for thought_id, _ in pairs]
+    rows = np.fromiter((idx for _, idx in pairs), dtype=np.intp, count=len(pairs))
+    scores = matrix[rows] @ query
+    top_k = max(1, min(top_k, scores.shape[0]))
+    idx = np.argpartition(-scores, top_k - 1)[:top_k]
+    ordered = idx[np.argsort(-scores[idx])]
+    return [(ids[int(i)], float(scores[int(i)])) for i in ordered]
+
+
 class _VectorBackend:
     name = "base"
+    supports_upsert = False
+    supports_subset_search = False
 
     def build(self, items: list[tuple[str, list[float]]]) -> None:
         raise NotImplementedError
@@ -64,12 +131,32 @@ class _VectorBackend:
     def upsert(self, thought_id: str, vector: Sequence[float]) -> None:
         raise NotImplementedError
 
+    def upsert_many(self, items: Sequence[tuple[str, Sequence[float]]]) -> None:
+        """upsert() each item in order; backends override with a bulk path."""
+        for thought_id, vector in items:
+            self.upsert(thought_id, vector)
+
     def search(self, query_vector: Sequence[float], top_k: int) -> list[tuple[str, float]]:
         raise NotImplementedError
 
+    def search_subset(
+        self, query_vector: Sequence[float], thought_ids: Sequence[str], top_k: int
+    ) -> list[tuple[str, float]]:
+        """Exact top-k over the given ids only."""
+        raise NotImplementedError
+
+    def search_batch(self, query_matrix: np.ndarray, top_k: int) -> list[list[tuple[str, float]]]:
+        """One search() result per query row."""
+        return [self.search(q, top_k) for q in query_matrix]
+
 
 class _NumpyVectorBackend(_VectorBackend):
     name = "numpy"
+    supports_upsert = True
+    supports_subset_search = True
+    # int8 coarse scan (simsimd only) pays off once the matrix outgrows cache.
+    int8_min_rows = 4096
+    int8_oversample = 4
 
     def __init__(self, embedding_dim: int) -> None:
         self._embedding_dim = embedding_dim
@@ -78,6 +165,8 @@ class _NumpyVectorBackend(_VectorBackend):
         self._size = 0
         self._capacity = 0
         self._matrix = np.zeros((0, embedding_dim), dtype=np.float32)
+        self._int8 = np.zeros((0, embedding_dim), dtype=np.int8)
+        self._int8_scales = np.zeros(0, dtype=np.float32)
 
     def build(self, items: list[tuple[str, list[float]]]) -> None:
         self._ids = [item[0] for item in items]
@@ -86,6 +175,8 @@ class _NumpyVectorBackend(_VectorBackend):
             self._size = 0
             self._capacity = 0
             self._matrix = np.zeros((0, self._embedding_dim), dtype=np.float32)
+            self._int8 = np.zeros((0, self._embedding_dim), dtype=np.int8)
+            self._int8_scales = np.zeros(0, dtype=np.float32)
             return
         mat = np.asarray([item[1] for item in items], dtype=np.float32)
         if mat.shape[1] != self._embedding_dim:
@@ -97,8 +188,12 @@ class _NumpyVectorBackend(_VectorBackend):
         normalized = mat / norms
         self._size = normalized.shape[0]
         self._capacity = max(self._size, 16)
-        self._matrix = np.zeros((self._capacity, self._embedding_dim), dtype=np.float32)
+        # Rows past _size are never read, so spare capacity is left uninitialized.
+        self._matrix = np.empty((self._capacity, self._embedding_dim), dtype=np.float32)
         self._matrix[: self._size] = normalized
+        self._int8 = np.empty((self._capacity, self._embedding_dim), dtype=np.int8)
+        self._int8_scales = np.empty(self._capacity, dtype=np.float32)
+        self._int8[: self._size], self._int8_scales[: self._size] = _quantize_int8(normalized)
 
     def upsert(self, thought_id: str, vector: Sequence[float]) -> None:
         vec = _normalize(np.asarray(vector, dtype=np.float32))
@@ -110,36 +205,111 @@ class _NumpyVectorBackend(_VectorBackend):
         if existing is not None:
             idx = existing
             self._matrix[idx] = vec
+            self._int8[idx], self._int8_scales[idx] = _quantize_int8(vec)
+            return
+        self._reserve(self._size + 1)
+        self._matrix[self._size] = vec
+        self._int8[self._size], self._int8_scales[self._size] = _quantize_int8(vec)
+        self._id_to_idx[thought_id] = self._size
+        self._ids.append(thought_id)
+        self._size += 1
+
+    def upsert_many(self, items: Sequence[tuple[str, Sequence[float]]]) -> None:
+        if len(items) < 2 or not _all_new_ids(self._id_to_idx, items):
+            super().upsert_many(items)
             return
-        if self._size >= self._capacity:
+        # Pure append: normalize, quantize and copy all rows in one slice.
+        normalized = _normalize_rows(np.asarray([item[1] for item in items], dtype=np.float32))
+        if normalized.shape[1] != self._embedding_dim:
+            raise ValueError(
+                f"Vector dimension mismatch while upserting numpy index. expected={self._embedding_dim}, got={normalized.shape[1]}"
+            )
+        start, end = self._size, self._size + normalized.shape[0]
+        self._reserve(end)
+        self._matrix[start:end] = normalized
+        self._int8[start:end], self._int8_scales[start:end] = _quantize_int8(normalized)
+        for offset, (thought_id, _) in enumerate(items):
+            self._id_to_idx[thought_id] = start + offset
+            self._ids.append(thought_id)
+        self._size = end
+
+    def _reserve(self, rows: int) -> None:
+        if rows > self._capacity:
             new_capacity = max(16, self._capacity * 2)
-            grown = np.zeros((new_capacity, self._embedding_dim), dtype=np.float32)
+            while new_capacity < rows:
+                new_capacity *= 2
+            grown = np.empty((new_capacity, self._embedding_dim), dtype=np.float32)
+            grown_int8 = np.empty((new_capacity, self._embedding_dim), dtype=np.int8)
+            grown_scales = np.empty(new_capacity, dtype=np.float32)
             if self._size > 0:
                 grown[: self._size] = self._matrix[: self._size]
+                grown_int8[: self._size] = self._int8[: self._size]
+                grown_scales[: self._size] = self._int8_scales[: self._size]
             self._matrix = grown
+            self._int8 = grown_int8
+            self._int8_scales = grown_scales
             self._capacity = new_capacity
-        self._matrix[self._size] = vec
-        self._id_to_idx[thought_id] = self._size
-        self._ids.append(thought_id)
-        self._size += 1
 
-    def search(self, query_vector: Sequence[float], top_k: int) -> list[tuple[str, float]]:
-        if self._size == 0:
-            return []
+    def _query(self, query_vector: Sequence[float]) -> np.ndarray:
         q = _normalize(np.asarray(query_vector, dtype=np.float32))
         if q.shape[0] != self._embedding_dim:
             raise ValueError(
                 f"query vector dimension {q.shape[0]} does not match embedding_dim {self._embedding_dim}"
             )
-        scores = self._matrix[: self._size] @ q
+        return q
+
+    def search(self, query_vector: Sequence[float], top_k: int) -> list[tuple[str, float]]:
+        if self._size == 0:
+            return []
+        q = self._query(query_vector)
         top_k = max(1, min(top_k, self._size))
+        shortlist = top_k * self.int8_oversample
+        if simsimd is not None and self._size >= self.int8_min_rows and shortlist < self._size:
+            # Coarse int8 scan, then exact float32 re-rank of the oversampled shortlist.
+            q_int8, _ = _quantize_int8(q)
+            coarse = np.asarray(simsimd.cdist(q_int8[None, :], self._int8[: self._size], metric="dot"))[0]
+            coarse *= self._int8_scales[: self._size]
+            rows = np.argpartition(-coarse, shortlist - 1)[:shortlist]
+            return self._rank_rows(rows, q, top_k)
+        scores = self._matrix[: self._size] @ q
         idx = np.argpartition(-scores, top_k - 1)[:top_k]
         ordered = idx[np.argsort(-scores[idx])]
         return [(self._ids[int(i)], float(scores[int(i)])) for i in ordered]
 
+    def _rank_rows(self, rows: np.ndarray, q: np.ndarray, top_k: int) -> list[tuple[str, float]]:
+        scores = self._matrix[rows] @ q
+        idx = np.argpartition(-scores, top_k - 1)[:top_k]
+        ordered = idx[np.argsort(-scores[idx])]
+        return [(self._ids[int(rows[i])], float(scores[i])) for i in ordered]
+
+    def search_subset(
+        self, query_vector: Sequence[float], thought_ids: Sequence[str], top_k: int
+    ) -> list[tuple[str, float]]:
+        return _subset_top_k(self._matrix, self._id_to_idx, self._query(query_vector), thought_ids, top_k)
+
+    def search_batch(self, query_matrix: np.ndarray, top_k: int) -> list[list[tuple[str, float]]]:
+        if self._size == 0:
+            return [[] for _ in range(len(query_matrix))]
+        if query_matrix.shape[1] != self._embedding_dim:
+            raise ValueError(
+                f"query vector dimension {query_matrix.shape[1]} does not match embedding_dim {self._embedding_dim}"
+            )
+        top_k = max(1, min(top_k, self._size))
+        # One GEMM for all queries instead of a mat-vec per query.
+        scores = _normalize_rows(query_matrix) @ self._matrix[: self._size].T
+        idx = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+        top_scores = np.take_along_axis(scores, idx, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        idx = np.take_along_axis(idx, order, axis=1).tolist()
+        top_scores = np.take_along_axis(top_scores, order, axis=1).tolist()
+        ids = self._ids
+        return [[(ids[i], s) for i, s in zip(row_idx, row_scores)] for row_idx, row_scores in zip(idx, top_scores)]
+
 
 class _FaissVectorBackend(_VectorBackend):
     name = "faiss"
+    supports_upsert = True
+    supports_subset_search = True
 
     def __init__(self, embedding_dim: int) -> None:
         try:
@@ -149,12 +319,22 @@ class _FaissVectorBackend(_VectorBackend):
         self._faiss = faiss
         self._embedding_dim = embedding_dim
         self._ids: list[str] = []
-        self._index = faiss.IndexFlatIP(embedding_dim)
+        self._id_to_idx: dict[str, int] = {}
+        self._size = 0
+        # C-contiguous float32 rows mirror the index so updates can re-add without re-reading SQLite.
+        self._matrix = np.zeros((0, embedding_dim), dtype=np.float32)
+        self._index = self._new_index()
+
+    def _new_index(self):
+        return self._faiss.IndexFlatIP(self._embedding_dim)
 
     def build(self, items: list[tuple[str, list[float]]]) -> None:
         self._ids = [item[0] for item in items]
+        self._id_to_idx = {thought_id: idx for idx, thought_id in enumerate(self._ids)}
         self._index.reset()
         if not items:
+            self._size = 0
+            self._matrix = np.zeros((0, self._embedding_dim), dtype=np.float32)
             return
         mat = np.asarray([item[1] for item in items], dtype=np.float32)
         if mat.shape[1] != self._embedding_dim:
@@ -163,11 +343,57 @@ class _FaissVectorBackend(_VectorBackend):
             )
         norms = np.linalg.norm(mat, axis=1, keepdims=True)
         norms[norms == 0] = 1.0
-        self._index.add(mat / norms)
+        mat /= norms
+        self._size = mat.shape[0]
+        self._matrix = np.ascontiguousarray(mat)
+        self._index.add(self._matrix)
 
     def upsert(self, thought_id: str, vector: Sequence[float]) -> None:
-        # Flat faiss index does not support update by id; rebuild is required.
-        raise NotImplementedError
+        vec = _normalize(np.asarray(vector, dtype=np.float32))
+        if vec.shape[0] != self._embedding_dim:
+            raise ValueError(
+                f"Vector dimension mismatch while upserting faiss index. expected={self._embedding_dim}, got={vec.shape[0]}"
+            )
+        existing = self._id_to_idx.get(thought_id)
+        if existing is not None:
+            # Faiss indexes have no in-place update; re-add from the mirrored rows.
+            self._matrix[existing] = vec
+            self._index.reset()
+            self._index.add(self._matrix[: self._size])
+            return
+        self._reserve(self._size + 1)
+        self._matrix[self._size] = vec
+        self._index.add(self._matrix[self._size : self._size + 1])
+        self._id_to_idx[thought_id] = self._size
+        self._ids.append(thought_id)
+        self._size += 1
+
+    def upsert_many(self, items: Sequence[tuple[str, Sequence[float]]]) -> None:
+        if len(items) < 2 or not _all_new_ids(self._id_to_idx, items):
+            super().upsert_many(items)
+            return
+        normalized = _normalize_rows(np.asarray([item[1] for item in items], dtype=np.float32))
+        if normalized.shape[1] != self._embedding_dim:
+            raise ValueError(
+                f"Vector dimension mismatch while upserting faiss index. expected={self._embedding_dim}, got={normalized.shape[1]}"
+            )
+        start, end = self._size, self._size + normalized.shape[0]
+        self._reserve(end)
+        self._matrix[start:end] = normalized
+        self._index.add(self._matrix[start:end])
+        for offset, (thought_id, _) in enumerate(items):
+            self._id_to_idx[thought_id] = start + offset
+            self._ids.append(thought_id)
+        self._size = end
+
+    def _reserve(self, rows: int) -> None:
+        if rows > self._matrix.shape[0]:
+            new_capacity = max(16, self._matrix.shape[0] * 2)
+            while new_capacity < rows:
+                new_capacity *= 2
+            grown = np.empty((new_capacity, self._embedding_dim), dtype=np.float32)
+            grown[: self._size] = self._matrix[: self._size]
+            self._matrix = grown
 
     def search(self, query_vector: Sequence[float], top_k: int) -> list[tuple[str, float]]:
         if self._index.ntotal == 0:
@@ -186,6 +412,140 @@ class _FaissVectorBackend(_VectorBackend):
             out.append((self._ids[int(i)], float(score)))
         return out
 
+    def search_subset(
+        self, query_vector: Sequence[float], thought_ids: Sequence[str], top_k: int
+    ) -> list[tuple[str, float]]:
+        q = _normalize(np.asarray(query_vector, dtype=np.float32))
+        if q.shape[0] != self._embedding_dim:
+            raise ValueError(
+                f"query vector dimension {q.shape[0]} does not match embedding_dim {self._embedding_dim}"
+            )
+        # Score straight from the mirrored rows; the flat index has no id-subset search.
+        return _subset_top_k(self._matrix, self._id_to_idx, q, thought_ids, top_k)
+
+    def search_batch(self, query_matrix: np.ndarray, top_k: int) -> list[list[tuple[str, float]]]:
+        if self._index.ntotal == 0:
+            return [[] for _ in range(len(query_matrix))]
+        if query_matrix.shape[1] != self._embedding_dim:
+            raise ValueError(
+                f"query vector dimension {query_matrix.shape[1]} does not match embedding_dim {self._embedding_dim}"
+            )
+        top_k = max(1, min(top_k, self._index.ntotal))
+        scores, indices = self._index.search(np.ascontiguousarray(_normalize_rows(query_matrix)), top_k)
+        ids = self._ids
+        return [
+            [(ids[i], s) for i, s in zip(row_idx, row_scores) if i >= 0]
+            for row_idx, row_scores in zip(indices.tolist(), scores.tolist())
+        ]
+
+
+class _FaissHnswVectorBackend(_FaissVectorBackend):
+    """Approximate graph index (faiss HNSW); sub-linear search for large stores."""
+
+    name = "hnsw"
+    hnsw_m = 32
+    ef_construction = 80
+    ef_search = 64
+
+    def _new_index(self):
+        index = self._faiss.IndexHNSWFlat(self._embedding_dim, self.hnsw_m, self._faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = self.ef_construction
+        return index
+
+    def search(self, query_vector: Sequence[float], top_k: int) -> list[tuple[str, float]]:
+        self._index.hnsw.efSearch = max(self.ef_search, top_k)
+        return super().search(query_vector, top_k)
+
+    def search_batch(self, query_matrix: np.ndarray, top_k: int) -> list[list[tuple[str, float]]]:
+        self._index.hnsw.efSearch = max(self.ef_search, top_k)
+        return super().search_batch(query_matrix, top_k)
+
+
+class _SqliteVecVectorBackend(_VectorBackend):
+    name = "sqlite-vec"
+    supports_upsert = True
+
+    def __init__(self, conn: sqlite3.Connection, embedding_dim: int) -> None:
+        try:
+            import sqlite_vec  # type: ignore
+        except Exception as exc:  # pragma: no cover - optional import
+            raise RuntimeError("sqlite-vec is not installed") from exc
+        try:
+            conn.enable_load_extension(True)
+            sqlite_vec.load(conn)
+            conn.enable_load_extension(False)
+        except Exception as exc:  # pragma: no cover - depends on sqlite build
+            raise RuntimeError("sqlite-vec extension could not be loaded") from exc
+        self._conn = conn
+        self._embedding_dim = embedding_dim
+        conn.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS thought_vec USING vec0(
+                thought_id TEXT PRIMARY KEY,
+                embedding float[{embedding_dim}] distance_metric=cosine
+            )
+            """
+        )
+        conn.commit()
+
+    def _check_dim(self, vec: np.ndarray, action: str) -> None:
+        if vec.shape[0] != self._embedding_dim:
+            raise ValueError(
+                f"Vector dimension mismatch while {action} sqlite-vec index. expected={self._embedding_dim}, got={vec.shape[0]}"
+            )
+
+    def build(self, items: list[tuple[str, list[float]]]) -> None:
+        rows = []
+        for thought_id, vector in items:
+            vec = _normalize(np.asarray(vector, dtype=np.float32))
+            self._check_dim(vec, "building")
+            rows.append((thought_id, vec.tobytes()))
+        self._conn.execute("DELETE FROM thought_vec")
+        self._conn.executemany("INSERT INTO thought_vec (thought_id, embedding) VALUES (?, ?)", rows)
+        self._conn.commit()
+
+    def upsert(self, thought_id: str, vector: Sequence[float]) -> None:
+        vec = _normalize(np.asarray(vector, dtype=np.float32))
+        self._check_dim(vec, "upserting")
+        # vec0 tables have no ON CONFLICT support; replace by delete + insert.
+        self._conn.execute("DELETE FROM thought_vec WHERE thought_id = ?", (thought_id,))
+        self._conn.execute(
+            "INSERT INTO thought_vec (thought_id, embedding) VALUES (?, ?)",
+            (thought_id, vec.tobytes()),
+        )
+        self._conn.commit()
+
+    def upsert_many(self, items: Sequence[tuple[str, Sequence[float]]]) -> None:
+        if len({item[0] for item in items}) != len(items):
+            super().upsert_many(items)
+            return
+        rows = []
+        for thought_id, vector in items:
+            vec = _normalize(np.asarray(vector, dtype=np.float32))
+            self._check_dim(vec, "upserting")
+            rows.append((thought_id, vec.tobytes()))
+        self._conn.executemany("DELETE FROM thought_vec WHERE thought_id = ?", [(row[0],) for row in rows])
+        self._conn.executemany("INSERT INTO thought_vec (thought_id, embedding) VALUES (?, ?)", rows)
+        self._conn.commit()
+
+    def search(self, query_vector: Sequence[float], top_k: int) -> list[tuple[str, float]]:
+        q = _normalize(np.asarray(query_vector, dtype=np.float32))
+        if q.shape[0] != self._embedding_dim:
+            raise ValueError(
+                f"query vector dimension {q.shape[0]} does not match embedding_dim {self._embedding_dim}"
+            )
+        rows = self._conn.execute(
+            """
+            SELECT thought_id, distance
+            FROM thought_vec
+            WHERE embedding MATCH ? AND k = ?
+            ORDER BY distance
+            """,
+            (q.tobytes(), max(1, top_k)),
+        ).fetchall()
+        # Cosine distance -> cosine similarity, matching the other backends.
+        return [(str(row["thought_id"]), 1.0 - float(row["distance"])) for row in rows]
+
 
 class ThoughtStore:
     """SQLite-backed, thread-safe thought store with hybrid semantic retrieval."""
@@ -196,6 +556,7 @@ class ThoughtStore:
         *,
         embedding_dim: int = 384,
         vector_backend: str = "auto",
+        read_pool_size: int = 0,
     ) -> None:
         if embedding_dim <= 0:
             raise ValueError("embedding_dim must be positive")
@@ -203,20 +564,52 @@ class ThoughtStore:
         self.db_path = ":memory:" if db_path is None else str(db_path)
         if self.db_path != ":memory:":
             Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
+        self._conn = self._connect()
         self._lock = threading.RLock()
 
         self._vector_backend = self._resolve_vector_backend(vector_backend)
         self._init_schema()
         self._rebuild_vector_index_locked()
 
+        # Read-only connections let lookups run concurrently with the writer (file-backed stores only).
+        self._read_conns: list[sqlite3.Connection] = []
+        self._read_pool: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        if self.db_path != ":memory:":
+            for _ in range(max(0, read_pool_size)):
+                conn = self._connect()
+                conn.execute("PRAGMA query_only=ON")
+                self._read_conns.append(conn)
+                self._read_pool.put(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        if self.db_path != ":memory:":
+            for pragma in _FILE_PRAGMAS:
+                conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled read connection, or the shared one under the lock when there is no pool."""
+        if not self._read_conns:
+            with self._lock:
+                yield self._conn
+            return
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
     @property
     def vector_backend_name(self) -> str:
         return self._vector_backend.name
 
     def close(self) -> None:
         with self._lock:
+            for conn in self._read_conns:
+                conn.close()
             self._conn.close()
 
     def __enter__(self) -> "ThoughtStore":
@@ -227,14 +620,22 @@ class ThoughtStore:
 
     def _resolve_vector_backend(self, requested: str) -> _VectorBackend:
         key = requested.lower().strip()
-        if key not in {"auto", "numpy", "faiss"}:
-            raise ValueError("vector_backend must be one of: auto, numpy, faiss")
+        if key not in {"auto", "numpy", "faiss", "hnsw", "sqlite-vec"}:
+            raise ValueError("vector_backend must be one of: auto, numpy, faiss, hnsw, sqlite-vec")
+        if key == "hnsw":
+            return _FaissHnswVectorBackend(self.embedding_dim)
         if key in {"auto", "faiss"}:
             try:
                 return _FaissVectorBackend(self.embedding_dim)
             except Exception:
                 if key == "faiss":
                     raise
+        if key in {"auto", "sqlite-vec"}:
+            try:
+                return _SqliteVecVectorBackend(self._conn, self.embedding_dim)
+            except Exception:
+                if key == "sqlite-vec":
+                    raise
         return _NumpyVectorBackend(self.embedding_dim)
 
     def _init_schema(self) -> None:
@@ -311,8 +712,8 @@ class ThoughtStore:
             self._conn.commit()
 
     def get_session_parent(self, session_id: str) -> str | None:
-        with self._lock:
-            row = self._conn.execute(
+        with self._reader() as conn:
+            row = conn.execute(
                 "SELECT parent_session_id FROM sessions WHERE session_id = ?",
                 (session_id,),
             ).fetchone()
@@ -323,15 +724,31 @@ class ThoughtStore:
 
     def get_session_lineage(self, session_id: str, *, include_self: bool = True) -> list[str]:
         """Return ancestor chain for session (self -> parent -> ...)."""
+        # One recursive query instead of a parent lookup per ancestor. Depth is capped at the
+        # session count + 1 so a parent cycle terminates; the walk below stops at the first repeat.
+        with self._reader() as conn:
+            rows = conn.execute(
+                """
+                WITH RECURSIVE chain(session_id, depth) AS (
+                    SELECT ?, 0
+                    UNION ALL
+                    SELECT s.parent_session_id, chain.depth + 1
+                    FROM chain JOIN sessions s ON s.session_id = chain.session_id
+                    WHERE s.parent_session_id IS NOT NULL
+                      AND chain.depth <= (SELECT COUNT(*) FROM sessions)
+                )
+                SELECT session_id FROM chain ORDER BY depth
+                """,
+                (session_id,),
+            ).fetchall()
+        chain = [str(row["session_id"]) for row in rows]
         lineage: list[str] = []
-        current = session_id if include_self else self.get_session_parent(session_id)
         visited: set[str] = set()
-        while current:
-            if current in visited:
+        for current in chain if include_self else chain[1:]:
+            if not current or current in visited:
                 break
             visited.add(current)
             lineage.append(current)
-            current = self.get_session_parent(current)
         return lineage
 
     def _rebuild_vector_index_locked(self) -> None:
@@ -357,60 +774,68 @@ class ThoughtStore:
                 raise ValueError(
                     f"Thought embedding_dim={thought.embedding_dim} does not match store embedding_dim={self.embedding_dim}"
                 )
+        # Build every parameter row up front so the transaction is two executemany calls.
+        created_at = _dt_to_iso(_utc_now())
+        session_rows = [
+            (session_id, created_at, "{}") for session_id in dict.fromkeys(t.session_id for t in thoughts_list)
+        ]
+        thought_rows = [
+            (
+                thought.id,
+                _dt_to_iso(thought.timestamp_utc),
+                thought.session_id,
+                thought.category,
+                float(thought.confidence),
+                json.dumps(thought.tags),
+                thought.raw_text,
+                thought.cleaned_text,
+                int(thought.embedding_dim),
+                _vector_to_blob(thought.embedding_vector),
+                # The vector lives in embedding_blob; keeping it out of the JSON payload avoids a float repr per dim.
+                thought.model_dump_json(exclude={"embedding_vector"}),
+            )
+            for thought in thoughts_list
+        ]
 
         with self._lock:
             cur = self._conn.cursor()
             try:
                 cur.execute("BEGIN")
-                for thought in thoughts_list:
-                    self._conn.execute(
-                        """
-                        INSERT INTO sessions (session_id, parent_session_id, created_at_utc, metadata_json)
-                        VALUES (?, NULL, ?, ?)
-                        ON CONFLICT(session_id) DO NOTHING
-                        """,
-                        (thought.session_id, _dt_to_iso(_utc_now()), json.dumps({})),
-                    )
-                    cur.execute(
-                        """
-                        INSERT INTO thoughts (
-                            id, timestamp_utc, session_id, category, confidence, tags_json,
-                            raw_text, cleaned_text, embedding_dim, embedding_blob, payload_json
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ON CONFLICT(id) DO UPDATE SET
-                            timestamp_utc=excluded.timestamp_utc,
-                            session_id=excluded.session_id,
-                            category=excluded.category,
-                            confidence=excluded.confidence,
-                            tags_json=excluded.tags_json,
-                            raw_text=excluded.raw_text,
-                            cleaned_text=excluded.cleaned_text,
-                            embedding_dim=excluded.embedding_dim,
-                            embedding_blob=excluded.embedding_blob,
-                            payload_json=excluded.payload_json
-                        """,
-                        (
-                            thought.id,
-                            _dt_to_iso(thought.timestamp_utc),
-                            thought.session_id,
-                            thought.category,
-                            float(thought.confidence),
-                            json.dumps(thought.tags),
-                            thought.raw_text,
-                            thought.cleaned_text,
-                            int(thought.embedding_dim),
-                            _vector_to_blob(thought.embedding_vector),
-                            thought.model_dump_json(),
-                        ),
-                    )
+                cur.executemany(
+                    """
+                    INSERT INTO sessions (session_id, parent_session_id, created_at_utc, metadata_json)
+                    VALUES (?, NULL, ?, ?)
+                    ON CONFLICT(session_id) DO NOTHING
+                    """,
+                    session_rows,
+                )
+                cur.executemany(
+                    """
+                    INSERT INTO thoughts (
+                        id, timestamp_utc, session_id, category, confidence, tags_json,
+                        raw_text, cleaned_text, embedding_dim, embedding_blob, payload_json
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        timestamp_utc=excluded.timestamp_utc,
+                        session_id=excluded.session_id,
+                        category=excluded.category,
+                        confidence=excluded.confidence,
+                        tags_json=excluded.tags_json,
+                        raw_text=excluded.raw_text,
+                        cleaned_text=excluded.cleaned_text,
+                        embedding_dim=excluded.embedding_dim,
+                        embedding_blob=excluded.embedding_blob,
+                        payload_json=excluded.payload_json
+                    """,
+                    thought_rows,
+                )
                 self._conn.commit()
             except Exception:
                 self._conn.rollback()
                 raise
 
-            if isinstance(self._vector_backend, _NumpyVectorBackend):
-                for thought in thoughts_list:
-                    self._vector_backend.upsert(thought.id, thought.embedding_vector)
+            if self._vector_backend.supports_upsert:
+                self._vector_backend.upsert_many([(t.id, t.embedding_vector) for t in thoughts_list])
             else:
                 self._rebuild_vector_index_locked()
         return thoughts_list
@@ -423,8 +848,8 @@ class ThoughtStore:
     ) -> list[Thought]:
         """Retrieve thoughts by metadata filters (no semantic ranking)."""
         filters = filters or ThoughtFilters()
-        with self._lock:
-            rows = self._query_rows_locked(filters=filters, limit=limit)
+        with self._reader() as conn:
+            rows = self._query_rows_locked(filters=filters, limit=limit, conn=conn)
         return [self._row_to_thought(row) for row in rows]
 
     def semantic_search(
@@ -440,43 +865,70 @@ class ThoughtStore:
         if not (0.0 <= alpha <= 1.0):
             raise ValueError("alpha must be in [0.0, 1.0]")
         filters = filters or ThoughtFilters()
+        top_k = max(limit * 10, min(max_candidates, 1000))
         with self._lock:
-            candidates = self._vector_backend.search(query_vector, top_k=max(limit * 10, min(max_candidates, 1000)))
-            if not candidates:
-                return []
-            id_to_score = {thought_id: score for thought_id, score in candidates}
-            ids = list(id_to_score.keys())
-            rows = self._fetch_rows_by_ids_locked(ids)
-
-        filtered_rows = [row for row in rows if self._row_matches_filters(row, filters)]
-        if not filtered_rows:
+            subset_ids = self._prefilter_ids_locked(filters, top_k)
+            if subset_ids is None:
+                candidates = self._vector_backend.search(query_vector, top_k=top_k)
+            else:
+                candidates = self._vector_backend.search_subset(query_vector, subset_ids, top_k)
+        if not candidates:
             return []
+        id_to_score = {thought_id: score for thought_id, score in candidates}
+        with self._reader() as conn:
+            rows = self._fetch_rows_by_ids_locked(list(id_to_score), conn=conn)
 
-        now = _utc_now()
-        max_age = 1.0
-        ages: list[float] = []
-        for row in filtered_rows:
-            age = max(0.0, (now - _iso_to_dt(str(row["timestamp_utc"]))).total_seconds())
-            ages.append(age)
-            max_age = max(max_age, age)
-
-        scored: list[ScoredThought] = []
-        for row, age in zip(filtered_rows, ages):
-            thought_id = str(row["id"])
-            semantic_score = float(id_to_score.get(thought_id, -1.0))
-            recency_score = 1.0 - (age / max_age)
-            score = alpha * semantic_score + (1.0 - alpha) * recency_score
-            scored.append(
-                ScoredThought(
-                    thought=self._row_to_thought(row),
-                    semantic_score=semantic_score,
-                    recency_score=recency_score,
-                    score=score,
-                )
-            )
+        rows = [row for row in rows if self._row_matches_filters(row, filters)]
+        if not rows:
+            return []
+        semantic = np.fromiter((id_to_score[str(row["id"])] for row in rows), dtype=np.float64, count=len(rows))
+        return self._rank_hits(rows, semantic, self._ages_seconds(rows, _utc_now()), alpha=alpha, limit=limit)
 
-        scored.sort(key=lambda item: item.score, reverse=True)
-        return scored[: max(1, limit)]
+    def semantic_search_batch(
+        self,
+        query_vectors: np.ndarray | Sequence[Sequence[float]],
+        *,
+        filters: ThoughtFilters | None = None,
+        limit: int = 10,
+        alpha: float = 0.9,
+        max_candidates: int = 500,
+    ) -> list[list[ScoredThought]]:
+        """semantic_search for many queries: one backend call and one row fetch for the whole batch."""
+        if not (0.0 <= alpha <= 1.0):
+            raise ValueError("alpha must be in [0.0, 1.0]")
+        filters = filters or ThoughtFilters()
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        if queries.size == 0:
+            return []
+        if queries.ndim != 2:
+            raise ValueError("query_vectors must be a 2-D array of shape (n_queries, embedding_dim)")
+        top_k = max(limit * 10, min(max_candidates, 1000))
+        with self._lock:
+            subset_ids = self._prefilter_ids_locked(filters, top_k)
+            if subset_ids is None:
+                candidate_lists = self._vector_backend.search_batch(queries, top_k)
+            else:
+                candidate_lists = [self._vector_backend.search_subset(q, subset_ids, top_k) for q in queries]
+        ids = list(dict.fromkeys(thought_id for candidates in candidate_lists for thought_id, _ in candidates))
+        with self._reader() as conn:
+            rows = self._fetch_rows_by_ids_locked(ids, conn=conn)
+
+        rows = [row for row in rows if self._row_matches_filters(row, filters)]
+        ages = self._ages_seconds(rows, _utc_now())
+        matched = {str(row["id"]): idx for idx, row in enumerate(rows)}
+        out: list[list[ScoredThought]] = []
+        for candidates in candidate_lists:
+            hit_idx = [matched[thought_id] for thought_id, _ in candidates if thought_id in matched]
+            if not hit_idx:
+                out.append([])
+                continue
+            semantic = np.fromiter(
+                (score for thought_id, score in candidates if thought_id in matched), dtype=np.float64, count=len(hit_idx)
+            )
+            out.append(
+                self._rank_hits([rows[i] for i in hit_idx], semantic, ages[hit_idx], alpha=alpha, limit=limit)
+            )
+        return out
 
     def recall_from_prior_sessions(
         self,
@@ -500,14 +952,17 @@ class ThoughtStore:
             return semantic[:limit]
 
         expanded: dict[str, ScoredThought] = {item.thought.id: item for item in semantic}
-        for item in list(semantic[:5]):
-            neighbors = graph.neighbors(item.thought.id, hops=graph_hops, limit=25)
+        seeds = [(item, graph.neighbors(item.thought.id, hops=graph_hops, limit=25)) for item in semantic[:5]]
+        # One chunked IN query for every neighbor instead of a lookup per id; only lineage rows are decoded.
+        wanted = list(dict.fromkeys(n_id for _, neighbors in seeds for n_id in neighbors if n_id not in expanded))
+        with self._reader() as conn:
+            rows = self._fetch_rows_by_ids_locked(wanted, conn=conn)
+        lineage_rows = {str(row["id"]): row for row in rows if str(row["session_id"]) in lineage_set}
+        for item, neighbors in seeds:
             for n_id in neighbors:
-                if n_id in expanded:
-                    continue
-                thought = self.get_thought_by_id(n_id)
-                if thought is None or thought.session_id not in lineage_set:
+                if n_id in expanded or n_id not in lineage_rows:
                     continue
+                thought = self._row_to_thought(lineage_rows[n_id])
                 expanded[n_id] = ScoredThought(
                     thought=thought,
                     semantic_score=item.semantic_score * 0.85,
@@ -519,8 +974,8 @@ class ThoughtStore:
         return out[:limit]
 
     def get_thought_by_id(self, thought_id: str) -> Thought | None:
-        with self._lock:
-            row = self._conn.execute("SELECT * FROM thoughts WHERE id = ?", (thought_id,)).fetchone()
+        with self._reader() as conn:
+            row = conn.execute("SELECT * FROM thoughts WHERE id = ?", (thought_id,)).fetchone()
         if row is None:
             return None
         return self._row_to_thought(row)
@@ -552,6 +1007,24 @@ class ThoughtStore:
             max_candidates=max_candidates,
         )
 
+    async def asemantic_search_batch(
+        self,
+        query_vectors: np.ndarray | Sequence[Sequence[float]],
+        *,
+        filters: ThoughtFilters | None = None,
+        limit: int = 10,
+        alpha: float = 0.9,
+        max_candidates: int = 500,
+    ) -> list[list[ScoredThought]]:
+        return await asyncio.to_thread(
+            self.semantic_search_batch,
+            query_vectors,
+            filters=filters,
+            limit=limit,
+            alpha=alpha,
+            max_candidates=max_candidates,
+        )
+
     async def arecall_from_prior_sessions(
         self,
         query_vector: Sequence[float],
@@ -572,7 +1045,63 @@ class ThoughtStore:
             graph_hops=graph_hops,
         )
 
-    def _query_rows_locked(self, *, filters: ThoughtFilters, limit: int) -> list[sqlite3.Row]:
+    def _prefilter_ids_locked(self, filters: ThoughtFilters, top_k: int) -> list[str] | None:
+        """Ids passing the indexed filter columns, to score exactly; None when the filter is not selective."""
+        if not self._vector_backend.supports_subset_search:
+            return None
+        clauses, params = self._filter_clauses(filters)
+        if not params:
+            return None
+        rows = self._conn.execute(
+            f"SELECT id FROM thoughts WHERE {' AND '.join(clauses)} LIMIT ?",
+            [*params, top_k + 1],
+        ).fetchall()
+        if len(rows) > top_k:
+            return None
+        return [str(row["id"]) for row in rows]
+
+    @staticmethod
+    def _ages_seconds(rows: Sequence[sqlite3.Row], now: datetime) -> np.ndarray:
+        """Non-negative age in seconds per row; UTC stamps written by this store parse in one numpy call."""
+        stamps = [str(row["timestamp_utc"]) for row in rows]
+        if all(stamp.endswith("+00:00") for stamp in stamps):
+            parsed = np.array([stamp[:-6] for stamp in stamps], dtype="datetime64[us]")
+            now_us = np.datetime64(now.replace(tzinfo=None), "us")
+            # Integer microseconds / 1e6: the same double timedelta.total_seconds() returns.
+            ages = (now_us - parsed).astype(np.int64) / 1e6
+        else:
+            ages = np.array([(now - _iso_to_dt(stamp)).total_seconds() for stamp in stamps], dtype=np.float64)
+        return np.maximum(ages, 0.0)
+
+    def _rank_hits(
+        self,
+        rows: Sequence[sqlite3.Row],
+        semantic: np.ndarray,
+        ages: np.ndarray,
+        *,
+        alpha: float,
+        limit: int,
+    ) -> list[ScoredThought]:
+        """Blend semantic scores with a recency prior over all hits at once; only the top `limit` are decoded."""
+        if not rows:
+            return []
+        max_age = max(1.0, float(ages.max()))
+        recency = 1.0 - ages / max_age
+        scores = alpha * semantic + (1.0 - alpha) * recency
+        # Stable sort on the negated score keeps input order among ties, like list.sort(reverse=True).
+        top = np.argsort(-scores, kind="stable")[: max(1, limit)].tolist()
+        return [
+            ScoredThought(
+                thought=self._row_to_thought(rows[i]),
+                semantic_score=float(semantic[i]),
+                recency_score=float(recency[i]),
+                score=float(scores[i]),
+            )
+            for i in top
+        ]
+
+    @staticmethod
+    def _filter_clauses(filters: ThoughtFilters) -> tuple[list[str], list[object]]:
         clauses = ["1=1"]
         params: list[object] = []
 
@@ -591,20 +1120,36 @@ class ThoughtStore:
         if filters.end_time_utc is not None:
             clauses.append("timestamp_utc <= ?")
             params.append(_dt_to_iso(filters.end_time_utc))
-
+        if filters.tags_any and _SQLITE_HAS_JSON1:
+            # Evaluated by SQLite alongside the other predicates, so LIMIT counts only tag matches.
+            tags = list(dict.fromkeys(filters.tags_any))
+            placeholders = ",".join("?" for _ in tags)
+            clauses.append(f"EXISTS (SELECT 1 FROM json_each(tags_json) WHERE json_each.value IN ({placeholders}))")
+            params.extend(tags)
+        return clauses, params
+
+    def _query_rows_locked(
+        self, *, filters: ThoughtFilters, limit: int, conn: sqlite3.Connection | None = None
+    ) -> list[sqlite3.Row]:
+        clauses, params = self._filter_clauses(filters)
         sql = f"SELECT * FROM thoughts WHERE {' AND '.join(clauses)} ORDER BY timestamp_utc DESC LIMIT ?"
         params.append(max(1, limit))
-        rows = self._conn.execute(sql, params).fetchall()
-        if filters.tags_any:
+        rows = (conn or self._conn).execute(sql, params).fetchall()
+        if filters.tags_any and not _SQLITE_HAS_JSON1:
             tags_filter = set(filters.tags_any)
             rows = [row for row in rows if tags_filter.intersection(set(json.loads(row["tags_json"])))]
         return rows
 
-    def _fetch_rows_by_ids_locked(self, ids: list[str]) -> list[sqlite3.Row]:
-        if not ids:
-            return []
-        placeholders = ",".join("?" for _ in ids)
-        rows = self._conn.execute(f"SELECT * FROM thoughts WHERE id IN ({placeholders})", ids).fetchall()
+    def _fetch_rows_by_ids_locked(
+        self, ids: list[str], conn: sqlite3.Connection | None = None
+    ) -> list[sqlite3.Row]:
+        conn = conn or self._conn
+        rows: list[sqlite3.Row] = []
+        # Chunked to stay under SQLite's bound-parameter limit (999 on older builds).
+        for start in range(0, len(ids), 900):
+            chunk = ids[start : start + 900]
+            placeholders = ",".join("?" for _ in chunk)
+            rows.extend(conn.execute(f"SELECT * FROM thoughts WHERE id IN ({placeholders})", chunk).fetchall())
         return rows
 
     def _row_matches_filters(self, row: sqlite3.Row, filters: ThoughtFilters) -> bool:
@@ -614,11 +1159,12 @@ class ThoughtStore:
             return False
         if filters.min_confidence is not None and float(row["confidence"]) < float(filters.min_confidence):
             return False
-        row_dt = _iso_to_dt(str(row["timestamp_utc"]))
-        if filters.start_time_utc is not None and row_dt < _to_utc(filters.start_time_utc):
-            return False
-        if filters.end_time_utc is not None and row_dt > _to_utc(filters.end_time_utc):
-            return False
+        if filters.start_time_utc is not None or filters.end_time_utc is not None:
+            row_dt = _iso_to_dt(str(row["timestamp_utc"]))
+            if filters.start_time_utc is not None and row_dt < _to_utc(filters.start_time_utc):
+                return False
+            if filters.end_time_utc is not None and row_dt > _to_utc(filters.end_time_utc):
+                return False
         if filters.tags_any:
             tags = set(json.loads(row["tags_json"]))
             if not tags.intersection(set(filters.tags_any)):